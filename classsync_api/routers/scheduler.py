@@ -5,7 +5,7 @@ Timetable generation and scheduling endpoints.
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy.orm import joinedload
 
 from classsync_api.database import get_db
@@ -58,23 +58,33 @@ def validate_dataset_integrity(db: Session, institution_id: int) -> Dict[str, An
     if not section_rows:
         errors.append("No active sections found. Please upload a course dataset first.")
     else:
-        # Check sections have valid teachers
-        sections_without_teachers = []
+        # Resolve each section's teacher (section teacher, else course teacher)
+        teacher_ids_to_check = []
         for row in section_rows:
-            has_teacher = False
             teacher_id_to_check = None
 
             if hasattr(row, 'section_teacher_id') and row.section_teacher_id:
-                 teacher_id_to_check = row.section_teacher_id
+                teacher_id_to_check = row.section_teacher_id
             elif hasattr(row, 'course_teacher_id') and row.course_teacher_id:
                 teacher_id_to_check = row.course_teacher_id
 
-            if teacher_id_to_check:
-                teacher = db.query(Teacher).filter(
-                    Teacher.id == teacher_id_to_check,
+            teacher_ids_to_check.append(teacher_id_to_check)
+
+        # Fetch which of those teachers are active in one query
+        active_teacher_ids = set()
+        candidate_ids = {tid for tid in teacher_ids_to_check if tid}
+        if candidate_ids:
+            active_teacher_ids = {
+                teacher_id for (teacher_id,) in db.query(Teacher.id).filter(
+                    Teacher.id.in_(candidate_ids),
                     Teacher.is_deleted == False
-                ).first()
-                has_teacher = teacher is not None
+                )
+            }
+
+        # Check sections have valid teachers
+        sections_without_teachers = []
+        for row, teacher_id_to_check in zip(section_rows, teacher_ids_to_check):
+            has_teacher = teacher_id_to_check in active_teacher_ids
 
             if not has_teacher:
                 course_code = row.course_code if hasattr(row, 'course_code') else 'Unknown'
@@ -414,11 +424,12 @@ async def download_diagnostics(
         Timetable.institution_id == 1
     ).order_by(Timetable.created_at.desc()).limit(5).all()
 
-    # Build report
+    # Build report (one clock read shared by the header and the filename)
+    now = datetime.now(timezone.utc)
     report = []
     report.append("=" * 50)
     report.append(f"CLASSSYNC AI - SYSTEM DIAGNOSTICS REPORT")
-    report.append(f"Generated: {datetime.utcnow().isoformat()}")
+    report.append(f"Generated: {now.isoformat()}")
     report.append("=" * 50)
     report.append("\n[DATABASE STATE]")
     report.append(f"Active Teachers: {state['summary']['active_teachers']}")
@@ -448,7 +459,7 @@ async def download_diagnostics(
     return StreamingResponse(
         stream,
         media_type="text/plain",
-        headers={"Content-Disposition": f"attachment; filename=classsync_diagnostics_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.txt"}
+        headers={"Content-Disposition": f"attachment; filename=classsync_diagnostics_{now:%Y%m%d_%H%M%S}.txt"}
     )
 
 
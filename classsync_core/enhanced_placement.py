@@ -13,17 +13,28 @@ import random
 from typing import List, Tuple, Dict, Any
 from collections import defaultdict
 
+from classsync_core.utils import WEEKDAY_INDEX
+
 
 class EnhancedPlacer:
     """
     Enhanced placement with proper constraint enforcement.
     """
 
+    # Output schedule columns, built column-wise as lists during placement
+    SCHEDULE_COLUMNS = (
+        'Session_Key', 'Section_ID', 'Course_ID', 'Teacher_ID', 'Course_Code',
+        'Course_Name', 'Instructor', 'Section', 'Room', 'Weekday', 'Day_Index',
+        'Start_Time', 'End_Time', 'Duration_Slots', 'Session_Number', 'Is_Lab'
+    )
+
     def __init__(self, working_days: List[str], slot_duration_minutes: int):
         self.working_days = working_days
+        self.day_index = {day: WEEKDAY_INDEX.get(day, 0) for day in working_days}
         self.slot_duration_minutes = slot_duration_minutes
         self.forced_log = []
         self.missed_sessions = []
+        self._next_free = defaultdict(int)
 
     def place_schedule(
         self,
@@ -42,13 +53,17 @@ class EnhancedPlacer:
         Returns:
             Schedule DataFrame
         """
-        schedule = []
+        schedule = {column: [] for column in self.SCHEDULE_COLUMNS}
 
         # Conflict tracking - THESE ARE ALL HARD CONSTRAINTS
         teacher_schedule = defaultdict(lambda: defaultdict(list))  # teacher -> day -> [(start, end)]
         room_schedule = defaultdict(lambda: defaultdict(list))     # room -> day -> [(start, end)]
         section_schedule = defaultdict(lambda: defaultdict(list))  # section -> day -> [(start, end)]
 
+        # Earliest-free slot pointers: (kind, resource, day) -> slot index before
+        # which that resource is fully booked, so scans can start past it
+        self._next_free = defaultdict(int)
+
         # Track sessions per day for even distribution
         day_counts = {day: 0 for day in self.working_days}
 
@@ -57,13 +72,15 @@ class EnhancedPlacer:
         theory_rooms = rooms_df[rooms_df['Room_Type'].str.lower() == 'lecture_hall']['Room_Code'].tolist()
         all_rooms = rooms_df['Room_Code'].tolist()
 
-        # Prioritize harder sessions (labs first)
+        # Prioritize harder sessions (labs first, then longer sessions)
         sessions_df = sessions_df.copy()
         sessions_df['Priority'] = sessions_df['Is_Lab'].apply(lambda x: 100 if x else 50)
-        sessions_df = sessions_df.sort_values('Priority', ascending=False)
+        sessions_df = sessions_df.sort_values(
+            ['Priority', 'Duration_Minutes'], ascending=[False, False], kind='stable'
+        )
 
         # STRATEGY: Try to place each session, prefer days with fewer sessions
-        for _, session in sessions_df.iterrows():
+        for session in sessions_df.to_dict('records'):
             placed = self._try_place_with_distribution(
                 session, slots, lab_rooms, theory_rooms, all_rooms,
                 teacher_schedule, room_schedule, section_schedule,
@@ -109,8 +126,14 @@ class EnhancedPlacer:
             # Get slots for this day
             day_slots = [s for s in slots if s[0] == day]
 
+            # Slots before either pointer clash with the teacher or section
+            first_slot = max(
+                self._next_free['teacher', instructor, day],
+                self._next_free['section', section_code, day]
+            )
+
             # Try each possible consecutive slot combination
-            for i in range(len(day_slots) - duration_slots + 1):
+            for i in range(first_slot, len(day_slots) - duration_slots + 1):
                 consecutive = day_slots[i:i + duration_slots]
                 start_time = consecutive[0][1]
                 end_time = consecutive[-1][2]
@@ -119,6 +142,9 @@ class EnhancedPlacer:
                 random.shuffle(available_rooms)  # Randomize for diversity
 
                 for room in available_rooms:
+                    if self._next_free['room', room, day] > i:
+                        continue
+
                     # CHECK ALL THREE HARD CONSTRAINTS
                     if self._has_any_conflict(
                         day, start_time, end_time,
@@ -133,6 +159,12 @@ class EnhancedPlacer:
                         teacher_schedule, room_schedule, section_schedule, schedule
                     )
 
+                    # Advance pointers that this booking extends
+                    for key in (('teacher', instructor, day), ('room', room, day),
+                                ('section', section_code, day)):
+                        if self._next_free[key] == i:
+                            self._next_free[key] = i + duration_slots
+
                     # Update day count
                     day_counts[day] += 1
 
@@ -198,24 +230,15 @@ class EnhancedPlacer:
         instructor = session['Instructor']
         section_code = session['Section_Code']
 
-        # Add to schedule
-        schedule.append({
-            'Session_Key': session['Session_Key'],
-            'Section_ID': session['Section_ID'],
-            'Course_ID': session['Course_ID'],
-            'Teacher_ID': session['Teacher_ID'],
-            'Course_Code': session['Course_Code'],
-            'Course_Name': session['Course_Name'],
-            'Instructor': instructor,
-            'Section': section_code,
-            'Room': room,
-            'Weekday': day,
-            'Start_Time': start_time,
-            'End_Time': end_time,
-            'Duration_Slots': duration_slots,
-            'Session_Number': session['Session_Number'],
-            'Is_Lab': session['Is_Lab']
-        })
+        # Add to schedule (one value per column)
+        row = (
+            session['Session_Key'], session['Section_ID'], session['Course_ID'],
+            session['Teacher_ID'], session['Course_Code'], session['Course_Name'],
+            instructor, section_code, room, day, self.day_index[day], start_time, end_time,
+            duration_slots, session['Session_Number'], session['Is_Lab']
+        )
+        for column, value in zip(self.SCHEDULE_COLUMNS, row):
+            schedule[column].append(value)
 
         # Update all trackers (HARD CONSTRAINTS)
         teacher_schedule[instructor][day].append((start_time, end_time))
@@ -37,10 +37,7 @@ class CSVExporter(BaseExporter):
 
         if view_type == 'master':
             # Sort by day and time
-            day_order = {'Monday': 0, 'Tuesday': 1, 'Wednesday': 2, 'Thursday': 3,
-                         'Friday': 4, 'Saturday': 5, 'Sunday': 6}
-            df['Day_Order'] = df['Weekday'].map(day_order)
-            df = df.sort_values(['Day_Order', 'Start_Time']).drop('Day_Order', axis=1)
+            df = df.sort_values(['Day_Index', 'Start_Time']).drop('Day_Index', axis=1)
 
             # Save to CSV
             df.to_csv(output_path, index=False)
@@ -62,17 +59,10 @@ class CSVExporter(BaseExporter):
         base_dir = os.path.splitext(output_path)[0]
         os.makedirs(base_dir, exist_ok=True)
 
-        groups = df[group_by].unique()
-
-        for group in sorted(groups):
-            group_df = df[df[group_by] == group]
-
-            # Sort by day and time
-            day_order = {'Monday': 0, 'Tuesday': 1, 'Wednesday': 2, 'Thursday': 3,
-                         'Friday': 4, 'Saturday': 5, 'Sunday': 6}
-            group_df['Day_Order'] = group_df['Weekday'].map(day_order)
-            group_df = group_df.sort_values(['Day_Order', 'Start_Time']).drop('Day_Order', axis=1)
+        # Sort by day and time once; each group keeps this order
+        df = df.sort_values(['Day_Index', 'Start_Time']).drop('Day_Index', axis=1)
 
+        for group, group_df in df.groupby(group_by, sort=True):
             # Sanitize filename
             safe_name = str(group).replace('/', '_').replace('\\', '_').replace(' ', '_')
             file_path = os.path.join(base_dir, f"{safe_name}.csv")
@@ -7,6 +7,7 @@ import os
 from typing import Dict, Any, List
 
 from classsync_core.exports import BaseExporter
+from classsync_core.utils import WEEKDAYS
 
 
 class JSONExporter(BaseExporter):
@@ -37,8 +38,8 @@ class JSONExporter(BaseExporter):
         os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
 
         if format_type == 'flat':
-            # Simple flat array of entries
-            data = df.to_dict(orient='records')
+            # Simple flat array of entries (Day_Index is internal, for sorting and grouping)
+            data = df.drop('Day_Index', axis=1).to_dict(orient='records')
         else:
             # Structured format (grouped by day)
             data = self._create_structured_format(df)
@@ -52,8 +53,6 @@ class JSONExporter(BaseExporter):
     def _create_structured_format(self, df) -> Dict[str, Any]:
         """Create structured JSON format grouped by days."""
 
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-
         result = {
             'metadata': {
                 'semester': df['Semester'].iloc[0] if not df.empty else None,
@@ -63,13 +62,12 @@ class JSONExporter(BaseExporter):
             'schedule': {}
         }
 
-        for day in days:
-            day_df = df[df['Weekday'] == day].sort_values('Start_Time')
-
-            if day_df.empty:
+        # One pass over the integer day column instead of a string filter per day
+        for day_index, day_df in df.sort_values('Start_Time').groupby('Day_Index', sort=True):
+            if not 0 <= day_index < len(WEEKDAYS):
                 continue
 
-            result['schedule'][day] = [
+            result['schedule'][WEEKDAYS[day_index]] = [
                 {
                     'time': f"{row['Start_Time']} - {row['End_Time']}",
                     'course': {
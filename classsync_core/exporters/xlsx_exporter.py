@@ -10,6 +10,7 @@ from typing import Dict, Any, Optional
 import os
 
 from classsync_core.exports import BaseExporter
+from classsync_core.utils import WEEKDAYS, WEEKDAY_INDEX, parse_time, time_to_minutes
 
 
 from classsync_core.models import ConstraintConfig, Room
@@ -79,14 +80,11 @@ class XLSXExporter(BaseExporter):
         ws.title = "Master Timetable"
 
         # Group by day for better visualization
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-
         row = 1
-        for day in days:
-            day_df = df[df['Weekday'] == day].sort_values('Start_Time')
-
-            if day_df.empty:
+        for day_index, day_df in df.sort_values('Start_Time').groupby('Day_Index', sort=True):
+            if not 0 <= day_index < len(WEEKDAYS):
                 continue
+            day = WEEKDAYS[day_index]
 
             # Day header
             ws.merge_cells(f'A{row}:I{row}')
@@ -220,12 +218,10 @@ class XLSXExporter(BaseExporter):
                 return output_path
 
             # 3. Generate all possible slots (30 min increments)
-            from classsync_core.utils import parse_time, time_to_minutes
-
             start_min = time_to_minutes(parse_time(start_time_str))
             end_min = time_to_minutes(parse_time(end_time_str))
 
-            days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+            days = list(WEEKDAYS[:5])
 
             # 4. Identify occupied slots from timetable data
             # Map: (Room, Day, Minute) -> Occupied
@@ -294,8 +290,7 @@ class XLSXExporter(BaseExporter):
                 cell.border = self.border
 
             # 8. Sort and write rows
-            day_order = {d: i for i, d in enumerate(days)}
-            free_df['Day_Order'] = free_df['Day'].map(day_order)
+            free_df['Day_Order'] = free_df['Day'].map(WEEKDAY_INDEX)
             free_df = free_df.sort_values(['Day_Order', 'Time', 'Room'])
 
             row = 2
@@ -409,13 +404,10 @@ class XLSXExporter(BaseExporter):
         cell.alignment = Alignment(horizontal='center')
 
         row = 3
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-
-        for day in days:
-            day_df = df[df['Weekday'] == day].sort_values('Start_Time')
-
-            if day_df.empty:
+        for day_index, day_df in df.sort_values('Start_Time').groupby('Day_Index', sort=True):
+            if not 0 <= day_index < len(WEEKDAYS):
                 continue
+            day = WEEKDAYS[day_index]
 
             # Day header
             ws.merge_cells(f'A{row}:F{row}')
@@ -11,6 +11,7 @@ from datetime import datetime
 import os
 
 from classsync_core.models import Timetable, TimetableEntry, Course, Teacher, Room, Section
+from classsync_core.utils import WEEKDAYS, parse_time, time_to_minutes
 
 
 class BaseExporter(ABC):
@@ -69,7 +70,6 @@ class BaseExporter(ABC):
 
         # Build DataFrame with full details
         data = []
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 
         for entry in entries:
             # Use eager-loaded relationships (already loaded via joinedload)
@@ -118,7 +118,8 @@ class BaseExporter(ABC):
                 'Room': room_code,
                 'Room_Type': room_type,
                 'Building': building,
-                'Weekday': day_names[entry.day_of_week] if 0 <= entry.day_of_week < len(day_names) else 'Unknown',
+                'Weekday': WEEKDAYS[entry.day_of_week] if 0 <= entry.day_of_week < len(WEEKDAYS) else 'Unknown',
+                'Day_Index': entry.day_of_week,
                 'Start_Time': entry.start_time,
                 'End_Time': entry.end_time,
                 'Duration_Minutes': self._calculate_duration(entry.start_time, entry.end_time),
@@ -130,8 +131,6 @@ class BaseExporter(ABC):
 
     def _calculate_duration(self, start_time: str, end_time: str) -> int:
         """Calculate duration in minutes between two times."""
-        from classsync_core.utils import parse_time, time_to_minutes
-
         start_min = time_to_minutes(parse_time(start_time))
         end_min = time_to_minutes(parse_time(end_time))
 
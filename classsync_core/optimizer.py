@@ -3,17 +3,42 @@ Timetable Optimizer - Strategy wrapper for multiple scheduling algorithms.
 Supports: GA (genetic algorithm), Heuristic, Hybrid.
 """
 
+import copy
+import numpy as np
 import pandas as pd
 import time
 import logging
-from typing import Dict, Any, Optional
-from sqlalchemy.orm import Session
-
-from classsync_core.scheduler import GAEngine, GAConfig, DEFAULT_GA_CONFIG
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from typing import Dict, Any, Optional, Tuple
+from sqlalchemy import Engine, event, insert, select, func
+from sqlalchemy.orm import Session, aliased
+
+from classsync_core.scheduler import GAEngine, GAConfig, Chromosome, DEFAULT_GA_CONFIG
 from classsync_core.scheduler.validator import PreGAValidator, ValidationResult
 from classsync_core.models import (
     Timetable, TimetableEntry, Course, Teacher, Room, Section, ConstraintConfig, TimetableStatus, CourseType
 )
+from classsync_core.utils import WEEKDAY_INDEX, time_to_minutes
+
+logger = logging.getLogger(__name__)
+
+# Session.info key set while a session has flushed writes that are not yet
+# committed (other connections cannot see them)
+_UNCOMMITTED_FLUSH = 'classsync_uncommitted_flush'
+
+
+@event.listens_for(Session, 'after_flush')
+def _mark_uncommitted_flush(session: Session, flush_context):
+    session.info[_UNCOMMITTED_FLUSH] = True
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _clear_uncommitted_flush(session: Session, transaction):
+    # Only the outermost transaction's commit or rollback settles the writes
+    if transaction.parent is None:
+        session.info.pop(_UNCOMMITTED_FLUSH, None)
 
 
 class ValidationFailedError(Exception):
@@ -33,6 +58,21 @@ class TimetableOptimizer:
     - 'hybrid': GA seeded with heuristic
     """
 
+    # Rows per multi-row INSERT, keeps each statement under driver parameter limits
+    INSERT_CHUNK_SIZE = 500
+
+    # Rows fetched per round trip when streaming input queries
+    QUERY_BATCH_SIZE = 1000
+
+    # Entries kept in each per-process cache below, least recently used evicted first
+    CACHE_SIZE = 16
+
+    # Built GAConfigs per ConstraintConfig id: id -> (updated_at, institution_id, config)
+    _ga_config_cache: 'OrderedDict[int, tuple]' = OrderedDict()
+
+    # Prepared input frames per institution: id -> (data version, sessions_df, rooms_df)
+    _input_cache: 'OrderedDict[int, tuple]' = OrderedDict()
+
     def __init__(self, constraint_config: ConstraintConfig, strategy: str = 'ga'):
         """
         Initialize optimizer with constraint configuration.
@@ -45,12 +85,73 @@ class TimetableOptimizer:
         self.strategy = strategy
 
         # Convert ConstraintConfig to GAConfig
-        self.ga_config = self._build_ga_config(constraint_config)
+        self.ga_config = self._cached_ga_config(constraint_config)
+
+        # Soft-constraint weights by constraint name, read once from the config
+        self.soft_weights = {
+            config_field.name[len('weight_'):]: getattr(self.ga_config, config_field.name)
+            for config_field in fields(self.ga_config)
+            if config_field.name.startswith('weight_')
+        }
+
+    def _cached_ga_config(self, cc: ConstraintConfig) -> GAConfig:
+        """
+        GAConfig for a ConstraintConfig, rebuilt only when the row changes.
+
+        The optimizer is created per request, so the conversion is memoized on
+        (id, updated_at). Callers get their own deep copy (list and dict
+        fields included), so adjusting it in any way does not leak into the
+        cached config or later runs.
+        """
+        if cc.id is None:
+            return self._build_ga_config(cc)
+
+        cached = self._cache_get(self._ga_config_cache, cc.id)
+        if cached is not None and cached[0] == cc.updated_at:
+            return copy.deepcopy(cached[2])
+
+        config = self._build_ga_config(cc)
+        self._cache_put(self._ga_config_cache, cc.id, (cc.updated_at, cc.institution_id, config))
+        return copy.deepcopy(config)
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: int) -> Optional[tuple]:
+        """Look up a cache entry, marking it as most recently used."""
+        entry = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+        return entry
+
+    @classmethod
+    def _cache_put(cls, cache: OrderedDict, key: int, entry: tuple):
+        """Store a cache entry, evicting the least recently used ones beyond CACHE_SIZE."""
+        cache[key] = entry
+        cache.move_to_end(key)
+        while len(cache) > cls.CACHE_SIZE:
+            cache.popitem(last=False)
+
+    @classmethod
+    def invalidate_caches(cls, institution_id: Optional[int] = None):
+        """
+        Drop cached GAConfigs and input frames.
+
+        Args:
+            institution_id: Only drop this institution's entries (all if None)
+        """
+        if institution_id is None:
+            cls._ga_config_cache.clear()
+            cls._input_cache.clear()
+            return
+
+        cls._input_cache.pop(institution_id, None)
+        for config_id in [
+            config_id for config_id, entry in cls._ga_config_cache.items()
+            if entry[1] == institution_id
+        ]:
+            del cls._ga_config_cache[config_id]
 
     def _build_ga_config(self, cc: ConstraintConfig) -> GAConfig:
         """Convert database ConstraintConfig to GAConfig."""
-        from classsync_core.utils import calculate_slot_end_time, time_to_minutes
-
         # Start with defaults
         config = GAConfig()
 
@@ -61,16 +162,12 @@ class TimetableOptimizer:
         config.slot_duration_minutes = cc.timeslot_duration_minutes
 
         # Calculate allowed start times based on slot duration
-        allowed_starts = []
-        current_time = cc.start_time
-        day_end_minutes = time_to_minutes(cc.end_time)
-        
-        while time_to_minutes(current_time) < day_end_minutes:
-            allowed_starts.append(current_time)
-            # Move to next slot
-            current_time = calculate_slot_end_time(current_time, cc.timeslot_duration_minutes)
-        
-        config.allowed_start_times = allowed_starts
+        start_minutes = np.arange(
+            time_to_minutes(cc.start_time),
+            time_to_minutes(cc.end_time),
+            cc.timeslot_duration_minutes
+        )
+        config.allowed_start_times = [f"{m // 60:02d}:{m % 60:02d}" for m in start_minutes.tolist()]
 
         # Parse blocked windows from JSON if present
         if cc.optional_constraints and isinstance(cc.optional_constraints, dict):
@@ -126,7 +223,9 @@ class TimetableOptimizer:
         room_constraints: Optional[list] = None,
         locked_assignments: Optional[list] = None,
         progress_callback: Optional[callable] = None,
-        random_seed: Optional[int] = None
+        random_seed: Optional[int] = None,
+        num_workers: Optional[int] = None,
+        include_explanation: bool = True
     ) -> Dict[str, Any]:
         """
         Generate optimized timetable.
@@ -141,26 +240,28 @@ class TimetableOptimizer:
             locked_assignments: Pre-scheduled sessions to respect
             progress_callback: Optional progress update function
             random_seed: Optional seed for reproducible generation
+            num_workers: Fitness evaluation processes (defaults to config.max_workers)
+            include_explanation: Build the 'explanation' block; callers that only
+                need the timetable ID and score can skip it
 
         Returns:
             Dictionary with timetable results
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # 1. Fetch data from database
-        sessions_df = self._prepare_sessions_data(db, institution_id)
-        rooms_df = self._prepare_rooms_data(db, institution_id)
+        sessions_df, rooms_df = self._load_input_data(db, institution_id)
 
-        print(f"[Optimizer] Loaded {len(sessions_df)} sessions and {len(rooms_df)} rooms")
+        logger.info("Loaded %d sessions and %d rooms", len(sessions_df), len(rooms_df))
         if teacher_constraints:
-            print(f"[Optimizer] Teacher constraints: {len(teacher_constraints)}")
+            logger.info("Teacher constraints: %d", len(teacher_constraints))
         if room_constraints:
-            print(f"[Optimizer] Room constraints: {len(room_constraints)}")
+            logger.info("Room constraints: %d", len(room_constraints))
         if locked_assignments:
-            print(f"[Optimizer] Locked assignments: {len(locked_assignments)}")
+            logger.info("Locked assignments: %d", len(locked_assignments))
 
         # 2. Pre-GA Validation (fail fast)
-        print("[Optimizer] Running pre-GA validation...")
+        logger.info("Running pre-GA validation...")
         validator = PreGAValidator(
             config=self.ga_config,
             sessions_df=sessions_df,
@@ -172,66 +273,107 @@ class TimetableOptimizer:
         validation_result = validator.validate()
 
         if not validation_result.is_valid:
-            print(f"[Optimizer] Validation FAILED with {len(validation_result.errors)} errors")
+            logger.error("Validation FAILED with %d errors", len(validation_result.errors))
             for error in validation_result.errors:
-                print(f"  - {error.error_type}: {error.message}")
+                logger.error("  - %s: %s", error.error_type, error.message)
             raise ValidationFailedError(validation_result)
 
         if validation_result.warnings:
-            print(f"[Optimizer] Validation passed with {len(validation_result.warnings)} warnings")
+            logger.warning("Validation passed with %d warnings", len(validation_result.warnings))
             for warning in validation_result.warnings:
-                print(f"  - {warning.error_type}: {warning.message}")
+                logger.warning("  - %s: %s", warning.error_type, warning.message)
 
         # 3. Run appropriate strategy
         if self.strategy == 'ga':
             result = self._run_ga(
                 sessions_df, rooms_df, population_size, generations,
                 teacher_constraints, room_constraints, locked_assignments,
-                progress_callback, random_seed
+                progress_callback, random_seed, num_workers
             )
         elif self.strategy == 'heuristic':
             result = self._run_heuristic(sessions_df, rooms_df)
         elif self.strategy == 'hybrid':
             result = self._run_hybrid(
-                sessions_df, rooms_df, population_size, generations, progress_callback
+                sessions_df, rooms_df, population_size, generations, progress_callback,
+                num_workers
             )
         else:
             raise ValueError(f"Unknown strategy: {self.strategy}")
 
-        # 4. Save to database
+        # 4. Save to database (generation time is measured once and reported as saved)
+        generation_time = time.perf_counter() - start_time
         timetable_id = self._save_to_database(
             db=db,
             institution_id=institution_id,
             result=result,
-            generation_time=time.time() - start_time
+            generation_time=generation_time
         )
 
-        # 5. Build explainable output
+        # 5. Return summary, with the explainable output unless opted out
         best_chromosome = result['best_chromosome']
+        summary = {
+            'timetable_id': timetable_id,
+            'generation_time': generation_time,
+            'sessions_scheduled': len(best_chromosome.genes),
+            'sessions_total': len(sessions_df),
+            'fitness_score': result['best_fitness'],
+            'is_feasible': result['is_feasible'],
+            'strategy': self.strategy,
+
+            # Legacy fields
+            'hard_violations': best_chromosome.hard_violations or {},
+            'soft_scores': best_chromosome.soft_scores or {}
+        }
+
+        if include_explanation:
+            summary['explanation'] = self._build_explanation(
+                best_chromosome, result['best_fitness']
+            )
 
+        return summary
+
+    def _build_explanation(self, best_chromosome: Chromosome, best_fitness: float) -> Dict[str, Any]:
+        """
+        Explainable output for a generated timetable: hard constraint status,
+        violated soft constraints, fitness breakdown and locked slots.
+        """
         # Collect locked slots
-        locked_slots = []
-        for gene in best_chromosome.genes:
-            if gene.is_locked:
-                locked_slots.append({
-                    'session_key': gene.session_key,
-                    'course_code': gene.course_code,
-                    'section_code': gene.section_code,
-                    'day': gene.day,
-                    'start_time': gene.start_time,
-                    'end_time': gene.end_time,
-                    'room_code': gene.room_code,
-                    'lock_type': gene.lock_type
-                })
+        locked_slots = [
+            {
+                'session_key': gene.session_key,
+                'course_code': gene.course_code,
+                'section_code': gene.section_code,
+                'day': gene.day,
+                'start_time': gene.start_time,
+                'end_time': gene.end_time,
+                'room_code': gene.room_code,
+                'lock_type': gene.lock_type
+            }
+            for gene in best_chromosome.genes if gene.is_locked
+        ]
 
         # Calculate constraint summary
         soft_scores = best_chromosome.soft_scores or {}
         hard_violations = best_chromosome.hard_violations or {}
 
-        # Identify violated soft constraints (score < max weight)
+        # Weight totals in one vector op; unknown constraints count as 100 but
+        # are left out of max_possible
+        weights = np.array(
+            [self.soft_weights.get(name, np.nan) for name in soft_scores], dtype=float
+        )
+        configured = ~np.isnan(weights)
+        max_weights = np.where(configured, weights, 100.0)
+        max_possible = float(weights[configured].sum())
+        weight_total = float(max_weights.sum())
+
+        # One pass over soft scores: violations and rounded scores
         soft_constraint_violations = []
-        for constraint_name, score in soft_scores.items():
-            max_weight = getattr(self.ga_config, f'weight_{constraint_name}', 100)
+        rounded_scores = {}
+
+        for (constraint_name, score), max_weight in zip(soft_scores.items(), max_weights.tolist()):
+            rounded_scores[constraint_name] = round(score, 2)
+
+            # Identify violated soft constraints (score < max weight)
             if score < max_weight * 0.9:  # Less than 90% of max
                 penalty = max_weight - score
                 soft_constraint_violations.append({
@@ -246,47 +388,32 @@ class TimetableOptimizer:
         soft_constraint_violations.sort(key=lambda x: x['penalty'], reverse=True)
 
         # Build enforced constraints list
-        enforced_hard_constraints = []
-        for constraint_name, violation_count in hard_violations.items():
-            enforced_hard_constraints.append({
+        enforced_hard_constraints = [
+            {
                 'constraint': constraint_name,
                 'violations': violation_count,
                 'status': 'satisfied' if violation_count == 0 else 'violated'
-            })
+            }
+            for constraint_name, violation_count in hard_violations.items()
+        ]
 
         # Calculate fitness breakdown
         fitness_breakdown = {
-            'total_fitness': round(result['best_fitness'], 2),
-            'max_possible': round(sum(getattr(self.ga_config, f'weight_{k}', 0) for k in soft_scores.keys()), 2),
-            'soft_scores': {k: round(v, 2) for k, v in soft_scores.items()},
+            'total_fitness': round(best_fitness, 2),
+            'max_possible': round(max_possible, 2),
+            'soft_scores': rounded_scores,
             'fitness_percentage': round(
-                (result['best_fitness'] / sum(getattr(self.ga_config, f'weight_{k}', 100) for k in soft_scores.keys())) * 100, 1
+                (best_fitness / weight_total) * 100, 1
             ) if soft_scores else 0
         }
 
-        # 6. Return enhanced summary
         return {
-            'timetable_id': timetable_id,
-            'generation_time': time.time() - start_time,
-            'sessions_scheduled': len(best_chromosome.genes),
-            'sessions_total': len(sessions_df),
-            'fitness_score': result['best_fitness'],
-            'is_feasible': result['is_feasible'],
-            'strategy': self.strategy,
-
-            # Explainable output
-            'explanation': {
-                'hard_constraints': enforced_hard_constraints,
-                'soft_constraint_violations': soft_constraint_violations,
-                'fitness_breakdown': fitness_breakdown,
-                'locked_slots': locked_slots,
-                'locked_count': len(locked_slots),
-                'conflict_details': best_chromosome.conflict_details[:20]  # First 20 details
-            },
-
-            # Legacy fields
-            'hard_violations': hard_violations,
-            'soft_scores': soft_scores
+            'hard_constraints': enforced_hard_constraints,
+            'soft_constraint_violations': soft_constraint_violations,
+            'fitness_breakdown': fitness_breakdown,
+            'locked_slots': locked_slots,
+            'locked_count': len(locked_slots),
+            'conflict_details': best_chromosome.conflict_details[:20]  # First 20 details
         }
 
     def _run_ga(
@@ -299,7 +426,8 @@ class TimetableOptimizer:
         room_constraints: Optional[list],
         locked_assignments: Optional[list],
         progress_callback: Optional[callable],
-        random_seed: Optional[int] = None
+        random_seed: Optional[int] = None,
+        num_workers: Optional[int] = None
     ) -> Dict:
         """Run full genetic algorithm."""
 
@@ -311,7 +439,8 @@ class TimetableOptimizer:
             room_constraints=room_constraints or [],
             locked_assignments=locked_assignments or [],
             progress_callback=progress_callback,
-            random_seed=random_seed
+            random_seed=random_seed,
+            num_workers=num_workers
         )
 
         result = engine.run(
@@ -360,172 +489,230 @@ class TimetableOptimizer:
         rooms_df: pd.DataFrame,
         population_size: int,
         generations: int,
-        progress_callback: Optional[callable]
+        progress_callback: Optional[callable],
+        num_workers: Optional[int] = None
     ) -> Dict:
         """Run GA seeded with heuristic (more heuristic individuals in initial pop)."""
 
-        # Create GA engine with higher heuristic seed ratio
         engine = GAEngine(
             config=self.ga_config,
             sessions_df=sessions_df,
             rooms_df=rooms_df,
-            progress_callback=progress_callback
-        )
-
-        # Override initializer to use 50% heuristic seeding
-        engine.initializer = engine.initializer.__class__(
-            config=self.ga_config,
-            sessions_df=sessions_df,
-            rooms_df=rooms_df
+            progress_callback=progress_callback,
+            num_workers=num_workers
         )
 
-        # Modify create_population to use higher ratio
-        original_create = engine.initializer.create_population
-        def create_with_more_heuristic(pop_size, heuristic_seed_ratio=0.5):
-            return original_create(pop_size, heuristic_seed_ratio)
-
-        engine.initializer.create_population = create_with_more_heuristic
-
+        # Seed 50% of the initial population with the heuristic
         result = engine.run(
             population_size=population_size,
-            generations=generations
+            generations=generations,
+            heuristic_seed_ratio=0.5
         )
 
         return result
 
+    def _load_input_data(self, db: Session, institution_id: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Sessions and rooms DataFrames, rebuilt only when the source rows change.
+
+        Cached frames are reused while the institution's data version is
+        unchanged; callers always get copies so the cache cannot be mutated.
+        While the session holds uncommitted writes the cache is bypassed: the
+        version would count rows that may still be rolled back.
+        """
+        if self._has_uncommitted_writes(db):
+            return self._fetch_input_frames(db, institution_id)
+
+        version = self._input_data_version(db, institution_id)
+
+        cached = self._cache_get(self._input_cache, institution_id)
+        if cached is not None and cached[0] == version:
+            logger.info("Reusing prepared sessions and rooms for Institution ID: %s", institution_id)
+            return cached[1].copy(), cached[2].copy()
+
+        sessions_df, rooms_df = self._fetch_input_frames(db, institution_id)
+        self._cache_put(self._input_cache, institution_id, (version, sessions_df, rooms_df))
+
+        return sessions_df.copy(), rooms_df.copy()
+
+    def _fetch_input_frames(self, db: Session, institution_id: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Run the sessions and rooms queries concurrently.
+
+        Rooms are fetched on a worker thread with its own Session on the same
+        engine, overlapping the two database round trips. That second session
+        sees only committed rows, so the queries run concurrently only when
+        the request session has no pending or flushed-but-uncommitted writes
+        (see _has_uncommitted_writes) and is bound to an Engine; otherwise
+        both run serially on the request session.
+        """
+        bind = db.get_bind()
+        if self._has_uncommitted_writes(db) or not isinstance(bind, Engine):
+            return (
+                self._prepare_sessions_data(db, institution_id),
+                self._prepare_rooms_data(db, institution_id)
+            )
+
+        def fetch_rooms() -> pd.DataFrame:
+            with Session(bind) as rooms_db:
+                return self._prepare_rooms_data(rooms_db, institution_id)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            rooms_future = executor.submit(fetch_rooms)
+            sessions_df = self._prepare_sessions_data(db, institution_id)
+            return sessions_df, rooms_future.result()
+
+    @staticmethod
+    def _has_uncommitted_writes(db: Session) -> bool:
+        """Whether the session has pending changes or flushed writes not yet committed."""
+        return bool(db.new or db.dirty or db.deleted or db.info.get(_UNCOMMITTED_FLUSH))
+
+    @staticmethod
+    def _input_data_version(db: Session, institution_id: int) -> tuple:
+        """
+        Latest update time and row count of every table the input frames read,
+        fetched in one aggregate query. Any insert, update or (soft) delete
+        changes it.
+        """
+        columns = []
+        for model in (Course, Section, Teacher, Room):
+            scope = model.institution_id == institution_id
+            columns.append(select(func.max(model.updated_at)).where(scope).scalar_subquery())
+            columns.append(select(func.count(model.id)).where(scope).scalar_subquery())
+
+        return tuple(db.execute(select(*columns)).one())
+
     def _prepare_sessions_data(self, db: Session, institution_id: int) -> pd.DataFrame:
         """
         Fetch and prepare sessions data from database.
 
-        Expected DataFrame columns:
+        Expected DataFrame columns (dtypes in brackets):
         - Session_Key
-        - Course_ID, Course_Code, Course_Name
-        - Section_ID, Section_Code
-        - Teacher_ID, Instructor (teacher name)
-        - Duration_Minutes
-        - Is_Lab
-        - Session_Number
+        - Course_ID, Course_Code, Course_Name  [unsigned int, category, category]
+        - Section_ID, Section_Code  [unsigned int, category]
+        - Teacher_ID, Instructor (teacher name)  [unsigned int, category]
+        - Duration_Minutes  [smallest unsigned int]
+        - Is_Lab  [bool]
+        - Session_Number  [smallest unsigned int]
 
         Uses Course's teacher_id for instructor assignment.
         """
-        print(f"[Optimizer] Preparing sessions for Institution ID: {institution_id}")
-
-        # Get courses with their teachers (only active, non-deleted)
-        courses = db.query(Course).join(Teacher).filter(
+        logger.info("Preparing sessions for Institution ID: %s", institution_id)
+
+        # One row per section of an active course with an active teacher; the
+        # section teacher (if any) is outer-joined alongside the course teacher
+        SectionTeacher = aliased(Teacher)
+        rows = db.query(
+            Course.id, Course.code, Course.name, Course.course_type, Course.credit_hours,
+            Section.id, Section.code,
+            Teacher.id, Teacher.name,
+            SectionTeacher.id, SectionTeacher.name, SectionTeacher.is_deleted
+        ).select_from(Section).join(Section.course).join(Course.teacher).outerjoin(
+            SectionTeacher, Section.teacher_id == SectionTeacher.id
+        ).filter(
             Course.institution_id == institution_id,
             Course.is_deleted == False,
-            Teacher.is_deleted == False
-        ).all()
-
-        print(f"[Optimizer] Found {len(courses)} active courses with active teachers.")
-
-        valid_sections = []
-        for course in courses:
-            # Get sections for this course, eager load teacher
-            from sqlalchemy.orm import joinedload
-            course_sections = db.query(Section).options(joinedload(Section.teacher)).filter(
-                Section.course_id == course.id,
-                Section.is_deleted == False
-            ).all()
-
-            for section in course_sections:
-                # Use section teacher if available, else course teacher
-                teacher_to_use = section.teacher if (section.teacher and not section.teacher.is_deleted) else course.teacher
-                
-                if teacher_to_use and not teacher_to_use.is_deleted:
-                    valid_sections.append((section, teacher_to_use))
-                else:
-                    print(f"[Optimizer] Warning: Section {section.code} of {course.code} has no valid teacher. Skipping.")
-
-        print(f"[Optimizer] Found {len(valid_sections)} valid sections with teachers.")
-
-        sessions = []
-        lab_count = 0
-        theory_count = 0
-
-        for section, teacher in valid_sections:
-            course = section.course
-
-            # Determine session breakdown
-            # Strict lab check: explicit type OR "lab" as a distinct word in name
-            is_lab = (course.course_type == 'lab') or ('lab' in course.name.lower().split())
-
-            if is_lab:
-                # Labs: single 180-min session
-                sessions.append({
-                    'Session_Key': f"{course.code}-{section.code}-LAB-1",
-                    'Course_ID': course.id,
-                    'Course_Code': course.code,
-                    'Course_Name': course.name,
-                    'Section_ID': section.id,
-                    'Section_Code': section.code,
-                    'Teacher_ID': teacher.id,  # Use section-specific teacher
-                    'Instructor': teacher.name,  # Use section-specific teacher name
-                    'Duration_Minutes': 180,
-                    'Is_Lab': True,
-                    'Session_Number': 1
-                })
-                lab_count += 1
-            else:
-                # Theory: Multiple sessions based on credit hours
-                credit_hours = int(course.credit_hours) if course.credit_hours else 3
-
-                if credit_hours == 2:
-                    num_sessions = 1
-                    duration = 120
-                elif credit_hours == 3:
-                    num_sessions = 2
-                    duration = 90
-                else:
-                    num_sessions = credit_hours
-                    duration = 90
-
-                for i in range(num_sessions):
-                    sessions.append({
-                        'Session_Key': f"{course.code}-{section.code}-T-{i+1}",
-                        'Course_ID': course.id,
-                        'Course_Code': course.code,
-                        'Course_Name': course.name,
-                        'Section_ID': section.id,
-                        'Section_Code': section.code,
-                        'Teacher_ID': teacher.id,  # Use section-specific teacher
-                        'Instructor': teacher.name,  # Use section-specific teacher name
-                        'Duration_Minutes': duration,
-                        'Is_Lab': False,
-                        'Session_Number': i + 1
-                    })
-                    theory_count += 1
-
-        print(f"[Optimizer] Prepared {len(sessions)} total sessions (Theory: {theory_count}, Lab: {lab_count})")
-        return pd.DataFrame(sessions)
+            Teacher.is_deleted == False,
+            Section.is_deleted == False
+        ).order_by(Course.id, Section.id).yield_per(self.QUERY_BATCH_SIZE)
+
+        sections = pd.DataFrame([tuple(row) for row in rows], columns=[
+            'Course_ID', 'Course_Code', 'Course_Name', 'Course_Type', 'Credit_Hours',
+            'Section_ID', 'Section_Code', 'Course_Teacher_ID', 'Course_Teacher_Name',
+            'Section_Teacher_ID', 'Section_Teacher_Name', 'Section_Teacher_Deleted'
+        ])
+
+        logger.info("Found %d active courses with active teachers.", sections['Course_ID'].nunique())
+        logger.info("Found %d valid sections with teachers.", len(sections))
+
+        if sections.empty:
+            logger.info("Prepared 0 total sessions (Theory: 0, Lab: 0)")
+            return pd.DataFrame()
+
+        # Use section teacher if available, else course teacher (always active here)
+        use_section_teacher = sections['Section_Teacher_ID'].notna() & (sections['Section_Teacher_Deleted'] == False)
+        sections['Teacher_ID'] = sections['Section_Teacher_ID'].where(
+            use_section_teacher, sections['Course_Teacher_ID']
+        ).astype('int64')
+        sections['Instructor'] = sections['Section_Teacher_Name'].where(
+            use_section_teacher, sections['Course_Teacher_Name']
+        )
+
+        # Determine session breakdown
+        # Strict lab check: explicit type OR "lab" as a distinct word in name
+        # (whitespace-delimited, matching the previous split()-based check)
+        is_lab = (sections['Course_Type'] == 'lab') | sections['Course_Name'].str.contains(
+            r'(?i)(?:^|\s)lab(?:\s|$)', regex=True, na=False
+        )
+
+        # Labs: single 180-min session
+        # Theory: multiple sessions based on credit hours (2 -> 1x120, 3 -> 2x90, n -> nx90)
+        credit_hours = sections['Credit_Hours'].fillna(0).astype('int64').replace(0, 3)
+        num_sessions = np.select(
+            [is_lab, credit_hours == 2, credit_hours == 3], [1, 1, 2], default=credit_hours.clip(lower=0)
+        )
+        duration = np.select([is_lab, credit_hours == 2], [180, 120], default=90)
+
+        sections['Is_Lab'] = is_lab.astype(bool)
+        sections['Duration_Minutes'] = duration
+
+        # One row per session, in course/section order
+        sessions = sections.loc[sections.index.repeat(num_sessions)]
+        session_number = sessions.groupby(level=0).cumcount() + 1
+        sessions = sessions.reset_index(drop=True)
+        sessions['Session_Number'] = session_number.to_numpy()
+
+        key_prefix = sessions['Course_Code'].astype(str) + '-' + sessions['Section_Code'].astype(str)
+        sessions['Session_Key'] = key_prefix + np.where(
+            sessions['Is_Lab'], '-LAB-', '-T-'
+        ) + sessions['Session_Number'].astype(str)
+
+        sessions = sessions[[
+            'Session_Key', 'Course_ID', 'Course_Code', 'Course_Name',
+            'Section_ID', 'Section_Code', 'Teacher_ID', 'Instructor',
+            'Duration_Minutes', 'Is_Lab', 'Session_Number'
+        ]]
+
+        # Compact dtypes: repeated labels as categories, numbers downcast
+        sessions = sessions.astype({
+            'Course_Code': 'category', 'Course_Name': 'category',
+            'Section_Code': 'category', 'Instructor': 'category'
+        })
+        for column in ('Course_ID', 'Section_ID', 'Teacher_ID', 'Duration_Minutes', 'Session_Number'):
+            sessions[column] = pd.to_numeric(sessions[column], downcast='unsigned')
+
+        lab_count = int(sessions['Is_Lab'].sum())
+        theory_count = len(sessions) - lab_count
+        logger.info("Prepared %d total sessions (Theory: %d, Lab: %d)", len(sessions), theory_count, lab_count)
+        return sessions
 
     def _prepare_rooms_data(self, db: Session, institution_id: int) -> pd.DataFrame:
         """
         Fetch and prepare rooms data from database.
 
-        Expected DataFrame columns:
-        - Room_ID
+        Expected DataFrame columns (dtypes in brackets):
+        - Room_ID  [unsigned int]
         - Room_Code
-        - Room_Type ('Lab' or 'Theory')
+        - Room_Type ('Lab' or 'Theory')  [category]
         - Capacity (optional)
         """
 
-        rooms = db.query(Room).filter(
+        # Only the needed columns, streamed in batches rather than full Room entities
+        rooms = db.query(Room.id, Room.code, Room.room_type, Room.capacity).filter(
             Room.institution_id == institution_id,
             Room.is_deleted == False,  # Exclude deleted rooms
             Room.is_available == True   # Exclude unavailable rooms
-        ).all()
+        ).yield_per(self.QUERY_BATCH_SIZE)
 
-        rooms_data = []
-        for room in rooms:
-            rooms_data.append({
-                'Room_ID': room.id,
-                'Room_Code': room.code,
-                'Room_Type': room.room_type,
-                'Capacity': room.capacity if hasattr(room, 'capacity') else 50
-            })
+        # Rows are consumed straight from the result; Capacity comes from the
+        # mapped column, so no per-row attribute probing is needed
+        rooms_df = pd.DataFrame.from_records(
+            iter(rooms), columns=['Room_ID', 'Room_Code', 'Room_Type', 'Capacity']
+        )
+        rooms_df['Room_ID'] = pd.to_numeric(rooms_df['Room_ID'], downcast='unsigned')
+        rooms_df['Room_Type'] = rooms_df['Room_Type'].astype('category')
 
-        return pd.DataFrame(rooms_data)
+        return rooms_df
 
     def _constraint_config_to_dict(self) -> Dict:
         """Convert ConstraintConfig model to dictionary."""
@@ -573,31 +760,34 @@ class TimetableOptimizer:
         db.add(timetable)
         db.flush()
 
-        # Create TimetableEntry records
+        # Read the ID now; after commit the instance is expired and would reload
+        timetable_id = timetable.id
+
+        # Create TimetableEntry records with chunked multi-row INSERTs
         chromosome = result['best_chromosome']
 
-        for gene in chromosome.genes:
-            # Map day name to integer (Monday=0)
-            days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            try:
-                day_index = days.index(gene.day)
-            except (ValueError, IndexError):
-                day_index = 0
-
-            entry = TimetableEntry(
-                timetable_id=timetable.id,
-                course_id=int(gene.course_id),
-                section_id=int(gene.section_id),
-                teacher_id=int(gene.teacher_id),
-                room_id=int(gene.room_id),
-                day_of_week=day_index,
-                start_time=gene.start_time,
-                end_time=gene.end_time
-            )
-            db.add(entry)
+        entry_rows = [
+            {
+                'timetable_id': timetable_id,
+                'course_id': int(gene.course_id),
+                'section_id': int(gene.section_id),
+                'teacher_id': int(gene.teacher_id),
+                'room_id': int(gene.room_id),
+                'day_of_week': WEEKDAY_INDEX.get(gene.day, 0),  # Monday=0
+                'start_time': gene.start_time,
+                'end_time': gene.end_time
+            }
+            for gene in chromosome.genes
+        ]
+
+        # Timetable and entries commit together; nothing here needs autoflush
+        insert_stmt = insert(TimetableEntry)
+        with db.no_autoflush:
+            for offset in range(0, len(entry_rows), self.INSERT_CHUNK_SIZE):
+                db.execute(insert_stmt, entry_rows[offset:offset + self.INSERT_CHUNK_SIZE])
 
         db.commit()
 
-        print(f"[Optimizer] Saved timetable ID: {timetable.id}")
+        logger.info("Saved timetable ID: %s", timetable_id)
 
-        return timetable.id
\ No newline at end of file
+        return timetable_id
\ No newline at end of file
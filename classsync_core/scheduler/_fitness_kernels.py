@@ -0,0 +1,89 @@
+"""
+Fitness Kernels - Numeric kernels shared by the FitnessEvaluator scorers.
+
+Every kernel takes plain integer arrays (columns of the packed schedule, see
+FitnessEvaluator._pack_schedule) and loops only inside NumPy, never once per
+gene in Python.
+"""
+
+from typing import Tuple
+import numpy as np
+
+
+# Groups up to this size use the broadcast overlap matrix; larger ones sort-and-sweep
+SMALL_GROUP_SIZE = 32
+
+
+def daily_runs(
+    resource: np.ndarray,
+    day: np.ndarray,
+    day_start_order: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sort genes into (resource, day) runs, each run in start order.
+
+    Args:
+        resource: Resource code per gene
+        day: Day code per gene
+        day_start_order: Gene order sorted by (day, start), shared across resources
+
+    Returns:
+        (order, same, bounds): gene positions sorted by resource, day and
+        start; for each adjacent pair in that order, whether both rows
+        belong to the same run; and the run boundaries (len = runs + 1).
+    """
+    # Stable sort by resource on top of the day/start order keeps each
+    # resource's days together with their sessions in start order
+    order = day_start_order[np.argsort(resource[day_start_order], kind='stable')]
+    sorted_resource = resource[order]
+    sorted_day = day[order]
+
+    same = (sorted_resource[1:] == sorted_resource[:-1]) & (sorted_day[1:] == sorted_day[:-1])
+    bounds = np.concatenate(([0], np.flatnonzero(~same) + 1, [len(order)]))
+    return order, same, bounds
+
+
+def evenness(counts: np.ndarray) -> float:
+    """
+    How evenly a set of counts is spread, from 0 to 1 (1 = all equal).
+
+    One minus the coefficient of variation (standard deviation over mean,
+    from a single float64 np.var), floored at 0; 0 when the mean is 0.
+    """
+    avg = counts.mean()
+    if avg == 0:
+        return 0.0
+    return max(0.0, 1.0 - float(np.sqrt(np.var(counts, dtype=np.float64))) / float(avg))
+
+
+def overlapping_pairs(starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find every pair of overlapping intervals within one resource/day group.
+
+    Small groups evaluate ``a_start < b_end and b_start < a_end`` for all
+    pairs at once as a broadcast boolean matrix. Larger groups sort by
+    start and count, for each interval, the later-starting intervals that
+    begin before it ends.
+
+    Returns:
+        Two index arrays (i, j) with one entry per overlapping pair
+    """
+    k = len(starts)
+
+    if k <= SMALL_GROUP_SIZE:
+        overlap = (starts[:, None] < ends[None, :]) & (starts[None, :] < ends[:, None])
+        return np.nonzero(np.triu(overlap, 1))
+
+    order = np.argsort(starts, kind='stable')
+    sorted_starts = starts[order]
+    sorted_ends = ends[order]
+
+    # Intervals after position p that start before p ends overlap with it
+    first_clear = np.searchsorted(sorted_starts, sorted_ends, side='left')
+    counts = np.maximum(first_clear - np.arange(k) - 1, 0)
+
+    first = np.repeat(np.arange(k), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    second = first + 1 + offsets
+
+    return order[first], order[second]
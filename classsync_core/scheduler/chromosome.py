@@ -3,24 +3,46 @@ Chromosome - Represents one complete timetable solution.
 Each gene is a session assignment (session_id → day, start_time, room).
 """
 
-import pandas as pd
+import numpy as np
 import random
-from typing import List, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from copy import deepcopy
+from operator import attrgetter
 
+from classsync_core.utils import format_minutes, time_to_minutes
 
-@dataclass
+if TYPE_CHECKING:
+    import pandas as pd
+
+MINUTES_PER_DAY = 24 * 60
+
+# HH:MM label for every minute of the day, indexed by minutes since midnight
+_CLOCK_TIMES = tuple(format_minutes(m) for m in range(MINUTES_PER_DAY))
+
+# Bits of Gene.flags / Chromosome.session_flags
+FLAG_LAB = 1        # is_lab
+FLAG_LOCKED = 2     # is_locked
+FLAG_FULL_LOCK = 4  # lock_type == 'full_lock'
+
+
+@dataclass(slots=True)
 class Gene:
     """
     One gene = one session assignment.
 
+    Declared with __slots__: populations hold many thousands of genes, and
+    slots keep each one compact and make attribute access cheaper than a
+    per-instance __dict__.
+
     Fixed attributes (from problem definition):
     - session_key: Unique identifier
     - course_id, section_id, teacher_id: Foreign keys
     - duration_minutes: How long the session lasts
     - is_lab: Whether this is a lab session
     - session_number: Which session of the course (1, 2, 3...)
+    - session_uid: Dense integer ID (row position in sessions_df); genes in
+      every chromosome are ordered by it
 
     Mutable attributes (GA optimizes these):
     - day: Which weekday
@@ -45,6 +67,7 @@ class Gene:
     duration_minutes: int
     is_lab: bool
     session_number: int
+    session_uid: int = -1
 
     # Mutable attributes (what GA optimizes)
     day: str = None
@@ -52,9 +75,10 @@ class Gene:
     room_id: Optional[int] = None
     room_code: Optional[str] = None
 
-    # Computed attributes
-    end_time: Optional[str] = None
+    # Computed attributes (end_time is a property derived from end_minutes)
     duration_slots: int = 0  # Number of 30-min slots
+    start_minutes: int = -1  # start_time as minutes since midnight (-1 if unset)
+    end_minutes: int = -1    # end time as minutes since midnight (-1 if unset)
 
     # Lock attributes (for pre-scheduled sessions)
     is_locked: bool = False
@@ -66,24 +90,72 @@ class Gene:
     def __post_init__(self):
         """Calculate derived fields."""
         if self.start_time and self.duration_minutes:
-            from classsync_core.utils import calculate_slot_end_time
-            self.end_time = calculate_slot_end_time(
-                self.start_time, 
-                self.duration_minutes
-            )
-            self.duration_slots = self.duration_minutes // 30
+            self._set_times(self.start_time)
     
+    def _set_times(self, start_time: str):
+        """Set start time and derive slot count and minute codes."""
+        self.start_time = start_time
+        self.start_minutes = time_to_minutes(start_time)
+        # Same wrap-around as calculate_slot_end_time
+        self.end_minutes = (self.start_minutes + self.duration_minutes) % MINUTES_PER_DAY
+        self.duration_slots = self.duration_minutes // 30
+
+    @property
+    def end_time(self) -> Optional[str]:
+        """End time (HH:MM), formatted on demand; None until a start time is set."""
+        return _CLOCK_TIMES[self.end_minutes] if self.end_minutes >= 0 else None
+
+    @property
+    def flags(self) -> int:
+        """is_lab, is_locked and full-lock status packed into FLAG_* bits."""
+        return (
+            (FLAG_LAB if self.is_lab else 0)
+            | (FLAG_LOCKED if self.is_locked else 0)
+            | (FLAG_FULL_LOCK if self.lock_type == 'full_lock' else 0)
+        )
+
+    def __copy__(self) -> 'Gene':
+        """
+        Field-by-field clone that skips __init__ and __post_init__.
+
+        Derived fields are carried over rather than re-parsed from start_time.
+        Keep in step with the field list above.
+        """
+        clone = object.__new__(Gene)
+        clone.session_key = self.session_key
+        clone.course_id = self.course_id
+        clone.course_code = self.course_code
+        clone.course_name = self.course_name
+        clone.section_id = self.section_id
+        clone.section_code = self.section_code
+        clone.teacher_id = self.teacher_id
+        clone.teacher_name = self.teacher_name
+        clone.duration_minutes = self.duration_minutes
+        clone.is_lab = self.is_lab
+        clone.session_number = self.session_number
+        clone.session_uid = self.session_uid
+        clone.day = self.day
+        clone.start_time = self.start_time
+        clone.room_id = self.room_id
+        clone.room_code = self.room_code
+        clone.duration_slots = self.duration_slots
+        clone.start_minutes = self.start_minutes
+        clone.end_minutes = self.end_minutes
+        clone.is_locked = self.is_locked
+        clone.lock_type = self.lock_type
+        clone.locked_day = self.locked_day
+        clone.locked_start_time = self.locked_start_time
+        clone.locked_room_id = self.locked_room_id
+        return clone
+
+    def __deepcopy__(self, memo) -> 'Gene':
+        """Every field is an immutable scalar, so a deep copy is a flat copy."""
+        return self.__copy__()
+
     def update_time(self, day: str, start_time: str):
         """Update day and start time, recalculate end time."""
         self.day = day
-        self.start_time = start_time
-        
-        from classsync_core.utils import calculate_slot_end_time
-        self.end_time = calculate_slot_end_time(
-            start_time, 
-            self.duration_minutes
-        )
-        self.duration_slots = self.duration_minutes // 30
+        self._set_times(start_time)
     
     def update_room(self, room_id: int, room_code: str):
         """Update room assignment."""
@@ -103,16 +175,9 @@ class Gene:
         if not self.is_locked:
             return
 
-        # Always restore time for locked genes
+        # Always restore time (and recalculate end time) for locked genes
         self.day = self.locked_day
-        self.start_time = self.locked_start_time
-
-        # Recalculate end time
-        from classsync_core.utils import calculate_slot_end_time
-        self.end_time = calculate_slot_end_time(
-            self.locked_start_time,
-            self.duration_minutes
-        )
+        self._set_times(self.locked_start_time)
 
         # For full locks, also restore room
         if self.lock_type == 'full_lock' and self.locked_room_id is not None:
@@ -141,6 +206,35 @@ class Gene:
         }
 
 
+# Export column -> Gene attribute (the Gene.to_dict layout), read as one tuple
+# per gene by Chromosome.to_dataframe
+_EXPORT_FIELDS = {
+    'Session_Key': 'session_key',
+    'Course_ID': 'course_id',
+    'Course_Code': 'course_code',
+    'Course_Name': 'course_name',
+    'Section_ID': 'section_id',
+    'Section': 'section_code',
+    'Teacher_ID': 'teacher_id',
+    'Instructor': 'teacher_name',
+    'Day': 'day',
+    'Start_Time': 'start_time',
+    'End_Time': 'end_time',
+    'Room_ID': 'room_id',
+    'Room': 'room_code',
+    'Duration_Minutes': 'duration_minutes',
+    'Duration_Slots': 'duration_slots',
+    'Is_Lab': 'is_lab',
+    'Session_Number': 'session_number'
+}
+_EXPORT_COLUMNS = tuple(_EXPORT_FIELDS)
+_get_export_fields = attrgetter(*_EXPORT_FIELDS.values())
+
+# Shared result for sections with no genes
+_NO_INDICES = np.empty(0, dtype=np.int32)
+_NO_INDICES.flags.writeable = False
+
+
 class Chromosome:
     """
     Represents one complete timetable solution.
@@ -160,53 +254,124 @@ class Chromosome:
         self.soft_scores: Dict[str, float] = {}
         self.is_feasible: bool = False
         self.conflict_details: List[str] = []
+        # Per-session lookups that never change for a gene position, built on
+        # first use (see get_indices_by_section and session_flags)
+        self._section_indices: Optional[Dict[int, np.ndarray]] = None
+        self._session_flags: Optional[np.ndarray] = None
         
     def __len__(self) -> int:
         """Number of sessions in this timetable."""
         return len(self.genes)
     
     def copy(self) -> 'Chromosome':
-        """Create a deep copy of this chromosome."""
-        new_genes = [
-            Gene(
-                session_key=g.session_key,
-                course_id=g.course_id,
-                course_code=g.course_code,
-                course_name=g.course_name,
-                section_id=g.section_id,
-                section_code=g.section_code,
-                teacher_id=g.teacher_id,
-                teacher_name=g.teacher_name,
-                duration_minutes=g.duration_minutes,
-                is_lab=g.is_lab,
-                session_number=g.session_number,
-                day=g.day,
-                start_time=g.start_time,
-                room_id=g.room_id,
-                room_code=g.room_code,
-                # Copy lock attributes
-                is_locked=g.is_locked,
-                lock_type=g.lock_type,
-                locked_day=g.locked_day,
-                locked_start_time=g.locked_start_time,
-                locked_room_id=g.locked_room_id
-            )
-            for g in self.genes
-        ]
-
-        new_chromosome = Chromosome(new_genes)
+        """
+        Create a deep copy of this chromosome.
+
+        Genes are cloned field by field (see Gene.__copy__), so derived fields
+        are carried over rather than recomputed from the time strings.
+        """
+        new_chromosome = Chromosome([gene.__copy__() for gene in self.genes])
         new_chromosome.fitness = self.fitness
         new_chromosome.is_feasible = self.is_feasible
+        new_chromosome.hard_violations = dict(self.hard_violations)
+        new_chromosome.soft_scores = dict(self.soft_scores)
+        new_chromosome.conflict_details = list(self.conflict_details)
+        new_chromosome.inherit_session_lookups(self)
 
         return new_chromosome
+
+    def __deepcopy__(self, memo) -> 'Chromosome':
+        """Route copy.deepcopy to copy() instead of a recursive field walk."""
+        return self.copy()
+
+    def __getstate__(self) -> Dict:
+        """
+        Pickle without the per-session lookups.
+
+        They are derived from the genes and rebuilt on first use, so leaving
+        them out keeps process-pool payloads to the assignment itself.
+        """
+        state = self.__dict__.copy()
+        state['_section_indices'] = None
+        state['_session_flags'] = None
+        return state
+
+    def reset_evaluation(self):
+        """
+        Mark this chromosome as unevaluated after its genes changed.
+
+        Copies carry their source's evaluation so unchanged offspring are not
+        rescored; whatever edits a copy's genes must call this so only the
+        changed ones are.
+        """
+        self.fitness = None
+        self.is_feasible = False
+        self.hard_violations = {}
+        self.soft_scores = {}
+        self.conflict_details = []
+
+    def inherit_session_lookups(self, other: 'Chromosome'):
+        """
+        Share another chromosome's per-session lookups.
+
+        Only valid when both hold the same sessions in the same (canonical)
+        order, as copies and crossover children do; the lookups are
+        read-only, so sharing them is safe.
+        """
+        self._section_indices = other._section_indices
+        self._session_flags = other._session_flags
+
+    def session_flags(self) -> np.ndarray:
+        """
+        Gene.flags of every gene as a read-only uint8 array.
+
+        Lab and lock status are fixed per session, so the array is packed
+        once and shared by copies; flag scans become one AND over it, e.g.
+        ``np.flatnonzero(flags & FLAG_LOCKED)``.
+        """
+        if self._session_flags is None:
+            flags = np.fromiter((g.flags for g in self.genes), dtype=np.uint8, count=len(self.genes))
+            flags.flags.writeable = False
+            self._session_flags = flags
+        return self._session_flags
+    
+    def content_hash(self) -> int:
+        """
+        Hash of the assignment (day, start time and room of every gene).
+
+        Genes are kept in canonical session order, so chromosomes with the
+        same assignment hash equally regardless of how they were produced.
+        """
+        return hash(tuple((g.day, g.start_time, g.room_id) for g in self.genes))
     
     def get_gene_by_index(self, index: int) -> Gene:
         """Get gene at specific index."""
         return self.genes[index]
     
+    def get_indices_by_section(self, section_id: int) -> np.ndarray:
+        """
+        Positions (int32) of all genes for a specific section.
+
+        Section IDs never change once a gene is built, so the positions of
+        every section are grouped in one pass on the first call and reused.
+        """
+        if self._section_indices is None:
+            groups = defaultdict(list)
+            for i, gene in enumerate(self.genes):
+                groups[gene.section_id].append(i)
+            indices = {}
+            for sid, positions in groups.items():
+                array = np.array(positions, dtype=np.int32)
+                array.flags.writeable = False
+                indices[sid] = array
+            self._section_indices = indices
+
+        return self._section_indices.get(section_id, _NO_INDICES)
+    
     def get_genes_by_section(self, section_id: int) -> List[Gene]:
         """Get all genes for a specific section."""
-        return [g for g in self.genes if g.section_id == section_id]
+        genes = self.genes
+        return [genes[i] for i in self.get_indices_by_section(section_id).tolist()]
     
     def get_genes_by_teacher(self, teacher_id: int) -> List[Gene]:
         """Get all genes for a specific teacher."""
@@ -220,9 +385,19 @@ class Chromosome:
         """Get all genes in a specific room."""
         return [g for g in self.genes if g.room_id == room_id]
     
-    def to_dataframe(self) -> pd.DataFrame:
-        """Convert chromosome to pandas DataFrame for export."""
-        return pd.DataFrame([g.to_dict() for g in self.genes])
+    def to_dataframe(self) -> 'pd.DataFrame':
+        """
+        Convert chromosome to pandas DataFrame for export.
+
+        Rows are read as plain tuples in one attrgetter call per gene, so no
+        per-row dict is built. pandas is imported here, on first export,
+        rather than whenever the GA imports this module.
+        """
+        import pandas as pd
+
+        return pd.DataFrame.from_records(
+            [_get_export_fields(g) for g in self.genes], columns=_EXPORT_COLUMNS
+        )
     
     def to_schedule_dict(self) -> Dict:
         """
@@ -250,18 +425,20 @@ class Chromosome:
         if not self.genes:
             return {}
         
-        # Count sessions per day
-        day_counts = {}
-        for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']:
-            day_counts[day] = len(self.get_genes_by_day(day))
+        # Count sessions per day in one pass (rather than one scan per day)
+        per_day = Counter([g.day for g in self.genes])
+        day_counts = {
+            day: per_day[day]
+            for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+        }
         
         # Count lab vs theory
         lab_count = sum(1 for g in self.genes if g.is_lab)
         theory_count = len(self.genes) - lab_count
         
         # Count scheduled vs unscheduled
-        scheduled = sum(1 for g in self.genes if g.day is not None)
-        unscheduled = len(self.genes) - scheduled
+        unscheduled = per_day[None]
+        scheduled = len(self.genes) - unscheduled
         
         return {
             'total_sessions': len(self.genes),
@@ -275,8 +452,9 @@ class Chromosome:
     
     def __repr__(self) -> str:
         """String representation."""
+        fitness = f"{self.fitness:.2f}" if self.fitness is not None else 'N/A'
         return (
             f"Chromosome(sessions={len(self.genes)}, "
-            f"fitness={self.fitness:.2f if self.fitness else 'N/A'}, "
+            f"fitness={fitness}, "
             f"feasible={self.is_feasible})"
         )
@@ -3,9 +3,27 @@ GA Scheduler Configuration
 Defines hyperparameters, constraints, and time slot rules.
 """
 
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 from datetime import time
 from dataclasses import dataclass, field
+from functools import cached_property
+from classsync_core.utils import calculate_slot_end_time, time_to_minutes
+from classsync_core.scheduler.encoding import (
+    DAY_IDX, START_IDX, DEFAULT_WORKING_DAYS, DEFAULT_START_TIMES,
+    DEFAULT_DAY_START, DEFAULT_DAY_END, SLOT_MINUTES
+)
+
+
+# Fields the cached slot lookups on GAConfig are derived from
+_SLOT_SOURCE_FIELDS = frozenset({
+    'working_days', 'allowed_start_times', 'allowed_durations', 'slot_duration_minutes',
+    'blocked_windows', 'day_start_time', 'day_end_time'
+})
+_SLOT_LOOKUPS = (
+    '_allowed_start_time_set', '_allowed_duration_set', '_allowed_slots', '_blocked_masks',
+    '_day_index', '_start_time_index', '_day_start_minutes', '_day_end_minutes',
+    'n_slots_per_day', '_allowed_start_minutes'
+)
 
 
 @dataclass
@@ -27,34 +45,44 @@ class GAConfig:
     # Selection
     tournament_size: int = 5
     
+    # Island model (see GAEngine.run_islands): every migration_interval
+    # generations each island sends copies of its best migration_size
+    # chromosomes to the next island, replacing that island's worst
+    num_islands: int = 4
+    migration_interval: int = 10
+    migration_size: int = 2
+    
     # Early stopping
     max_stagnant_generations: int = 30  # Stop if no improvement
     min_acceptable_fitness: float = 850.0  # Out of 1000
     
     # Performance
     max_repair_attempts: int = 10
-    parallel_fitness_evaluation: bool = True
+    parallel_fitness_evaluation: bool = False  # Opt-in process pool (see GAEngine.run)
     max_workers: int = 4
+    # GA evaluation stops checking hard constraints once more than this many
+    # violations are found (fitness is 0 either way); None checks everything.
+    # Only ranking during evolution is cut short: the returned best chromosome
+    # is re-evaluated in full when infeasible
+    fitness_hard_cutoff: Optional[int] = 0
+    # Evaluation results remembered per distinct assignment (0 disables)
+    fitness_cache_size: int = 4096
     
     # ==================== TIME SLOT CONFIGURATION ====================
-    working_days: List[str] = field(default_factory=lambda: [
-        'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'
-    ])
+    working_days: List[str] = field(default_factory=lambda: list(DEFAULT_WORKING_DAYS))
     
     # Valid class start times (only these are allowed)
-    allowed_start_times: List[str] = field(default_factory=lambda: [
-        '08:00', '09:30', '11:00', '12:30', '14:00', '15:30', '17:00'
-    ])
+    allowed_start_times: List[str] = field(default_factory=lambda: list(DEFAULT_START_TIMES))
     
     # Valid class durations (in minutes)
     allowed_durations: List[int] = field(default_factory=lambda: [90, 120, 180])
     
     # Working hours
-    day_start_time: str = '08:00'
-    day_end_time: str = '18:30'
+    day_start_time: str = DEFAULT_DAY_START
+    day_end_time: str = DEFAULT_DAY_END
     
     # Slot granularity for internal tracking (30 min intervals)
-    slot_duration_minutes: int = 30
+    slot_duration_minutes: int = SLOT_MINUTES
     
     # ==================== BLOCKED TIME WINDOWS ====================
     # Format: {day: [(start_time, end_time), ...]}
@@ -150,45 +178,145 @@ class GAConfig:
         else:
             return self.mutation_rate_final
     
+    def __setattr__(self, name, value):
+        """Set a field, dropping cached slot lookups when one of their sources changes."""
+        super().__setattr__(name, value)
+        if name in _SLOT_SOURCE_FIELDS:
+            for lookup in _SLOT_LOOKUPS:
+                self.__dict__.pop(lookup, None)
+
+    @cached_property
+    def _blocked_masks(self) -> Dict[str, int]:
+        """
+        Blocked windows per day as a bitmask with one bit per minute of the day.
+
+        Bit m is set when minute m (from midnight) falls in a blocked window;
+        empty windows block nothing.
+        """
+        masks = {}
+        for day, windows in self.blocked_windows.items():
+            mask = 0
+            for blocked_start, blocked_end in windows:
+                start = time_to_minutes(blocked_start)
+                end = time_to_minutes(blocked_end)
+                if end > start:
+                    mask |= ((1 << (end - start)) - 1) << start
+            masks[day] = mask
+        return masks
+
+    @cached_property
+    def _allowed_start_time_set(self) -> frozenset:
+        """Allowed start times as a set for O(1) membership checks."""
+        return frozenset(self.allowed_start_times)
+
+    @cached_property
+    def _allowed_duration_set(self) -> frozenset:
+        """Allowed durations as a set for O(1) membership checks."""
+        return frozenset(self.allowed_durations)
+
+    @cached_property
+    def _allowed_slots(self) -> Tuple[Tuple[str, str, str], ...]:
+        """Every (day, start_time, end_time) slot, built once (see get_allowed_slots)."""
+        slots = []
+        for day in self.working_days:
+            for start_time in self.allowed_start_times:
+                # Calculate end based on slot_duration_minutes
+                end_time = calculate_slot_end_time(
+                    start_time, 
+                    self.slot_duration_minutes
+                )
+                slots.append((day, start_time, end_time))
+        return tuple(slots)
+
+    @cached_property
+    def _day_index(self) -> Dict[str, int]:
+        """Working day -> position in working_days (the shared DAY_IDX for default days)."""
+        if tuple(self.working_days) == DEFAULT_WORKING_DAYS:
+            return DAY_IDX
+        return {day: i for i, day in enumerate(self.working_days)}
+
+    @cached_property
+    def _start_time_index(self) -> Dict[str, int]:
+        """Allowed start time -> position in allowed_start_times (START_IDX for defaults)."""
+        if tuple(self.allowed_start_times) == DEFAULT_START_TIMES:
+            return START_IDX
+        return {start_time: i for i, start_time in enumerate(self.allowed_start_times)}
+
+    @cached_property
+    def _allowed_start_minutes(self) -> Dict[str, int]:
+        """Allowed start time -> minutes since midnight, parsed once."""
+        return {start_time: time_to_minutes(start_time) for start_time in self.allowed_start_times}
+
+    @cached_property
+    def _day_start_minutes(self) -> int:
+        """day_start_time as minutes since midnight."""
+        return time_to_minutes(self.day_start_time)
+
+    @cached_property
+    def _day_end_minutes(self) -> int:
+        """day_end_time as minutes since midnight."""
+        return time_to_minutes(self.day_end_time)
+
+    @cached_property
+    def n_slots_per_day(self) -> int:
+        """Number of slot_duration_minutes slots between day start and day end."""
+        day_minutes = self._day_end_minutes - self._day_start_minutes
+        return max(day_minutes // self.slot_duration_minutes, 0)
+
+    def slot_of(self, minutes: int) -> int:
+        """Index of the slot (from day start) containing a minutes-since-midnight time."""
+        return (minutes - self._day_start_minutes) // self.slot_duration_minutes
+
+    def day_index(self, day: str) -> int:
+        """Position of a day in working_days, or -1 if it is not a working day."""
+        return self._day_index.get(day, -1)
+
+    def start_minutes(self, start_time: str) -> int:
+        """Minutes since midnight of a start time (allowed ones are looked up, not parsed)."""
+        minutes = self._allowed_start_minutes.get(start_time)
+        return minutes if minutes is not None else time_to_minutes(start_time)
+
+    def start_time_index(self, start_time: str) -> Optional[int]:
+        """Position of a start time in allowed_start_times, or None if not allowed."""
+        return self._start_time_index.get(start_time)
+
+    def linear_slot(self, day_idx: int, start_slot: int) -> int:
+        """
+        Flatten (day index, slot index) into one cell of a weekly slot grid.
+
+        A week has len(working_days) * n_slots_per_day cells, so per-resource
+        occupancy can be kept as one flat row indexed by these IDs.
+        """
+        return day_idx * self.n_slots_per_day + start_slot
+
     def is_valid_start_time(self, time_str: str) -> bool:
         """Check if time is an allowed start time."""
-        return time_str in self.allowed_start_times
+        return time_str in self._allowed_start_time_set
     
     def is_valid_duration(self, duration_minutes: int) -> bool:
         """Check if duration is allowed."""
-        return duration_minutes in self.allowed_durations
+        return duration_minutes in self._allowed_duration_set
     
     def is_blocked(self, day: str, start_time: str, end_time: str) -> bool:
         """Check if time slot overlaps with blocked window."""
-        if day not in self.blocked_windows:
+        return self.is_blocked_minutes(day, time_to_minutes(start_time), time_to_minutes(end_time))
+
+    def is_blocked_minutes(self, day: str, start_minutes: int, end_minutes: int) -> bool:
+        """Check if [start, end) in minutes since midnight overlaps a blocked window."""
+        mask = self._blocked_masks.get(day)
+        if not mask or end_minutes <= start_minutes:
             return False
-        
-        from classsync_core.utils import slots_overlap
-        
-        for blocked_start, blocked_end in self.blocked_windows[day]:
-            if slots_overlap(start_time, end_time, blocked_start, blocked_end):
-                return True
-        
-        return False
+        return (mask >> start_minutes) & ((1 << (end_minutes - start_minutes)) - 1) != 0
     
     def get_allowed_slots(self) -> List[Tuple[str, str, str]]:
         """
         Generate all allowed time slots.
         Returns: List of (day, start_time, end_time) tuples.
+
+        The slots are computed once and rebuilt only after the days, start
+        times or slot duration are reassigned.
         """
-        from classsync_core.utils import calculate_slot_end_time
-        
-        slots = []
-        for day in self.working_days:
-            for start_time in self.allowed_start_times:
-                # Calculate end based on slot_duration_minutes
-                end_time = calculate_slot_end_time(
-                    start_time, 
-                    self.slot_duration_minutes
-                )
-                slots.append((day, start_time, end_time))
-        
-        return slots
+        return list(self._allowed_slots)
 
 
 # Default configuration instance
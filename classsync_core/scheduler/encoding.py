@@ -0,0 +1,55 @@
+"""
+Slot Encoding - Integer codes for days and start times on the default grid.
+
+The lookups are module globals so hot paths reach them with a single global
+load; GAConfig falls back to per-instance lookups only when it is given
+non-default days or start times.
+"""
+
+from typing import Dict, Tuple
+from classsync_core.utils import format_minutes, time_to_minutes
+
+
+# Default weekly grid (GAConfig's defaults are built from these)
+DEFAULT_WORKING_DAYS: Tuple[str, ...] = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday')
+DEFAULT_START_TIMES: Tuple[str, ...] = ('08:00', '09:30', '11:00', '12:30', '14:00', '15:30', '17:00')
+DEFAULT_DAY_START = '08:00'
+DEFAULT_DAY_END = '18:30'
+SLOT_MINUTES = 30
+
+_DAY_START_MINUTES = time_to_minutes(DEFAULT_DAY_START)
+
+# Slots of SLOT_MINUTES between day start and day end
+N_SLOTS_PER_DAY = (time_to_minutes(DEFAULT_DAY_END) - _DAY_START_MINUTES) // SLOT_MINUTES
+
+# Day name -> position in the working week ('Monday' -> 0)
+DAY_IDX: Dict[str, int] = {day: i for i, day in enumerate(DEFAULT_WORKING_DAYS)}
+
+# Allowed start time -> position in DEFAULT_START_TIMES ('09:30' -> 1)
+START_IDX: Dict[str, int] = {start: i for i, start in enumerate(DEFAULT_START_TIMES)}
+
+# Allowed start time -> slot from day start ('09:30' -> 3)
+SLOT_IDX: Dict[str, int] = {
+    start: (time_to_minutes(start) - _DAY_START_MINUTES) // SLOT_MINUTES
+    for start in DEFAULT_START_TIMES
+}
+
+
+def encode_day(day: str) -> int:
+    """Index of a working day, or -1 if it is not one."""
+    return DAY_IDX.get(day, -1)
+
+
+def decode_day(day_idx: int) -> str:
+    """Working day name for an index."""
+    return DEFAULT_WORKING_DAYS[day_idx]
+
+
+def encode_start(start_time: str) -> int:
+    """Slot (from day start) of an allowed start time, or -1 if it is not one."""
+    return SLOT_IDX.get(start_time, -1)
+
+
+def decode_start(slot: int) -> str:
+    """Start time (HH:MM) of a slot counted from day start."""
+    return format_minutes(_DAY_START_MINUTES + slot * SLOT_MINUTES)
@@ -4,12 +4,17 @@ Hard constraints must be satisfied (0 violations).
 Soft constraints are weighted and summed for fitness score (0-1000).
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Set
+from concurrent.futures import Executor
+from typing import Dict, List, Tuple, Set, Optional
 from collections import defaultdict
-from classsync_core.scheduler.chromosome import Chromosome, Gene
+from bisect import bisect_left
+from operator import itemgetter
+from classsync_core.scheduler.chromosome import FLAG_LAB, FLAG_LOCKED, MINUTES_PER_DAY, Chromosome, Gene
 from classsync_core.scheduler.config import GAConfig
-from classsync_core.utils import slots_overlap, time_to_minutes
+from classsync_core.scheduler._fitness_kernels import daily_runs, evenness, overlapping_pairs
+from classsync_core.utils import time_to_minutes
 
 
 class FitnessEvaluator:
@@ -21,12 +26,40 @@ class FitnessEvaluator:
     - Soft constraints: Weighted sum of penalties
     """
 
+    # Column layout of the packed per-gene schedule array (see _pack_schedule)
+    HOT_DAY, HOT_START, HOT_END, HOT_TEACHER, HOT_ROOM, HOT_SECTION, HOT_DURATION, HOT_ROOM_INDEX = range(8)
+    RESOURCE_COLUMNS = {'teacher': HOT_TEACHER, 'room': HOT_ROOM, 'section': HOT_SECTION}
+
+    # Soft constraint name -> GAConfig weight field, in scoring order
+    SOFT_WEIGHTS = {
+        'teacher_availability': 'weight_teacher_availability',
+        'room_availability': 'weight_room_availability',
+        'even_distribution': 'weight_even_distribution',
+        'minimize_student_gaps': 'weight_minimize_gaps_students',
+        'compact_schedule': 'weight_compact_schedule',
+        'minimize_teacher_gaps': 'weight_minimize_gaps_teachers',
+        'room_type_match': 'weight_room_type_match',
+        'minimize_early_classes': 'weight_minimize_early_classes',
+        'minimize_late_classes': 'weight_minimize_late_classes',
+        'minimize_building_changes': 'weight_minimize_building_changes',
+        'room_utilization': 'weight_room_utilization',
+    }
+
+    # Hard constraint names, in report order
+    HARD_CONSTRAINTS = (
+        'teacher_overlap', 'room_overlap', 'section_overlap', 'invalid_time_slots',
+        'invalid_durations', 'blocked_windows', 'lab_contiguity', 'missing_assignments',
+        'teacher_blocked_slots', 'teacher_day_offs', 'room_blocked_slots', 'room_day_offs',
+        'room_capacity', 'lock_violations'
+    )
+
     def __init__(
         self,
         config: GAConfig,
         rooms_df: pd.DataFrame,
         teacher_constraints: list = None,
-        room_constraints: list = None
+        room_constraints: list = None,
+        collect_details: bool = True
     ):
         """
         Initialize evaluator.
@@ -36,15 +69,31 @@ class FitnessEvaluator:
             rooms_df: DataFrame with room information (Room_Code, Room_Type, Capacity)
             teacher_constraints: List of teacher availability constraints
             room_constraints: List of room availability constraints
+            collect_details: Fill chromosome.conflict_details with a message
+                per violation. Violation counts are the same either way; the
+                GA turns this off and describes only its final result.
         """
         self.config = config
         self.rooms_df = rooms_df
         self.teacher_constraints = teacher_constraints or []
         self.room_constraints = room_constraints or []
+        self.collect_details = collect_details
 
         # Build constraint indexes for fast lookup
         self._build_constraint_indexes()
 
+        # Day name -> integer code for the packed schedule array
+        self.day_index = {day: i for i, day in enumerate(config.working_days)}
+
+        # (blocked masks, prefix table) built from them (see _blocked_prefix)
+        self._blocked_prefix_table = None
+
+        # (allowed start minutes, per-minute validity table) (see _valid_start_minutes)
+        self._valid_start_table = None
+
+        # Early/late class threshold -> minutes since midnight, parsed once
+        self._threshold_minutes = {}
+
         # Create room lookup dictionaries
         self.room_types = dict(zip(
             rooms_df['Room_Code'],
@@ -68,6 +117,26 @@ class FitnessEvaluator:
             building = room.split()[0] if ' ' in room else room[:2]
             self.room_buildings[room] = building
 
+        # Room code -> dense room index for the packed schedule; rooms not in
+        # rooms_df get the extra last index
+        self.room_index = {code: i for i, code in enumerate(self.room_types)}
+
+        # Per room index: whether it is a lab (1/0, -1 for unknown rooms,
+        # which room-type matching skips) and its building code (0 = no
+        # building info)
+        self.room_is_lab = np.array(
+            [int('lab' in room_type.lower()) for room_type in self.room_types.values()] + [-1],
+            dtype=np.int8
+        )
+        building_index = {'': 0}
+        self.room_building_codes = np.array(
+            [
+                building_index.setdefault(self.room_buildings[code], len(building_index))
+                for code in self.room_types
+            ] + [0],
+            dtype=np.int32
+        )
+
     def _build_constraint_indexes(self):
         """Build indexes for fast constraint lookup."""
         # Teacher constraints
@@ -107,19 +176,79 @@ class FitnessEvaluator:
                 days = rc.get('days', [rc.get('day')] if rc.get('day') else [])
                 for day in days:
                     self.room_day_offs[room_id].append((day, is_hard, weight))
+
+        # Blocked slots per (resource, day), split by hardness, for range queries
+        self.teacher_blocked_hard = self._index_blocked_windows(self.teacher_blocked_slots, hard=True)
+        self.teacher_blocked_soft = self._index_blocked_windows(self.teacher_blocked_slots, hard=False)
+        self.room_blocked_hard = self._index_blocked_windows(self.room_blocked_slots, hard=True)
+        self.room_blocked_soft = self._index_blocked_windows(self.room_blocked_slots, hard=False)
+
+    @staticmethod
+    def _index_blocked_windows(blocked_slots: Dict, hard: bool) -> Dict[Tuple, Tuple[List[int], List[tuple]]]:
+        """
+        Index hard (or soft) blocked slots by (resource_id, day).
+
+        Each value is (starts, windows): windows are (start_min, end_min,
+        position, start_time, end_time, weight) tuples sorted by start, with
+        position the slot's index in the resource's constraint list, and
+        starts their start minutes for bisecting.
+        """
+        grouped = defaultdict(list)
+        for resource_id, slots in blocked_slots.items():
+            for position, (day, start_time, end_time, is_hard, weight) in enumerate(slots):
+                if bool(is_hard) != hard or start_time is None or end_time is None:
+                    continue
+                grouped[(resource_id, day)].append((
+                    time_to_minutes(start_time), time_to_minutes(end_time),
+                    position, start_time, end_time, weight
+                ))
+
+        index = {}
+        for key, windows in grouped.items():
+            windows.sort()
+            index[key] = ([w[0] for w in windows], windows)
+        return index
+
+    @staticmethod
+    def _blocked_windows_hit(index: Dict, resource_id, gene: Gene) -> List[tuple]:
+        """
+        Indexed windows of a resource overlapping the gene's slot.
+
+        Windows starting at or after the gene's end are cut off by bisection;
+        the rest overlap when they end after it starts. Hits come back in
+        constraint-list order.
+        """
+        entry = index.get((resource_id, gene.day))
+        if entry is None:
+            return []
+
+        starts, windows = entry
+        start = gene.start_minutes
+        hits = [w for w in windows[:bisect_left(starts, gene.end_minutes)] if w[1] > start]
+        if len(hits) > 1:
+            hits.sort(key=itemgetter(2))
+        return hits
     
-    def evaluate(self, chromosome: Chromosome) -> float:
+    def evaluate(self, chromosome: Chromosome, hard_cutoff: Optional[int] = None) -> float:
         """
         Main evaluation function.
         
         Args:
             chromosome: Chromosome to evaluate
+            hard_cutoff: Stop hard-constraint checks once more than this many
+                violations are found (violation counts are then partial).
+                None runs every check.
             
         Returns:
             Fitness score (0-1000, higher is better)
         """
+        chromosome.conflict_details = []
+
+        # Pack hot numeric fields once; all sweeps below read this array
+        hot = self._pack_schedule(chromosome)
+
         # Check hard constraints first
-        hard_violations = self._check_hard_constraints(chromosome)
+        hard_violations = self._check_hard_constraints(chromosome, hot, hard_cutoff)
         
         chromosome.hard_violations = hard_violations
         chromosome.is_feasible = all(v == 0 for v in hard_violations.values())
@@ -130,7 +259,7 @@ class FitnessEvaluator:
             return 0.0
         
         # Calculate soft constraint scores
-        soft_scores = self._calculate_soft_scores(chromosome)
+        soft_scores = self._calculate_soft_scores(chromosome, hot)
         chromosome.soft_scores = soft_scores
         
         # Total fitness = sum of all soft scores
@@ -139,29 +268,119 @@ class FitnessEvaluator:
         chromosome.fitness = total_fitness
         return total_fitness
     
-    def _check_hard_constraints(self, chromosome: Chromosome) -> Dict[str, int]:
+    def evaluate_population(
+        self,
+        chromosomes: List[Chromosome],
+        hard_cutoff: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ) -> List[float]:
+        """
+        Evaluate a batch of chromosomes (see evaluate).
+
+        Args:
+            chromosomes: Chromosomes to evaluate; each is updated in place
+            hard_cutoff: Passed through to evaluate
+            executor: Optional executor to spread the batch over. Only a
+                thread executor sees the in-place updates; for process
+                pools use GAEngine, whose workers hold their own evaluator.
+
+        Returns:
+            Fitness of each chromosome, in order
+        """
+        if executor is None:
+            return [self.evaluate(chromosome, hard_cutoff) for chromosome in chromosomes]
+        return list(executor.map(self.evaluate, chromosomes, [hard_cutoff] * len(chromosomes)))
+
+    def _pack_schedule(self, chromosome: Chromosome) -> np.ndarray:
+        """
+        Pack the fields the overlap sweeps read into one contiguous array.
+
+        Returns:
+            int32 array of shape (N, 8) with columns HOT_DAY, HOT_START,
+            HOT_END (minutes since midnight), HOT_TEACHER, HOT_ROOM,
+            HOT_SECTION, HOT_DURATION and HOT_ROOM_INDEX (see room_index).
+            Unassigned values and days outside config.working_days are
+            stored as -1.
+        """
+        day_index = self.day_index
+        room_index = self.room_index
+        unknown_room = len(room_index)
+        rows = [
+            (
+                day_index.get(gene.day, -1),
+                gene.start_minutes,
+                gene.end_minutes,
+                gene.teacher_id if gene.teacher_id is not None else -1,
+                gene.room_id if gene.room_id is not None else -1,
+                gene.section_id if gene.section_id is not None else -1,
+                gene.duration_minutes,
+                room_index.get(gene.room_code, unknown_room)
+            )
+            for gene in chromosome.genes
+        ]
+        return np.array(rows, dtype=np.int32).reshape(-1, 8)
+
+    def _blocked_prefix(self) -> np.ndarray:
+        """
+        Blocked-minute prefix counts, one row per day code.
+
+        Entry [d, m] is the number of blocked minutes before minute m on day
+        d, so [start, end) touches a blocked window exactly when
+        prefix[d, end] - prefix[d, start] > 0. Rebuilt when the config's
+        blocked windows change.
+        """
+        masks = self.config._blocked_masks
+        cached = self._blocked_prefix_table
+        if cached is not None and cached[0] is masks:
+            return cached[1]
+
+        table = np.zeros((len(self.day_index), MINUTES_PER_DAY + 1), dtype=np.int32)
+        for day, code in self.day_index.items():
+            mask = masks.get(day)
+            if mask:
+                # Unpack the per-minute bitmask (bit m = minute m) in one call
+                packed = np.frombuffer(mask.to_bytes((mask.bit_length() + 7) // 8, 'little'), dtype=np.uint8)
+                blocked = np.unpackbits(packed, bitorder='little')[:MINUTES_PER_DAY]
+                np.cumsum(blocked, out=table[code, 1:len(blocked) + 1])
+                table[code, len(blocked) + 1:] = table[code, len(blocked)]
+
+        self._blocked_prefix_table = (masks, table)
+        return table
+
+    def _valid_start_minutes(self) -> np.ndarray:
+        """
+        Boolean table over minutes of the day: True at allowed start times.
+
+        Indexing it with the start column replaces a per-call set membership
+        test; rebuilt when the config's allowed start times change.
+        """
+        allowed = self.config._allowed_start_minutes
+        cached = self._valid_start_table
+        if cached is not None and cached[0] is allowed:
+            return cached[1]
+
+        table = np.zeros(MINUTES_PER_DAY + 1, dtype=bool)
+        table[list(allowed.values())] = True
+
+        self._valid_start_table = (allowed, table)
+        return table
+
+    def _check_hard_constraints(
+        self,
+        chromosome: Chromosome,
+        hot: np.ndarray,
+        hard_cutoff: Optional[int] = None
+    ) -> Dict[str, int]:
         """
         Check all hard constraints.
+
+        Checks run cheapest-first; with a hard_cutoff, the remaining checks
+        are skipped once the violation total exceeds it.
         
         Returns:
             Dictionary of constraint -> violation count
         """
-        violations = {
-            'teacher_overlap': 0,
-            'room_overlap': 0,
-            'section_overlap': 0,
-            'invalid_time_slots': 0,
-            'invalid_durations': 0,
-            'blocked_windows': 0,
-            'lab_contiguity': 0,
-            'missing_assignments': 0,
-            'teacher_blocked_slots': 0,
-            'teacher_day_offs': 0,
-            'room_blocked_slots': 0,
-            'room_day_offs': 0,
-            'room_capacity': 0,
-            'lock_violations': 0
-        }
+        violations = dict.fromkeys(self.HARD_CONSTRAINTS, 0)
         
         # Check for unassigned sessions
         for gene in chromosome.genes:
@@ -170,52 +389,81 @@ class FitnessEvaluator:
         
         # If assignments are missing, other checks are meaningless
         if violations['missing_assignments'] > 0:
-            chromosome.conflict_details.append(
-                f"{violations['missing_assignments']} sessions not assigned"
-            )
+            if self.collect_details:
+                chromosome.conflict_details.append(
+                    f"{violations['missing_assignments']} sessions not assigned"
+                )
             return violations
         
-        # Check invalid time slots and durations
-        day_end_minutes = time_to_minutes(self.config.day_end_time)
+        # Check invalid time slots, durations and blocked windows as whole-array
+        # masks; detail strings are built only for the offending genes, and
+        # only when details are collected
+        genes = chromosome.genes
+        day = hot[:, self.HOT_DAY]
+        start = hot[:, self.HOT_START]
+        end = hot[:, self.HOT_END]
+
+        unknown_day = day < 0
+        invalid_start = ~self._valid_start_minutes()[start]
+        # Lock start times come from user input, so those are checked verbatim
+        for i in np.flatnonzero(chromosome.session_flags() & FLAG_LOCKED).tolist():
+            invalid_start[i] = not self.config.is_valid_start_time(genes[i].start_time)
+
+        past_day_end = end > self.config._day_end_minutes
+        invalid_duration = ~np.isin(hot[:, self.HOT_DURATION], self.config.allowed_durations)
+
+        prefix = self._blocked_prefix()
+        blocked = ~unknown_day & (end > start) & (prefix[day, end] > prefix[day, start])
+
+        violations['invalid_time_slots'] = int(unknown_day.sum() + invalid_start.sum() + past_day_end.sum())
+        violations['invalid_durations'] = int(invalid_duration.sum())
+        violations['blocked_windows'] = int(blocked.sum())
+
+        if self.collect_details:
+            offending = np.flatnonzero(unknown_day | invalid_start | past_day_end | invalid_duration | blocked)
+            for i in offending.tolist():
+                gene = genes[i]
+                if unknown_day[i]:
+                    chromosome.conflict_details.append(
+                        f"Invalid day: {gene.session_key} on {gene.day}"
+                    )
+                if invalid_start[i]:
+                    chromosome.conflict_details.append(
+                        f"Invalid start time: {gene.session_key} at {gene.start_time}"
+                    )
+                if past_day_end[i]:
+                    chromosome.conflict_details.append(
+                        f"Session exceeds day end: {gene.session_key} ends at {gene.end_time} (max {self.config.day_end_time})"
+                    )
+                if invalid_duration[i]:
+                    chromosome.conflict_details.append(
+                        f"Invalid duration: {gene.session_key} = {gene.duration_minutes} mins"
+                    )
+                if blocked[i]:
+                    chromosome.conflict_details.append(
+                        f"Blocked window violation: {gene.session_key} on {gene.day} {gene.start_time}-{gene.end_time}"
+                    )
 
-        for gene in chromosome.genes:
-            if not self.config.is_valid_start_time(gene.start_time):
-                violations['invalid_time_slots'] += 1
-                chromosome.conflict_details.append(
-                    f"Invalid start time: {gene.session_key} at {gene.start_time}"
-                )
-            
-            # Check if session extends beyond day end time
-            if time_to_minutes(gene.end_time) > day_end_minutes:
-                violations['invalid_time_slots'] += 1
-                chromosome.conflict_details.append(
-                    f"Session exceeds day end: {gene.session_key} ends at {gene.end_time} (max {self.config.day_end_time})"
-                )
-            
-            if not self.config.is_valid_duration(gene.duration_minutes):
-                violations['invalid_durations'] += 1
-                chromosome.conflict_details.append(
-                    f"Invalid duration: {gene.session_key} = {gene.duration_minutes} mins"
-                )
-            
-            # Check blocked windows
-            if self.config.is_blocked(gene.day, gene.start_time, gene.end_time):
-                violations['blocked_windows'] += 1
-                chromosome.conflict_details.append(
-                    f"Blocked window violation: {gene.session_key} on {gene.day} {gene.start_time}-{gene.end_time}"
-                )
+        if self._exceeds_cutoff(violations, hard_cutoff):
+            return violations
         
-        # Check overlaps (teacher, room, section)
-        teacher_violations = self._check_resource_overlaps(chromosome, 'teacher')
-        room_violations = self._check_resource_overlaps(chromosome, 'room')
-        section_violations = self._check_resource_overlaps(chromosome, 'section')
+        # Check overlaps (teacher, room, section), sharing one day/start sort;
+        # genes on unknown days (code -1, sorted first) are already counted above
+        day_start_order = np.lexsort((hot[:, self.HOT_START], day))
+        day_start_order = day_start_order[np.count_nonzero(unknown_day):]
+        teacher_violations = self._check_resource_overlaps(chromosome, hot, day_start_order, 'teacher')
+        room_violations = self._check_resource_overlaps(chromosome, hot, day_start_order, 'room')
+        section_violations = self._check_resource_overlaps(chromosome, hot, day_start_order, 'section')
         
         violations['teacher_overlap'] = teacher_violations
         violations['room_overlap'] = room_violations
         violations['section_overlap'] = section_violations
+
+        if self._exceeds_cutoff(violations, hard_cutoff):
+            return violations
         
         # Check lab contiguity (labs must be 180 min continuous)
-        lab_violations = self._check_lab_contiguity(chromosome)
+        lab_violations = self._check_lab_contiguity(chromosome, hot)
         violations['lab_contiguity'] = lab_violations
 
         # Check teacher blocked slots (hard constraints only)
@@ -244,23 +492,24 @@ class FitnessEvaluator:
 
         return violations
 
+    @staticmethod
+    def _exceeds_cutoff(violations: Dict[str, int], hard_cutoff: Optional[int]) -> bool:
+        """Whether the violations found so far exceed the early-exit cutoff."""
+        return hard_cutoff is not None and sum(violations.values()) > hard_cutoff
+
     def _check_teacher_blocked_slots(self, chromosome: Chromosome) -> int:
         """Check for hard teacher blocked slot violations."""
         violations = 0
+        index = self.teacher_blocked_hard
+        if not index:
+            return violations
 
         for gene in chromosome.genes:
-            teacher_id = gene.teacher_id
-            if teacher_id not in self.teacher_blocked_slots:
-                continue
-
-            for day, start_time, end_time, is_hard, weight in self.teacher_blocked_slots[teacher_id]:
-                if not is_hard:
-                    continue  # Skip soft constraints here
-
-                if gene.day == day and slots_overlap(gene.start_time, gene.end_time, start_time, end_time):
-                    violations += 1
+            for _, _, _, start_time, end_time, _ in self._blocked_windows_hit(index, gene.teacher_id, gene):
+                violations += 1
+                if self.collect_details:
                     chromosome.conflict_details.append(
-                        f"Teacher blocked slot violation: {gene.session_key} on {day} "
+                        f"Teacher blocked slot violation: {gene.session_key} on {gene.day} "
                         f"({gene.start_time}-{gene.end_time}) conflicts with blocked "
                         f"({start_time}-{end_time})"
                     )
@@ -282,30 +531,27 @@ class FitnessEvaluator:
 
                 if gene.day == day:
                     violations += 1
-                    chromosome.conflict_details.append(
-                        f"Teacher day-off violation: {gene.session_key} on {day} "
-                        f"(teacher has hard day-off constraint)"
-                    )
+                    if self.collect_details:
+                        chromosome.conflict_details.append(
+                            f"Teacher day-off violation: {gene.session_key} on {day} "
+                            f"(teacher has hard day-off constraint)"
+                        )
 
         return violations
 
     def _check_room_blocked_slots(self, chromosome: Chromosome) -> int:
         """Check for hard room blocked slot violations."""
         violations = 0
+        index = self.room_blocked_hard
+        if not index:
+            return violations
 
         for gene in chromosome.genes:
-            room_id = gene.room_id
-            if room_id not in self.room_blocked_slots:
-                continue
-
-            for day, start_time, end_time, is_hard, weight in self.room_blocked_slots[room_id]:
-                if not is_hard:
-                    continue  # Skip soft constraints here
-
-                if gene.day == day and slots_overlap(gene.start_time, gene.end_time, start_time, end_time):
-                    violations += 1
+            for _, _, _, start_time, end_time, _ in self._blocked_windows_hit(index, gene.room_id, gene):
+                violations += 1
+                if self.collect_details:
                     chromosome.conflict_details.append(
-                        f"Room blocked slot violation: {gene.session_key} in room {gene.room_code} on {day} "
+                        f"Room blocked slot violation: {gene.session_key} in room {gene.room_code} on {gene.day} "
                         f"({gene.start_time}-{gene.end_time}) conflicts with blocked "
                         f"({start_time}-{end_time})"
                     )
@@ -327,10 +573,11 @@ class FitnessEvaluator:
 
                 if gene.day == day:
                     violations += 1
-                    chromosome.conflict_details.append(
-                        f"Room day-off violation: {gene.session_key} in room {gene.room_code} on {day} "
-                        f"(room has hard day-off constraint)"
-                    )
+                    if self.collect_details:
+                        chromosome.conflict_details.append(
+                            f"Room day-off violation: {gene.session_key} in room {gene.room_code} on {day} "
+                            f"(room has hard day-off constraint)"
+                        )
 
         return violations
 
@@ -353,32 +600,36 @@ class FitnessEvaluator:
     def _check_lock_violations(self, chromosome: Chromosome) -> int:
         """Check that locked genes maintain their locked values."""
         violations = 0
+        genes = chromosome.genes
 
-        for gene in chromosome.genes:
-            if not gene.is_locked:
-                continue
+        for i in np.flatnonzero(chromosome.session_flags() & FLAG_LOCKED).tolist():
+            gene = genes[i]
 
             if gene.day != gene.locked_day or gene.start_time != gene.locked_start_time:
                 violations += 1
-                chromosome.conflict_details.append(
-                    f"Lock violation: {gene.session_key} should be at "
-                    f"{gene.locked_day} {gene.locked_start_time} but is at "
-                    f"{gene.day} {gene.start_time}"
-                )
+                if self.collect_details:
+                    chromosome.conflict_details.append(
+                        f"Lock violation: {gene.session_key} should be at "
+                        f"{gene.locked_day} {gene.locked_start_time} but is at "
+                        f"{gene.day} {gene.start_time}"
+                    )
 
             if gene.lock_type == 'full_lock' and gene.locked_room_id is not None:
                 if gene.room_id != gene.locked_room_id:
                     violations += 1
-                    chromosome.conflict_details.append(
-                        f"Lock violation: {gene.session_key} room should be "
-                        f"{gene.locked_room_id} but is {gene.room_id}"
-                    )
+                    if self.collect_details:
+                        chromosome.conflict_details.append(
+                            f"Lock violation: {gene.session_key} room should be "
+                            f"{gene.locked_room_id} but is {gene.room_id}"
+                        )
 
         return violations
     
     def _check_resource_overlaps(
         self, 
         chromosome: Chromosome, 
+        hot: np.ndarray,
+        day_start_order: np.ndarray,
         resource_type: str
     ) -> int:
         """
@@ -386,69 +637,74 @@ class FitnessEvaluator:
         
         Args:
             chromosome: Chromosome to check
+            hot: Packed schedule array from _pack_schedule
+            day_start_order: Gene order sorted by (day, start), shared across resources
             resource_type: 'teacher', 'room', or 'section'
             
         Returns:
             Number of overlap violations
         """
         violations = 0
-        
-        # Build schedule index: {resource_id: {day: [(start, end, gene)]}}
-        schedule = defaultdict(lambda: defaultdict(list))
-        
-        for gene in chromosome.genes:
-            if resource_type == 'teacher':
-                resource_id = gene.teacher_id
-            elif resource_type == 'room':
-                resource_id = gene.room_id
-            else:  # section
-                resource_id = gene.section_id
-            
-            schedule[resource_id][gene.day].append(
-                (gene.start_time, gene.end_time, gene)
-            )
-        
-        # Check each resource's schedule for overlaps
-        for resource_id, days in schedule.items():
-            for day, sessions in days.items():
-                # Check all pairs for overlaps
-                for i in range(len(sessions)):
-                    for j in range(i + 1, len(sessions)):
-                        start1, end1, gene1 = sessions[i]
-                        start2, end2, gene2 = sessions[j]
-                        
-                        if slots_overlap(start1, end1, start2, end2):
-                            violations += 1
-                            chromosome.conflict_details.append(
-                                f"{resource_type.capitalize()} overlap: "
-                                f"{gene1.session_key} and {gene2.session_key} "
-                                f"on {day} ({start1}-{end1} vs {start2}-{end2})"
-                            )
+        column = self.RESOURCE_COLUMNS[resource_type]
+
+        order, same, bounds = daily_runs(hot[:, column], hot[:, self.HOT_DAY], day_start_order)
+        grouped = hot[order]
+
+        # Within a group sorted by start, any overlap implies the earliest
+        # interval involved overlaps its successor, so one sweep over adjacent
+        # rows finds every group that needs the pairwise check
+        clashes = np.flatnonzero(
+            same & (grouped[1:, self.HOT_START] < grouped[:-1, self.HOT_END])
+        )
+        clashing_groups = np.unique(np.searchsorted(bounds, clashes, side='right') - 1)
+
+        # Check each clashing resource schedule for overlaps
+        for g in clashing_groups:
+            lo, hi = bounds[g], bounds[g + 1]
+            group = grouped[lo:hi]
+            pairs = overlapping_pairs(group[:, self.HOT_START], group[:, self.HOT_END])
+            violations += len(pairs[0])
+            if not self.collect_details:
+                continue
+
+            for i, j in zip(*pairs):
+                gene1 = chromosome.genes[order[lo + i]]
+                gene2 = chromosome.genes[order[lo + j]]
+                chromosome.conflict_details.append(
+                    f"{resource_type.capitalize()} overlap: "
+                    f"{gene1.session_key} and {gene2.session_key} "
+                    f"on {gene1.day} ({gene1.start_time}-{gene1.end_time} vs "
+                    f"{gene2.start_time}-{gene2.end_time})"
+                )
         
         return violations
-    
-    def _check_lab_contiguity(self, chromosome: Chromosome) -> int:
+
+    def _check_lab_contiguity(self, chromosome: Chromosome, hot: np.ndarray) -> int:
         """
         Check that lab sessions are exactly 180 minutes continuous.
+
+        One mask over the lab flags and packed durations; genes are
+        visited only to describe violations.
         
         Returns:
             Number of violations
         """
-        violations = 0
-        
-        for gene in chromosome.genes:
-            if gene.is_lab:
-                # Lab must be exactly 180 minutes
-                if gene.duration_minutes != 180:
-                    violations += 1
-                    chromosome.conflict_details.append(
-                        f"Lab duration violation: {gene.session_key} "
-                        f"is {gene.duration_minutes} mins (should be 180)"
-                    )
+        # Lab must be exactly 180 minutes
+        wrong = (chromosome.session_flags() & FLAG_LAB).astype(bool) & (hot[:, self.HOT_DURATION] != 180)
+        violations = int(np.count_nonzero(wrong))
+
+        if violations and self.collect_details:
+            genes = chromosome.genes
+            for i in np.flatnonzero(wrong).tolist():
+                gene = genes[i]
+                chromosome.conflict_details.append(
+                    f"Lab duration violation: {gene.session_key} "
+                    f"is {gene.duration_minutes} mins (should be 180)"
+                )
         
         return violations
     
-    def _calculate_soft_scores(self, chromosome: Chromosome) -> Dict[str, float]:
+    def _calculate_soft_scores(self, chromosome: Chromosome, hot: np.ndarray) -> Dict[str, float]:
         """
         Calculate scores for soft constraints.
 
@@ -464,30 +720,55 @@ class FitnessEvaluator:
         Returns:
             Dictionary of constraint -> score
         """
-        scores = {}
+        config = self.config
+
+        # Disabled constraints (weight 0) score 0 without running their scorer
+        scores = dict.fromkeys(self.SOFT_WEIGHTS, 0.0)
+        enabled = {name for name, field in self.SOFT_WEIGHTS.items() if getattr(config, field)}
+
+        # Sessions of each section / teacher per day, in start order
+        day = hot[:, self.HOT_DAY]
+        if enabled & {
+            'minimize_student_gaps', 'compact_schedule', 'minimize_teacher_gaps', 'minimize_building_changes'
+        }:
+            day_start_order = np.lexsort((hot[:, self.HOT_START], day))
+            section_runs = daily_runs(hot[:, self.HOT_SECTION], day, day_start_order)
+        if 'minimize_teacher_gaps' in enabled:
+            teacher_runs = daily_runs(hot[:, self.HOT_TEACHER], day, day_start_order)
 
         # TIER 1: Resource Availability (Critical)
-        scores['teacher_availability'] = self._score_teacher_availability(chromosome)
-        scores['room_availability'] = self._score_room_availability(chromosome)
+        if 'teacher_availability' in enabled:
+            scores['teacher_availability'] = self._score_teacher_availability(chromosome)
+        if 'room_availability' in enabled:
+            scores['room_availability'] = self._score_room_availability(chromosome)
 
         # TIER 2: Schedule Quality (Important)
-        scores['even_distribution'] = self._score_even_distribution(chromosome)
-        scores['minimize_student_gaps'] = self._score_minimize_gaps(chromosome, 'section')
-        scores['compact_schedule'] = self._score_compactness(chromosome)
-        scores['minimize_teacher_gaps'] = self._score_minimize_gaps(chromosome, 'teacher')
+        if 'even_distribution' in enabled:
+            scores['even_distribution'] = self._score_even_distribution(hot)
+        if 'minimize_student_gaps' in enabled:
+            scores['minimize_student_gaps'] = self._score_minimize_gaps(hot, section_runs, 'section')
+        if 'compact_schedule' in enabled:
+            scores['compact_schedule'] = self._score_compactness(hot, section_runs)
+        if 'minimize_teacher_gaps' in enabled:
+            scores['minimize_teacher_gaps'] = self._score_minimize_gaps(hot, teacher_runs, 'teacher')
 
         # TIER 3: Preferences
-        scores['room_type_match'] = self._score_room_type_match(chromosome)
-        scores['minimize_early_classes'] = self._score_time_preference(
-            chromosome, 'early', self.config.early_class_threshold
-        )
-        scores['minimize_late_classes'] = self._score_time_preference(
-            chromosome, 'late', self.config.late_class_threshold
-        )
+        if 'room_type_match' in enabled:
+            scores['room_type_match'] = self._score_room_type_match(chromosome, hot)
+        if 'minimize_early_classes' in enabled:
+            scores['minimize_early_classes'] = self._score_time_preference(
+                hot, 'early', config.early_class_threshold
+            )
+        if 'minimize_late_classes' in enabled:
+            scores['minimize_late_classes'] = self._score_time_preference(
+                hot, 'late', config.late_class_threshold
+            )
 
         # TIER 4: Minor Optimization
-        scores['minimize_building_changes'] = self._score_building_changes(chromosome)
-        scores['room_utilization'] = self._score_room_utilization(chromosome)
+        if 'minimize_building_changes' in enabled:
+            scores['minimize_building_changes'] = self._score_building_changes(hot, section_runs)
+        if 'room_utilization' in enabled:
+            scores['room_utilization'] = self._score_room_utilization(hot)
 
         return scores
 
@@ -511,15 +792,11 @@ class FitnessEvaluator:
         for gene in chromosome.genes:
             teacher_id = gene.teacher_id
 
-            # Check soft blocked slots
-            for day, start_time, end_time, is_hard, weight in self.teacher_blocked_slots.get(teacher_id, []):
-                if is_hard:
-                    continue  # Hard constraints handled elsewhere
-
-                if gene.day == day and slots_overlap(gene.start_time, gene.end_time, start_time, end_time):
-                    # Apply weighted penalty (weight is 1-10, multiply by penalty factor)
-                    total_penalty += weight * self.config.soft_constraint_penalty_multiplier
-                    violation_count += 1
+            # Check soft blocked slots (hard constraints handled elsewhere)
+            for *_, weight in self._blocked_windows_hit(self.teacher_blocked_soft, teacher_id, gene):
+                # Apply weighted penalty (weight is 1-10, multiply by penalty factor)
+                total_penalty += weight * self.config.soft_constraint_penalty_multiplier
+                violation_count += 1
 
             # Check soft day-offs
             for day, is_hard, weight in self.teacher_day_offs.get(teacher_id, []):
@@ -560,13 +837,9 @@ class FitnessEvaluator:
             room_id = gene.room_id
 
             # Check soft blocked slots
-            for day, start_time, end_time, is_hard, weight in self.room_blocked_slots.get(room_id, []):
-                if is_hard:
-                    continue
-
-                if gene.day == day and slots_overlap(gene.start_time, gene.end_time, start_time, end_time):
-                    total_penalty += weight * self.config.soft_constraint_penalty_multiplier
-                    violation_count += 1
+            for *_, weight in self._blocked_windows_hit(self.room_blocked_soft, room_id, gene):
+                total_penalty += weight * self.config.soft_constraint_penalty_multiplier
+                violation_count += 1
 
             # Check soft day-offs
             for day, is_hard, weight in self.room_day_offs.get(room_id, []):
@@ -586,77 +859,47 @@ class FitnessEvaluator:
 
         return max(0, score)
     
-    def _score_even_distribution(self, chromosome: Chromosome) -> float:
+    def _score_even_distribution(self, hot: np.ndarray) -> float:
         """
         Score based on how evenly sessions are distributed across days.
         Perfect distribution = max score.
+
+        Args:
+            hot: Packed schedule array from _pack_schedule
         """
-        day_counts = defaultdict(int)
-        for gene in chromosome.genes:
-            day_counts[gene.day] += 1
-        
-        counts = list(day_counts.values())
-        if not counts:
-            return 0.0
-        
-        # Calculate standard deviation (lower is better)
-        avg = sum(counts) / len(counts)
-        variance = sum((c - avg) ** 2 for c in counts) / len(counts)
-        std_dev = variance ** 0.5
-        
-        # Normalize: std_dev of 0 = perfect, std_dev of avg = very bad
-        # Score: high when std_dev is low
-        if avg == 0:
+        # Sessions per day, over the days that have any
+        counts = np.bincount(hot[:, self.HOT_DAY])
+        counts = counts[counts > 0]
+        if len(counts) == 0:
             return 0.0
         
-        normalized_std = std_dev / avg
-        score = max(0, 1 - normalized_std)  # 0 to 1
-        
-        return score * self.config.weight_even_distribution
+        # Score: high when the standard deviation is low relative to the mean
+        return evenness(counts) * self.config.weight_even_distribution
     
     def _score_minimize_gaps(
         self, 
-        chromosome: Chromosome, 
+        hot: np.ndarray,
+        runs: tuple,
         resource_type: str
     ) -> float:
         """
         Score based on minimizing gaps in schedules.
         
         Args:
+            hot: Packed schedule array from _pack_schedule
+            runs: daily_runs of the resource column (resource/day runs in
+                start order)
             resource_type: 'section' for students, 'teacher' for instructors
         """
-        total_gap_penalty = 0
-        resource_count = 0
-        
-        # Group by resource and day
-        schedule = defaultdict(lambda: defaultdict(list))
-        
-        for gene in chromosome.genes:
-            resource_id = gene.section_id if resource_type == 'section' else gene.teacher_id
-            schedule[resource_id][gene.day].append(gene)
-        
-        # For each resource, check gaps on each day
-        for resource_id, days in schedule.items():
-            resource_count += 1
-            
-            for day, genes in days.items():
-                if len(genes) < 2:
-                    continue  # No gaps if only 1 session
-                
-                # Sort by start time
-                genes = sorted(genes, key=lambda g: time_to_minutes(g.start_time))
-                
-                # Calculate gaps
-                for i in range(len(genes) - 1):
-                    gap_minutes = (
-                        time_to_minutes(genes[i + 1].start_time) - 
-                        time_to_minutes(genes[i].end_time)
-                    )
-                    
-                    # Penalize gaps > threshold
-                    if gap_minutes > self.config.max_acceptable_gap_minutes:
-                        penalty = (gap_minutes - self.config.max_acceptable_gap_minutes) / 60.0
-                        total_gap_penalty += penalty
+        order, same, _ = runs
+        threshold = self.config.max_acceptable_gap_minutes
+
+        # Gap between each session and the next one of the same resource on
+        # the same day; gaps over the threshold are penalized per hour
+        gaps = hot[order[1:], self.HOT_START] - hot[order[:-1], self.HOT_END]
+        excess = gaps[same & (gaps > threshold)] - threshold
+        total_gap_penalty = float(excess.sum()) / 60.0
+        resource_count = len(np.unique(hot[:, self.RESOURCE_COLUMNS[resource_type]]))
         
         # Normalize by resource count
         if resource_count == 0:
@@ -680,7 +923,7 @@ class FitnessEvaluator:
     
     def _score_time_preference(
         self, 
-        chromosome: Chromosome, 
+        hot: np.ndarray,
         preference_type: str,
         threshold: str
     ) -> float:
@@ -688,27 +931,25 @@ class FitnessEvaluator:
         Score based on avoiding early/late classes.
         
         Args:
+            hot: Packed schedule array from _pack_schedule
             preference_type: 'early' or 'late'
             threshold: Time threshold (e.g., '09:30' for early, '15:30' for late)
         """
-        threshold_minutes = time_to_minutes(threshold)
-        violation_count = 0
-        
-        for gene in chromosome.genes:
-            start_minutes = time_to_minutes(gene.start_time)
-            
-            if preference_type == 'early':
-                if start_minutes < threshold_minutes:
-                    violation_count += 1
-            else:  # late
-                if start_minutes >= threshold_minutes:
-                    violation_count += 1
-        
         # Normalize by total sessions
-        if len(chromosome.genes) == 0:
+        if len(hot) == 0:
             return 0.0
+
+        threshold_minutes = self._threshold_minutes.get(threshold)
+        if threshold_minutes is None:
+            threshold_minutes = self._threshold_minutes[threshold] = time_to_minutes(threshold)
+        start_minutes = hot[:, self.HOT_START]
+
+        if preference_type == 'early':
+            violation_count = int(np.count_nonzero(start_minutes < threshold_minutes))
+        else:  # late
+            violation_count = int(np.count_nonzero(start_minutes >= threshold_minutes))
         
-        violation_ratio = violation_count / len(chromosome.genes)
+        violation_ratio = violation_count / len(hot)
         score = 1.0 - violation_ratio
         
         weight = (
@@ -719,67 +960,45 @@ class FitnessEvaluator:
         
         return score * weight
     
-    def _score_room_type_match(self, chromosome: Chromosome) -> float:
+    def _score_room_type_match(self, chromosome: Chromosome, hot: np.ndarray) -> float:
         """
         Score based on matching lab sessions to lab rooms.
+
+        Args:
+            chromosome: Chromosome being scored (for its session flags)
+            hot: Packed schedule array from _pack_schedule
         """
-        matches = 0
-        mismatches = 0
-        
-        for gene in chromosome.genes:
-            if gene.room_code not in self.room_types:
-                continue  # Skip if room info not available
-            
-            room_type = self.room_types[gene.room_code].lower()
-            
-            if gene.is_lab:
-                if 'lab' in room_type:
-                    matches += 1
-                else:
-                    mismatches += 1
-            else:
-                if 'lab' not in room_type:
-                    matches += 1
-                else:
-                    mismatches += 1
-        
-        total = matches + mismatches
+        # Lab sessions belong in lab rooms and theory sessions elsewhere
+        # (rooms without type info are skipped)
+        room_lab = self.room_is_lab[hot[:, self.HOT_ROOM_INDEX]]
+        session_lab = chromosome.session_flags() & FLAG_LAB
+        known = room_lab >= 0
+
+        total = int(np.count_nonzero(known))
+        matches = int(np.count_nonzero(known & (room_lab == session_lab)))
         if total == 0:
             return 0.0
         
         score = matches / total
         return score * self.config.weight_room_type_match
     
-    def _score_building_changes(self, chromosome: Chromosome) -> float:
+    def _score_building_changes(self, hot: np.ndarray, section_runs: tuple) -> float:
         """
         Score based on minimizing building changes for sections.
         Students prefer staying in same building.
+
+        Args:
+            hot: Packed schedule array from _pack_schedule
+            section_runs: daily_runs of the section column (section/day runs
+                in start order)
         """
-        total_changes = 0
-        section_count = 0
-        
-        # Group by section and day
-        schedule = defaultdict(lambda: defaultdict(list))
-        for gene in chromosome.genes:
-            schedule[gene.section_id][gene.day].append(gene)
-        
-        for section_id, days in schedule.items():
-            section_count += 1
-            
-            for day, genes in days.items():
-                if len(genes) < 2:
-                    continue
-                
-                # Sort by time
-                genes = sorted(genes, key=lambda g: time_to_minutes(g.start_time))
-                
-                # Count building changes
-                for i in range(len(genes) - 1):
-                    building1 = self.room_buildings.get(genes[i].room_code, '')
-                    building2 = self.room_buildings.get(genes[i + 1].room_code, '')
-                    
-                    if building1 != building2:
-                        total_changes += 1
+        order, same, _ = section_runs
+
+        # A change is a consecutive pair within one section's day whose
+        # building codes differ
+        buildings = self.room_building_codes[hot[order, self.HOT_ROOM_INDEX]]
+        total_changes = int(np.count_nonzero(same & (buildings[1:] != buildings[:-1])))
+        section_count = len(np.unique(hot[:, self.HOT_SECTION]))
         
         if section_count == 0:
             return 0.0
@@ -792,35 +1011,27 @@ class FitnessEvaluator:
         
         return score * self.config.weight_minimize_building_changes
     
-    def _score_compactness(self, chromosome: Chromosome) -> float:
+    def _score_compactness(self, hot: np.ndarray, section_runs: tuple) -> float:
         """
         Score based on schedule compactness (minimize span of day).
+
+        Args:
+            hot: Packed schedule array from _pack_schedule
+            section_runs: daily_runs of the section column (section/day runs
+                in start order)
         """
-        total_span = 0
-        section_day_count = 0
-        
-        # Group by section and day
-        schedule = defaultdict(lambda: defaultdict(list))
-        for gene in chromosome.genes:
-            schedule[gene.section_id][gene.day].append(gene)
-        
-        for section_id, days in schedule.items():
-            for day, genes in days.items():
-                if not genes:
-                    continue
-                
-                section_day_count += 1
-                
-                # Find earliest start and latest end
-                earliest = min(time_to_minutes(g.start_time) for g in genes)
-                latest = max(time_to_minutes(g.end_time) for g in genes)
-                
-                span_minutes = latest - earliest
-                total_span += span_minutes
-        
-        if section_day_count == 0:
+        order, _, bounds = section_runs
+        if len(order) == 0:
             return 0.0
         
+        # Earliest start (runs are in start order) and latest end of each
+        # section's day, as one segmented reduction
+        run_starts = bounds[:-1]
+        earliest = hot[order[run_starts], self.HOT_START]
+        latest = np.maximum.reduceat(hot[order, self.HOT_END], run_starts)
+        total_span = int((latest - earliest).sum())
+        section_day_count = len(run_starts)
+        
         # Average span per section per day
         avg_span = total_span / section_day_count
         
@@ -836,30 +1047,19 @@ class FitnessEvaluator:
         
         return score * self.config.weight_compact_schedule
     
-    def _score_room_utilization(self, chromosome: Chromosome) -> float:
+    def _score_room_utilization(self, hot: np.ndarray) -> float:
         """
         Score based on efficient room usage.
         Prefer using fewer rooms more efficiently.
+
+        Args:
+            hot: Packed schedule array from _pack_schedule
         """
-        room_usage = defaultdict(int)
-        
-        for gene in chromosome.genes:
-            room_usage[gene.room_id] += 1
-        
-        if not room_usage:
+        if len(hot) == 0:
             return 0.0
         
-        # Calculate utilization variance
-        usage_counts = list(room_usage.values())
-        avg_usage = sum(usage_counts) / len(usage_counts)
-        variance = sum((u - avg_usage) ** 2 for u in usage_counts) / len(usage_counts)
-        std_dev = variance ** 0.5
+        # Calculate utilization variance over the rooms in use
+        usage_counts = np.unique(hot[:, self.HOT_ROOM], return_counts=True)[1]
         
         # Lower variance = better (rooms used evenly)
-        if avg_usage == 0:
-            return 0.0
-        
-        normalized_std = std_dev / avg_usage
-        score = max(0, 1 - normalized_std)
-        
-        return score * self.config.weight_room_utilization
+        return evenness(usage_counts) * self.config.weight_room_utilization
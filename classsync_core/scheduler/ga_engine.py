@@ -3,10 +3,13 @@ GA Engine - Main genetic algorithm orchestrator.
 Coordinates selection, crossover, mutation, repair, and evaluation.
 """
 
+import os
 import time
 import random
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Callable, Optional, Dict
 from collections import defaultdict
+import numpy as np
 import pandas as pd
 
 from classsync_core.scheduler.config import GAConfig
@@ -17,6 +20,38 @@ from classsync_core.scheduler.repair import RepairMechanism
 from classsync_core.scheduler.fitness_evaluator import FitnessEvaluator
 
 
+# Evaluator owned by each pool worker process (built once by _init_evaluation_worker)
+_worker_evaluator: Optional[FitnessEvaluator] = None
+
+
+def _init_evaluation_worker(
+    config: GAConfig,
+    rooms_df: pd.DataFrame,
+    teacher_constraints: list,
+    room_constraints: list
+):
+    """Build the worker's FitnessEvaluator once, so per-task payloads are just chromosomes."""
+    global _worker_evaluator
+    _worker_evaluator = FitnessEvaluator(
+        config, rooms_df,
+        teacher_constraints=teacher_constraints,
+        room_constraints=room_constraints,
+        collect_details=False
+    )
+
+
+def _evaluate_in_worker(chromosome: Chromosome, hard_cutoff: Optional[int]) -> tuple:
+    """Evaluate one chromosome in a worker and return the fields the GA reads back."""
+    _worker_evaluator.evaluate(chromosome, hard_cutoff)
+    return (
+        chromosome.fitness,
+        chromosome.is_feasible,
+        chromosome.hard_violations,
+        chromosome.soft_scores,
+        []  # conflict details are only built for the final result
+    )
+
+
 class GAEngine:
     """
     Main Genetic Algorithm engine for timetable optimization.
@@ -43,7 +78,8 @@ class GAEngine:
         room_constraints: list = None,
         locked_assignments: list = None,
         progress_callback: Optional[Callable] = None,
-        random_seed: Optional[int] = None
+        random_seed: Optional[int] = None,
+        num_workers: Optional[int] = None
     ):
         """
         Initialize GA engine.
@@ -57,6 +93,7 @@ class GAEngine:
             locked_assignments: Pre-scheduled sessions to respect
             progress_callback: Optional callback for progress updates
             random_seed: Optional seed for reproducible results
+            num_workers: Fitness evaluation processes, overriding config.max_workers
         """
         self.config = config
         self.sessions_df = sessions_df
@@ -66,20 +103,35 @@ class GAEngine:
         self.locked_assignments = locked_assignments or []
         self.progress_callback = progress_callback
         self.random_seed = random_seed
+        self.num_workers = num_workers if num_workers is not None else config.max_workers
+
+        # Shared NumPy generator for all GA stochastic operations
+        self.rng = np.random.default_rng(random_seed)
 
         # Initialize components with constraints
         self.initializer = PopulationInitializer(
             config, sessions_df, rooms_df,
-            locked_assignments=self.locked_assignments
+            locked_assignments=self.locked_assignments,
+            rng=self.rng
         )
-        self.operators = GeneticOperators(config, rooms_df)
+        self.operators = GeneticOperators(config, rooms_df, rng=self.rng)
         self.repair = RepairMechanism(config, rooms_df)
+        # Conflict detail strings are skipped while evolving (see _describe_conflicts)
         self.evaluator = FitnessEvaluator(
             config, rooms_df,
             teacher_constraints=self.teacher_constraints,
-            room_constraints=self.room_constraints
+            room_constraints=self.room_constraints,
+            collect_details=False
         )
 
+        # Evaluation results by Chromosome.content_hash(), least recently used
+        # evicted first (dict order is recency order)
+        self._fitness_cache: Dict[int, tuple] = {}
+
+        # Worker pool for parallel fitness evaluation (alive only during run())
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+
         # Statistics tracking
         self.best_fitness_history = []
         self.avg_fitness_history = []
@@ -88,14 +140,20 @@ class GAEngine:
     def run(
         self,
         population_size: Optional[int] = None,
-        generations: Optional[int] = None
+        generations: Optional[int] = None,
+        heuristic_seed_ratio: Optional[float] = None
     ) -> Dict:
         """
         Run the genetic algorithm.
+
+        When config.parallel_fitness_evaluation is set, fitness is evaluated
+        by a process pool that lives for the duration of the run.
         
         Args:
             population_size: Population size (uses config default if None)
             generations: Number of generations (uses config default if None)
+            heuristic_seed_ratio: Fraction of the initial population seeded
+                by the heuristic (uses the initializer default if None)
         
         Returns:
             Dictionary with results:
@@ -107,9 +165,67 @@ class GAEngine:
                 'statistics': {...}
             }
         """
+        self._pool = self._create_evaluation_pool()
+        try:
+            return self._evolve(population_size, generations, heuristic_seed_ratio)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def run_islands(
+        self,
+        num_islands: Optional[int] = None,
+        population_size: Optional[int] = None,
+        generations: Optional[int] = None,
+        heuristic_seed_ratio: Optional[float] = None
+    ) -> Dict:
+        """
+        Run the genetic algorithm as an island model.
+
+        The population is split into independent islands that evolve
+        side by side, with selection and crossover only within an island.
+        Every config.migration_interval generations each island's best
+        config.migration_size chromosomes are copied to the next island
+        (ring order), replacing its worst. Islands keep more diversity than
+        one large population, which helps against early stagnation.
+
+        All islands' offspring are evaluated as one batch per generation,
+        so they share the fitness cache and the process pool.
+
+        Args:
+            num_islands: Number of islands (uses config default if None)
+            population_size: Total population size across all islands
+                (uses config default if None)
+            generations: Number of generations (uses config default if None)
+            heuristic_seed_ratio: Fraction of each island's initial
+                population seeded by the heuristic (uses the initializer
+                default if None)
+
+        Returns:
+            Same dictionary as run()
+        """
+        islands = num_islands or self.config.num_islands
+        self._pool = self._create_evaluation_pool()
+        try:
+            return self._evolve(population_size, generations, heuristic_seed_ratio, islands)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def _evolve(
+        self,
+        population_size: Optional[int],
+        generations: Optional[int],
+        heuristic_seed_ratio: Optional[float] = None,
+        num_islands: int = 1
+    ) -> Dict:
+        """Run the evolution loop over one or more islands (see run() and run_islands())."""
         start_time = time.time()
 
-        # Set random seed for reproducibility (if provided)
+        # Set random seed for reproducibility (if provided).
+        # The repair mechanism still draws from the stdlib generator.
         if self.random_seed is not None:
             random.seed(self.random_seed)
             self._log(f"Random seed set to {self.random_seed} for reproducible results")
@@ -117,18 +233,32 @@ class GAEngine:
         pop_size = population_size or self.config.population_size
         max_gens = generations or self.config.generations
 
+        # Islands need at least two members for selection and crossover
+        num_islands = max(1, min(num_islands, pop_size // 2))
+        island_sizes = [
+            pop_size // num_islands + (1 if i < pop_size % num_islands else 0)
+            for i in range(num_islands)
+        ]
+
         # 1. Initialize population
         self._log("Initializing population...")
-        population = self.initializer.create_population(pop_size)
+        islands = []
+        for size in island_sizes:
+            if heuristic_seed_ratio is None:
+                islands.append(self.initializer.create_population(size))
+            else:
+                islands.append(self.initializer.create_population(size, heuristic_seed_ratio))
+        population = [chromosome for island in islands for chromosome in island]
         
         # 2. Evaluate initial population
         self._log("Evaluating initial population...")
-        for chromosome in population:
-            self.evaluator.evaluate(chromosome)
+        self._evaluate_population(population)
         
         # Track best solution
-        best_chromosome = max(population, key=lambda c: c.fitness or 0)
-        best_fitness = best_chromosome.fitness or 0
+        fitness = self._fitness_array(population)
+        best_idx = int(fitness.argmax())
+        best_chromosome = population[best_idx]
+        best_fitness = float(fitness[best_idx])
         stagnant_generations = 0
         
         # 3. Evolution loop
@@ -136,27 +266,33 @@ class GAEngine:
             gen_start = time.time()
             
             # Create next generation
-            new_population = self._create_next_generation(
-                population, 
-                generation
-            )
+            islands = [
+                self._create_next_generation(island, generation)
+                for island in islands
+            ]
+            new_population = [chromosome for island in islands for chromosome in island]
             
-            # Evaluate new population
-            for chromosome in new_population:
-                if chromosome.fitness is None:
-                    self.evaluator.evaluate(chromosome)
+            # Evaluate new population (all islands in one batch)
+            self._evaluate_population(new_population)
+
+            # Migration between islands
+            interval = self.config.migration_interval
+            if num_islands > 1 and interval > 0 and (generation + 1) % interval == 0:
+                self._migrate(islands)
+                new_population = [chromosome for island in islands for chromosome in island]
             
             # Update best
-            generation_best = max(new_population, key=lambda c: c.fitness or 0)
-            if generation_best.fitness > best_fitness:
-                best_chromosome = generation_best.copy()
-                best_fitness = generation_best.fitness
+            fitness = self._fitness_array(new_population)
+            best_idx = int(fitness.argmax())
+            if fitness[best_idx] > best_fitness:
+                best_chromosome = new_population[best_idx].copy()
+                best_fitness = float(fitness[best_idx])
                 stagnant_generations = 0
             else:
                 stagnant_generations += 1
             
             # Statistics
-            avg_fitness = sum(c.fitness or 0 for c in new_population) / len(new_population)
+            avg_fitness = float(fitness.mean())
             self.best_fitness_history.append(best_fitness)
             self.avg_fitness_history.append(avg_fitness)
             self.generation_times.append(time.time() - gen_start)
@@ -192,6 +328,8 @@ class GAEngine:
             # Replace population
             population = new_population
         
+        self._describe_conflicts(best_chromosome)
+
         total_time = time.time() - start_time
         
         # Return results
@@ -228,62 +366,199 @@ class GAEngine:
             New population
         """
         new_population = []
+        fitness = self._fitness_array(population)
         
-        # Elitism: keep top individuals unchanged
-        elite_count = max(1, int(len(population) * self.config.elitism_rate))
-        elite = sorted(population, key=lambda c: c.fitness or 0, reverse=True)[:elite_count]
-        new_population.extend([c.copy() for c in elite])
+        # Elitism: keep top individuals unchanged (partial selection, then
+        # order just the elite by fitness)
+        elite_count = min(max(1, int(len(population) * self.config.elitism_rate)), len(population))
+        elite_idx = np.argpartition(-fitness, elite_count - 1)[:elite_count]
+        elite_idx = elite_idx[np.argsort(-fitness[elite_idx], kind='stable')]
+        new_population.extend([population[i].copy() for i in elite_idx])
         
         # Generate offspring to fill rest of population
         offspring_needed = len(population) - elite_count
-        
-        while len(new_population) < len(population):
+
+        # Draw every tournament and crossover decision for this generation up front
+        pair_count = (offspring_needed + 1) // 2
+        winners = self._tournament_selection(fitness, 2 * pair_count)
+        do_crossover = self.rng.random(pair_count) < self.config.crossover_rate
+
+        for pair_idx in range(pair_count):
             # Selection
-            parent1 = self._tournament_selection(population)
-            parent2 = self._tournament_selection(population)
-            
+            parent1 = population[winners[2 * pair_idx]]
+            parent2 = population[winners[2 * pair_idx + 1]]
+
             # Crossover
-            if random.random() < self.config.crossover_rate:
+            if do_crossover[pair_idx]:
                 child1, child2 = self.operators.crossover(parent1, parent2)
             else:
                 child1, child2 = parent1.copy(), parent2.copy()
-            
-            # Mutation
-            child1 = self.operators.mutate(child1, generation)
-            child2 = self.operators.mutate(child2, generation)
-            
+
+            # Mutation (children are fresh copies, so their genes are reused)
+            child1 = self.operators.mutate(child1, generation, in_place=True)
+            child2 = self.operators.mutate(child2, generation, in_place=True)
+
             # Repair
             if self.repair.repair(child1):
                 new_population.append(child1)
             else:
                 # If unrepairable, use parent instead
                 new_population.append(parent1.copy())
-            
+
             if len(new_population) < len(population):
                 if self.repair.repair(child2):
                     new_population.append(child2)
                 else:
                     new_population.append(parent2.copy())
-        
+
         # Trim to exact size
         return new_population[:len(population)]
-    
-    def _tournament_selection(self, population: List[Chromosome]) -> Chromosome:
+
+    def _migrate(self, islands: List[List[Chromosome]]):
         """
-        Tournament selection: pick best from random subset.
-        
+        Copy each island's best chromosomes over the next island's worst (ring order).
+
+        Emigrants are chosen from every island before any island is
+        changed, so a migrant never moves on twice in one migration.
+        """
+        count = min(self.config.migration_size, min(len(island) for island in islands) - 1)
+        if count <= 0:
+            return
+
+        emigrants = []
+        for island in islands:
+            fitness = self._fitness_array(island)
+            best = np.argsort(-fitness, kind='stable')[:count]
+            emigrants.append([island[i].copy() for i in best])
+
+        for i, island in enumerate(islands):
+            fitness = self._fitness_array(island)
+            worst = np.argsort(fitness, kind='stable')[:count]
+            for slot, migrant in zip(worst, emigrants[i - 1]):
+                island[slot] = migrant
+
+    def _describe_conflicts(self, chromosome: Chromosome):
+        """
+        Fill in conflict_details and full violation counts of an infeasible result.
+
+        Evaluation during the run skips the detail strings and stops at
+        config.fitness_hard_cutoff, so the chromosome is re-evaluated once
+        with details and every hard-constraint check (fitness stays 0).
+        """
+        if chromosome.is_feasible:
+            return
+
+        self.evaluator.collect_details = True
+        try:
+            self.evaluator.evaluate(chromosome, hard_cutoff=None)
+        finally:
+            self.evaluator.collect_details = False
+
+    def _create_evaluation_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Start a persistent process pool for fitness evaluation, if enabled.
+
+        Workers receive the config, rooms and constraints once at startup.
+        Returns None (serial evaluation) when parallel evaluation is disabled
+        or fewer than two CPUs are usable.
+        """
+        workers = min(self.num_workers, os.cpu_count() or 1)
+        if not self.config.parallel_fitness_evaluation or workers < 2:
+            return None
+
+        self._pool_workers = workers
+        self._log(f"Evaluating fitness with {workers} worker processes")
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_evaluation_worker,
+            initargs=(self.config, self.rooms_df, self.teacher_constraints, self.room_constraints)
+        )
+
+    def _evaluate_population(self, population: List[Chromosome]):
+        """
+        Evaluate every chromosome that has no fitness yet, in parallel when a pool is running.
+
+        Results are cached by assignment: chromosomes identical to one already
+        evaluated (in this batch or an earlier generation) reuse its result.
+        """
+        hard_cutoff = self.config.fitness_hard_cutoff
+
+        # Group pending chromosomes by assignment; cache hits are applied directly
+        groups: Dict[int, List[Chromosome]] = defaultdict(list)
+        for chromosome in population:
+            if chromosome.fitness is not None:
+                continue
+            key = chromosome.content_hash()
+            cached = self._fitness_cache.pop(key, None)
+            if cached is not None:
+                # Re-insert to mark the entry as most recently used
+                self._fitness_cache[key] = cached
+                self._apply_evaluation(chromosome, cached)
+            else:
+                groups[key].append(chromosome)
+
+        keys = list(groups)
+        pending = [groups[key][0] for key in keys]
+
+        if self._pool is None or len(pending) < 2:
+            self.evaluator.evaluate_population(pending, hard_cutoff)
+            results = [
+                (c.fitness, c.is_feasible, c.hard_violations, c.soft_scores, c.conflict_details)
+                for c in pending
+            ]
+        else:
+            chunksize = max(1, len(pending) // (4 * self._pool_workers))
+            results = self._pool.map(
+                _evaluate_in_worker, pending, [hard_cutoff] * len(pending), chunksize=chunksize
+            )
+
+        for key, result in zip(keys, results):
+            for chromosome in groups[key]:
+                self._apply_evaluation(chromosome, result)
+            self._cache_evaluation(key, result)
+
+    @staticmethod
+    def _apply_evaluation(chromosome: Chromosome, result: tuple):
+        """Copy an evaluation result onto a chromosome (containers are copied, not shared)."""
+        fitness, is_feasible, hard_violations, soft_scores, conflict_details = result
+        chromosome.fitness = fitness
+        chromosome.is_feasible = is_feasible
+        chromosome.hard_violations = dict(hard_violations)
+        chromosome.soft_scores = dict(soft_scores)
+        chromosome.conflict_details = list(conflict_details)
+
+    def _cache_evaluation(self, key: int, result: tuple):
+        """Remember an evaluation result, evicting the least recently used entry when full."""
+        if self.config.fitness_cache_size <= 0:
+            return
+        if len(self._fitness_cache) >= self.config.fitness_cache_size:
+            del self._fitness_cache[next(iter(self._fitness_cache))]
+        self._fitness_cache[key] = result
+
+    @staticmethod
+    def _fitness_array(population: List[Chromosome]) -> np.ndarray:
+        """Fitness of each chromosome as an array (unevaluated counts as 0)."""
+        return np.fromiter((c.fitness or 0 for c in population), dtype=float, count=len(population))
+
+    def _tournament_selection(self, fitness: np.ndarray, count: int) -> np.ndarray:
+        """
+        Tournament selection: pick best from random subsets.
+
+        All tournaments are drawn in one batch; each tournament samples
+        without replacement, matching the original per-call behaviour.
+
         Args:
-            population: Population to select from
-        
+            fitness: Fitness of each population member
+            count: Number of tournaments to run
+
         Returns:
-            Selected chromosome
+            Population indices of the tournament winners
         """
-        tournament = random.sample(
-            population, 
-            min(self.config.tournament_size, len(population))
-        )
-        return max(tournament, key=lambda c: c.fitness or 0)
-    
+        size = min(self.config.tournament_size, len(fitness))
+        contestants = self.rng.random((count, len(fitness))).argsort(axis=1)[:, :size]
+        best = fitness[contestants].argmax(axis=1)
+        return contestants[np.arange(count), best]
+
     def _log(self, message: str):
         """Log message if logging enabled."""
         print(f"[GA] {message}")
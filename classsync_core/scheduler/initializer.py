@@ -2,12 +2,70 @@
 Population Initializer - Creates initial population of chromosomes.
 Uses both random and heuristic-seeded initialization.
 """
+import numpy as np
 import pandas as pd
-import random
-from typing import List
+from functools import reduce
+from math import gcd
+from typing import List, Optional
 from classsync_core.scheduler.chromosome import Chromosome, Gene
 from classsync_core.scheduler.config import GAConfig
-from classsync_core.utils import calculate_slot_end_time, time_to_minutes, slots_overlap
+from classsync_core.utils import calculate_slot_end_time, time_to_minutes
+
+
+class OccupancyMap:
+    """
+    Reusable teacher/section/room occupancy bitsets for greedy placement.
+
+    Each resource keeps one integer bitset per day with a bit per ``unit``
+    minutes since midnight, indexed by dense resource and day IDs. Checking
+    or booking an interval is a single AND/OR against the interval's mask.
+    ``unit`` must divide every start and end time booked; the coarser it is,
+    the smaller (and faster) the bitsets.
+    """
+
+    def __init__(self, n_teachers: int, n_sections: int, n_rooms: int, n_days: int, unit: int = 1):
+        self.n_teachers = n_teachers
+        self.n_sections = n_sections
+        self.n_rooms = n_rooms
+        self.n_days = n_days
+        self.unit = unit
+        self.reset()
+
+    def reset(self):
+        """Clear all bookings."""
+        self.teachers = [[0] * self.n_days for _ in range(self.n_teachers)]
+        self.sections = [[0] * self.n_days for _ in range(self.n_sections)]
+        self.rooms = [[0] * self.n_days for _ in range(self.n_rooms)]
+
+    def interval_mask(self, start: int, end: int) -> int:
+        """Bitset with the units covering minutes [start, end) set."""
+        unit = self.unit
+        return ((1 << max((end - start) // unit, 0)) - 1) << (start // unit)
+
+    def first_free_room(
+        self, teacher: int, section: int, rooms: List[int], day: int, start: int, end: int
+    ) -> Optional[int]:
+        """
+        Position in ``rooms`` of the first room free in [start, end), or None.
+
+        Teacher and section availability do not depend on the room, so they
+        are tested once before scanning the candidate rooms.
+        """
+        mask = self.interval_mask(start, end)
+        if (self.teachers[teacher][day] | self.sections[section][day]) & mask:
+            return None
+
+        for pos, room in enumerate(rooms):
+            if not self.rooms[room][day] & mask:
+                return pos
+        return None
+
+    def book(self, teacher: int, section: int, room: int, day: int, start: int, end: int):
+        """Mark [start, end) as occupied for the teacher, section and room."""
+        mask = self.interval_mask(start, end)
+        self.teachers[teacher][day] |= mask
+        self.sections[section][day] |= mask
+        self.rooms[room][day] |= mask
 
 
 class PopulationInitializer:
@@ -17,12 +75,17 @@ class PopulationInitializer:
         config: GAConfig,
         sessions_df: pd.DataFrame,
         rooms_df: pd.DataFrame,
-        locked_assignments: list = None
+        locked_assignments: list = None,
+        rng: Optional[np.random.Generator] = None
     ):
         self.config = config
-        self.sessions_df = sessions_df
+        # Positional index doubles as each session's integer UID
+        self.sessions_df = sessions_df.reset_index(drop=True)
+        # Plain dict rows for the per-chromosome loops (avoids a Series per iterrows row)
+        self.sessions = self.sessions_df.to_dict('records')
         self.rooms_df = rooms_df
         self.locked_assignments = locked_assignments or []
+        self.rng = rng if rng is not None else np.random.default_rng()
 
         # Build locked assignments map for quick lookup
         self.locked_map = {la['session_key']: la for la in self.locked_assignments}
@@ -36,9 +99,84 @@ class PopulationInitializer:
             ~rooms_df['Room_Type'].str.lower().str.contains('lab')
         ]['Room_Code'].tolist()
 
+        self.all_rooms = rooms_df['Room_Code'].tolist()
+
+        # Room pool per session type, falling back to all rooms if a type has none
+        self.lab_room_pool = self.lab_rooms or self.all_rooms
+        self.theory_room_pool = self.theory_rooms or self.all_rooms
+
+        # Session type as a small integer (0=theory, 1=lab) indexing its room pool
+        self.rooms_by_type = (self.theory_room_pool, self.lab_room_pool)
+        self.session_types = self.sessions_df['Is_Lab'].astype(int).tolist() if len(self.sessions_df) else []
+
+        # Room code -> room ID lookup (avoids a DataFrame filter per assignment)
+        if 'Room_ID' in rooms_df.columns:
+            self.room_ids = dict(zip(rooms_df['Room_Code'].tolist(), rooms_df['Room_ID'].tolist()))
+        else:
+            self.room_ids = {code: hash(code) % 10000 for code in rooms_df['Room_Code']}
+        self.room_codes = {room_id: code for code, room_id in self.room_ids.items()}
+
         # All allowed time slots
         self.time_slots = self._generate_time_slots()
 
+        # Dense indexes into the heuristic's occupancy grids
+        self.teacher_index = {t: i for i, t in enumerate(self.sessions_df['Teacher_ID'].unique())}
+        self.section_index = {s: i for i, s in enumerate(self.sessions_df['Section_ID'].unique())}
+        self.room_index = {code: i for i, code in enumerate(rooms_df['Room_Code'])}
+        self.day_index = {day: i for i, day in enumerate(config.working_days)}
+        for lock in self.locked_assignments:
+            self.day_index.setdefault(lock['day'], len(self.day_index))
+
+        # Created on the first heuristic chromosome, then reset and reused
+        self._occupancy = None
+
+        # Slots that fit each session duration, filled in on first use
+        self._random_slots_by_duration = {}
+        self._heuristic_slots_by_duration = {}
+
+        # Greedy placement order is the same for every heuristic chromosome
+        self.placement_order = self._most_constrained_first()
+
+
+    def _choice(self, options: list):
+        """Pick a uniformly random element using the shared generator."""
+        return options[self.rng.integers(len(options))]
+
+
+    def _heuristic_slots(self, duration: int, day_end_minutes: int) -> List[tuple]:
+        """
+        (day, start_time, day_idx, start_min, end_min, blocked) for every slot
+        a session of this duration fits in, computed once per duration.
+        """
+        slots = self._heuristic_slots_by_duration.get(duration)
+        if slots is not None:
+            return slots
+
+        # Filter valid slots for this duration
+        fitting = []
+        for day, start in self.time_slots:
+            end_time = calculate_slot_end_time(start, duration)
+            if time_to_minutes(end_time) <= day_end_minutes:
+                fitting.append((day, start, end_time))
+
+        if not fitting:
+            # Fallback
+            fitting = [
+                (d, s, calculate_slot_end_time(s, duration))
+                for d, s in self.time_slots
+            ]
+
+        slots = [
+            (
+                day, start_time, self.day_index[day],
+                time_to_minutes(start_time), time_to_minutes(end_time),
+                self.config.is_blocked(day, start_time, end_time)
+            )
+            for day, start_time, end_time in fitting
+        ]
+        self._heuristic_slots_by_duration[duration] = slots
+        return slots
+
 
     def _generate_time_slots(self) -> List[tuple]:
         """Generate all valid (day, start_time) combinations."""
@@ -91,41 +229,38 @@ class PopulationInitializer:
         genes = []
         day_end_minutes = time_to_minutes(self.config.day_end_time)
 
-        for _, session in self.sessions_df.iterrows():
+        for uid, session in enumerate(self.sessions):
             session_key = session['Session_Key']
             duration = session['Duration_Minutes']
 
             # Check if this session has a locked assignment
             if session_key in self.locked_map:
-                gene = self._create_locked_gene(session, self.locked_map[session_key])
+                gene = self._create_locked_gene(session, self.locked_map[session_key], uid)
                 genes.append(gene)
                 continue
 
-            # Filter valid slots for this duration
-            valid_slots = []
-            for day, start in self.time_slots:
-                end_time = calculate_slot_end_time(start, duration)
-                if time_to_minutes(end_time) <= day_end_minutes:
-                    valid_slots.append((day, start))
+            # Valid slots for this duration (computed once per duration)
+            valid_slots = self._random_slots_by_duration.get(duration)
+            if valid_slots is None:
+                valid_slots = []
+                for day, start in self.time_slots:
+                    end_time = calculate_slot_end_time(start, duration)
+                    if time_to_minutes(end_time) <= day_end_minutes:
+                        valid_slots.append((day, start))
 
-            # If no valid slots (unlikely but possible for very long sessions), fall back to all
-            if not valid_slots:
-                valid_slots = self.time_slots
+                # If no valid slots (unlikely but possible for very long sessions), fall back to all
+                if not valid_slots:
+                    valid_slots = self.time_slots
+                self._random_slots_by_duration[duration] = valid_slots
 
             # Random day and time
-            day, start_time = random.choice(valid_slots)
+            day, start_time = self._choice(valid_slots)
 
             # Random room (appropriate type)
-            if session['Is_Lab']:
-                room_code = random.choice(self.lab_rooms) if self.lab_rooms else random.choice(
-                    self.rooms_df['Room_Code'].tolist())
-            else:
-                room_code = random.choice(self.theory_rooms) if self.theory_rooms else random.choice(
-                    self.rooms_df['Room_Code'].tolist())
+            room_code = self._choice(self.rooms_by_type[self.session_types[uid]])
 
             # Find room ID
-            room_row = self.rooms_df[self.rooms_df['Room_Code'] == room_code].iloc[0]
-            room_id = room_row.get('Room_ID', hash(room_code) % 10000)
+            room_id = self.room_ids[room_code]
 
             # Create gene
             gene = Gene(
@@ -140,6 +275,7 @@ class PopulationInitializer:
                 duration_minutes=session['Duration_Minutes'],
                 is_lab=session['Is_Lab'],
                 session_number=session['Session_Number'],
+                session_uid=uid,
                 day=day,
                 start_time=start_time,
                 room_id=room_id,
@@ -150,7 +286,7 @@ class PopulationInitializer:
 
         return Chromosome(genes)
 
-    def _create_locked_gene(self, session, lock: dict) -> Gene:
+    def _create_locked_gene(self, session, lock: dict, uid: int) -> Gene:
         """Create a gene with locked attributes from a lock assignment."""
         day = lock['day']
         start_time = lock['start_time']
@@ -160,20 +296,12 @@ class PopulationInitializer:
 
         # If room is specified in lock, use it
         if room_id is not None:
-            room_rows = self.rooms_df[self.rooms_df['Room_ID'] == room_id]
-            if not room_rows.empty:
-                room_code = room_rows.iloc[0]['Room_Code']
+            room_code = self.room_codes.get(room_id)
 
         # If no room specified or not found, assign appropriate room type
         if room_code is None:
-            if session['Is_Lab']:
-                room_code = random.choice(self.lab_rooms) if self.lab_rooms else \
-                    random.choice(self.rooms_df['Room_Code'].tolist())
-            else:
-                room_code = random.choice(self.theory_rooms) if self.theory_rooms else \
-                    random.choice(self.rooms_df['Room_Code'].tolist())
-            room_row = self.rooms_df[self.rooms_df['Room_Code'] == room_code].iloc[0]
-            room_id = room_row.get('Room_ID', hash(room_code) % 10000)
+            room_code = self._choice(self.rooms_by_type[self.session_types[uid]])
+            room_id = self.room_ids[room_code]
 
         return Gene(
             session_key=session['Session_Key'],
@@ -187,6 +315,7 @@ class PopulationInitializer:
             duration_minutes=session['Duration_Minutes'],
             is_lab=session['Is_Lab'],
             session_number=session['Session_Number'],
+            session_uid=uid,
             day=day,
             start_time=start_time,
             room_id=room_id,
@@ -200,60 +329,90 @@ class PopulationInitializer:
         )
 
 
+    def _most_constrained_first(self) -> List[int]:
+        """
+        UIDs of non-locked sessions ordered for greedy placement.
+
+        Labs first, then longer sessions, then sessions whose teacher and
+        section carry the most weekly minutes (fewest free slots left).
+        """
+        teacher_load = self.sessions_df.groupby('Teacher_ID')['Duration_Minutes'].transform('sum').tolist()
+        section_load = self.sessions_df.groupby('Section_ID')['Duration_Minutes'].transform('sum').tolist()
+
+        remaining_uids = [
+            uid for uid, session in enumerate(self.sessions)
+            if session['Session_Key'] not in self.locked_map
+        ]
+        remaining_uids.sort(key=lambda uid: (
+            not self.sessions[uid]['Is_Lab'],
+            -self.sessions[uid]['Duration_Minutes'],
+            -teacher_load[uid],
+            -section_load[uid]
+        ))
+        return remaining_uids
+
+
+    def _time_unit(self) -> int:
+        """
+        Largest minute granularity that all start times and durations align to.
+
+        Typically the configured slot length (e.g. 30), so occupancy bitsets
+        need one bit per slot instead of one per minute.
+        """
+        minutes = [time_to_minutes(t) for t in self.config.allowed_start_times]
+        minutes += [time_to_minutes(lock['start_time']) for lock in self.locked_assignments]
+        minutes += [int(d) for d in self.sessions_df['Duration_Minutes'].unique()] if len(self.sessions_df) else []
+        return reduce(gcd, minutes, 0) or 1
+
+
     def _create_heuristic_chromosome(self) -> Chromosome:
         """
         Create chromosome using greedy heuristic.
         Places sessions one-by-one avoiding conflicts.
         Locked assignments are placed first with their fixed values.
+        Genes are returned in session UID order like every other chromosome.
         """
         genes = []
         day_end_minutes = time_to_minutes(self.config.day_end_time)
 
-        # Track used resources with time ranges
-        # Structure: {id: {day: [(start, end)]}}
-        teacher_schedule = {}
-        section_schedule = {}
-        room_schedule = {}  # Added room schedule tracking
+        # Track used resources on reusable occupancy grids
+        if self._occupancy is None:
+            self._occupancy = OccupancyMap(
+                len(self.teacher_index), len(self.section_index),
+                len(self.room_index), len(self.day_index),
+                unit=self._time_unit()
+            )
+        occupancy = self._occupancy
+        occupancy.reset()
 
         # STEP 1: Place locked assignments first
-        for _, session in self.sessions_df.iterrows():
+        for uid, session in enumerate(self.sessions):
             session_key = session['Session_Key']
             if session_key in self.locked_map:
                 lock = self.locked_map[session_key]
-                gene = self._create_locked_gene(session, lock)
+                gene = self._create_locked_gene(session, lock, uid)
                 genes.append(gene)
 
                 # Register locked slots as occupied
-                self._add_booking(teacher_schedule, session['Teacher_ID'], gene.day, gene.start_time, gene.end_time)
-                self._add_booking(section_schedule, session['Section_ID'], gene.day, gene.start_time, gene.end_time)
-                if gene.room_id:
-                    self._add_booking(room_schedule, gene.room_code, gene.day, gene.start_time, gene.end_time)
-
-        # Sort remaining (non-locked) sessions by constraint difficulty (labs first, then longer durations)
-        locked_keys = set(self.locked_map.keys())
-        remaining_sessions = self.sessions_df[~self.sessions_df['Session_Key'].isin(locked_keys)]
-        sessions = remaining_sessions.sort_values(
-            by=['Is_Lab', 'Duration_Minutes'],
-            ascending=[False, False]
-        )
+                occupancy.book(
+                    self.teacher_index[session['Teacher_ID']],
+                    self.section_index[session['Section_ID']],
+                    self.room_index[gene.room_code],
+                    self.day_index[gene.day],
+                    gene.start_minutes,
+                    gene.end_minutes
+                )
 
-        # STEP 2: Place remaining sessions avoiding conflicts
-        for _, session in sessions.iterrows():
+        # STEP 2: Place remaining sessions avoiding conflicts, most constrained first
+        for uid in self.placement_order:
+            session = self.sessions[uid]
             duration = session['Duration_Minutes']
             
-            # Filter valid slots for this duration
-            valid_slots = []
-            for day, start in self.time_slots:
-                end_time = calculate_slot_end_time(start, duration)
-                if time_to_minutes(end_time) <= day_end_minutes:
-                    valid_slots.append((day, start, end_time))
-            
-            if not valid_slots:
-                # Fallback
-                valid_slots = [
-                    (d, s, calculate_slot_end_time(s, duration)) 
-                    for d, s in self.time_slots
-                ]
+            teacher_idx = self.teacher_index[session['Teacher_ID']]
+            section_idx = self.section_index[session['Section_ID']]
+
+            # Valid slots for this duration, with their minutes and blocked status
+            valid_slots = self._heuristic_slots(duration, day_end_minutes)
 
             # Try to find valid slot
             valid_slot_found = False
@@ -261,79 +420,62 @@ class PopulationInitializer:
             max_attempts = 50
 
             # Get available rooms
-            available_rooms = self.lab_rooms if session['Is_Lab'] else self.theory_rooms
-            if not available_rooms:
-                available_rooms = self.rooms_df['Room_Code'].tolist()
-
-            random.shuffle(available_rooms)
+            available_rooms = self.rooms_by_type[self.session_types[uid]]
+            available_rooms = [available_rooms[i] for i in self.rng.permutation(len(available_rooms))]
+            room_idxs = [self.room_index[code] for code in available_rooms]
 
             while not valid_slot_found and attempts < max_attempts:
                 attempts += 1
 
                 # Pick random day and time
-                day, start_time, end_time = random.choice(valid_slots)
+                day, start_time, day_idx, start_min, end_min, blocked = self._choice(valid_slots)
 
                 # Check if blocked
-                if self.config.is_blocked(day, start_time, end_time):
+                if blocked:
                     continue
 
-                # Try each room
-                for room_code in available_rooms:
-                    room_row = self.rooms_df[self.rooms_df['Room_Code'] == room_code].iloc[0]
-                    room_id = room_row.get('Room_ID', hash(room_code) % 10000)
-
-                    # 1. Check Room Conflict
-                    if self._has_overlap(room_schedule, room_code, day, start_time, end_time):
-                        continue
-
-                    # 2. Check Teacher Conflict
-                    teacher_id = session['Teacher_ID']
-                    if self._has_overlap(teacher_schedule, teacher_id, day, start_time, end_time):
-                        continue
-
-                    # 3. Check Section Conflict
-                    section_id = session['Section_ID']
-                    if self._has_overlap(section_schedule, section_id, day, start_time, end_time):
-                        continue
-
-                    # Valid placement found!
-                    gene = Gene(
-                        session_key=session['Session_Key'],
-                        course_id=session['Course_ID'],
-                        course_code=session['Course_Code'],
-                        course_name=session['Course_Name'],
-                        section_id=session['Section_ID'],
-                        section_code=session['Section_Code'],
-                        teacher_id=teacher_id,
-                        teacher_name=session['Instructor'],
-                        duration_minutes=session['Duration_Minutes'],
-                        is_lab=session['Is_Lab'],
-                        session_number=session['Session_Number'],
-                        day=day,
-                        start_time=start_time,
-                        room_id=room_id,
-                        room_code=room_code
-                    )
-
-                    genes.append(gene)
-
-                    # Update schedules
-                    self._add_booking(teacher_schedule, teacher_id, day, start_time, end_time)
-                    self._add_booking(section_schedule, section_id, day, start_time, end_time)
-                    self._add_booking(room_schedule, room_code, day, start_time, end_time)
-
-                    valid_slot_found = True
-                    break
-
-                if valid_slot_found:
-                    break
+                # Find the first room with no room, teacher or section conflict
+                room_pos = occupancy.first_free_room(
+                    teacher_idx, section_idx, room_idxs, day_idx, start_min, end_min
+                )
+                if room_pos is None:
+                    continue
+
+                room_code = available_rooms[room_pos]
+                room_id = self.room_ids[room_code]
+
+                # Valid placement found!
+                gene = Gene(
+                    session_key=session['Session_Key'],
+                    course_id=session['Course_ID'],
+                    course_code=session['Course_Code'],
+                    course_name=session['Course_Name'],
+                    section_id=session['Section_ID'],
+                    section_code=session['Section_Code'],
+                    teacher_id=session['Teacher_ID'],
+                    teacher_name=session['Instructor'],
+                    duration_minutes=session['Duration_Minutes'],
+                    is_lab=session['Is_Lab'],
+                    session_number=session['Session_Number'],
+                    session_uid=uid,
+                    day=day,
+                    start_time=start_time,
+                    room_id=room_id,
+                    room_code=room_code
+                )
+
+                genes.append(gene)
+
+                # Update schedules
+                occupancy.book(teacher_idx, section_idx, room_idxs[room_pos], day_idx, start_min, end_min)
+
+                valid_slot_found = True
 
             # If no valid slot found after max attempts, add with random assignment
             if not valid_slot_found:
-                day, start_time, end_time = random.choice(valid_slots)
-                room_code = random.choice(available_rooms)
-                room_row = self.rooms_df[self.rooms_df['Room_Code'] == room_code].iloc[0]
-                room_id = room_row.get('Room_ID', hash(room_code) % 10000)
+                day, start_time, *_ = self._choice(valid_slots)
+                room_code = self._choice(available_rooms)
+                room_id = self.room_ids[room_code]
 
                 gene = Gene(
                     session_key=session['Session_Key'],
@@ -347,6 +489,7 @@ class PopulationInitializer:
                     duration_minutes=session['Duration_Minutes'],
                     is_lab=session['Is_Lab'],
                     session_number=session['Session_Number'],
+                    session_uid=uid,
                     day=day,
                     start_time=start_time,
                     room_id=room_id,
@@ -354,25 +497,7 @@ class PopulationInitializer:
                 )
                 genes.append(gene)
 
-        return Chromosome(genes)
+        # Placement order differs from session order; restore canonical order
+        genes.sort(key=lambda g: g.session_uid)
 
-    def _has_overlap(self, schedule_dict, resource_id, day, start, end):
-        """Check if resource has overlap in schedule."""
-        if resource_id not in schedule_dict:
-            return False
-        if day not in schedule_dict[resource_id]:
-            return False
-        
-        for booked_start, booked_end in schedule_dict[resource_id][day]:
-            if slots_overlap(start, end, booked_start, booked_end):
-                return True
-        return False
-
-    def _add_booking(self, schedule_dict, resource_id, day, start, end):
-        """Add booking to schedule."""
-        if resource_id not in schedule_dict:
-            schedule_dict[resource_id] = {}
-        if day not in schedule_dict[resource_id]:
-            schedule_dict[resource_id][day] = []
-        
-        schedule_dict[resource_id][day].append((start, end))
\ No newline at end of file
+        return Chromosome(genes)
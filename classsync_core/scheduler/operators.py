@@ -1,17 +1,19 @@
 """
 Genetic Operators - Mutation and Crossover implementations.
 """
-import random
-from typing import List, Tuple
-from copy import deepcopy
+import numpy as np
+from typing import List, Tuple, Optional
 from classsync_core.scheduler.chromosome import Chromosome, Gene
 from classsync_core.scheduler.config import GAConfig
 from classsync_core.utils import calculate_slot_end_time, time_to_minutes
 class GeneticOperators:
 
-    def __init__(self, config: GAConfig, rooms_df):
+    MUTATION_TYPES = ('time_swap', 'day_swap', 'room_swap', 'time_shift')
+
+    def __init__(self, config: GAConfig, rooms_df, rng: Optional[np.random.Generator] = None):
         self.config = config
         self.rooms_df = rooms_df
+        self.rng = rng if rng is not None else np.random.default_rng()
 
         # Room lists
         self.lab_rooms = rooms_df[
@@ -24,6 +26,18 @@ class GeneticOperators:
 
         self.all_rooms = rooms_df['Room_Code'].tolist()
 
+        # Room list per session type, indexed by int(is_lab)
+        self.rooms_by_type = (self.theory_rooms, self.lab_rooms)
+
+        # Room code -> room ID lookup (avoids a DataFrame filter per assignment)
+        if 'Room_ID' in rooms_df.columns:
+            self.room_ids = dict(zip(rooms_df['Room_Code'].tolist(), rooms_df['Room_ID'].tolist()))
+        else:
+            self.room_ids = {code: hash(code) % 10000 for code in rooms_df['Room_Code']}
+
+        # Start times that fit within the day, cached per session duration
+        self._fitting_starts = {}
+
         # Time slots (valid combinations)
         self.time_slots = []
         for day in config.working_days:
@@ -31,6 +45,22 @@ class GeneticOperators:
                 self.time_slots.append((day, start_time))
 
 
+    def _choice(self, options: list):
+        """Pick a uniformly random element using the shared generator."""
+        return options[self.rng.integers(len(options))]
+
+
+    def _starts_fitting_day(self, duration_minutes: int) -> List[str]:
+        """Allowed start times at which a session of this duration ends by day end."""
+        if duration_minutes not in self._fitting_starts:
+            day_end_minutes = time_to_minutes(self.config.day_end_time)
+            self._fitting_starts[duration_minutes] = [
+                t for t in self.config.allowed_start_times
+                if time_to_minutes(calculate_slot_end_time(t, duration_minutes)) <= day_end_minutes
+            ]
+        return self._fitting_starts[duration_minutes]
+
+
     def crossover(
             self,
             parent1: Chromosome,
@@ -47,7 +77,7 @@ class GeneticOperators:
         Returns:
             Two offspring chromosomes
         """
-        if method == 'day_based' or random.random() < self.config.day_based_crossover_ratio:
+        if method == 'day_based' or self.rng.random() < self.config.day_based_crossover_ratio:
             return self._day_based_crossover(parent1, parent2)
         else:
             return self._uniform_crossover(parent1, parent2)
@@ -65,84 +95,39 @@ class GeneticOperators:
         IMPORTANT: Locked genes are always copied from parent1 and restored
         to their locked values to ensure lock integrity.
         """
-        # Build lookup for locked genes from parent1 (authoritative source)
-        locked_genes_p1 = {g.session_key: g for g in parent1.genes if g.is_locked}
-
         # Randomly split days
-        days = self.config.working_days[:]
-        random.shuffle(days)
+        days = list(self.rng.permutation(self.config.working_days))
         split_point = len(days) // 2
 
         days_from_p1 = set(days[:split_point])
         days_from_p2 = set(days[split_point:])
 
-        # Create offspring 1
-        child1_genes = []
-        child1_keys = set()
+        # Parents share UID order, so both children are filled position by
+        # position in a single pass over preallocated lists
+        n = len(parent1.genes)
+        child1_genes = [None] * n
+        child2_genes = [None] * n
 
-        # First: Add all locked genes from parent1 (never from parent2)
-        for gene in parent1.genes:
-            if gene.is_locked:
-                new_gene = deepcopy(gene)
-                new_gene.restore_lock()  # Ensure locked values are restored
-                child1_genes.append(new_gene)
-                child1_keys.add(gene.session_key)
-
-        # Then: Add non-locked genes based on day split
-        for gene in parent1.genes:
-            if gene.session_key in child1_keys:
-                continue  # Already added as locked
-            if gene.day in days_from_p1:
-                child1_genes.append(deepcopy(gene))
-                child1_keys.add(gene.session_key)
-
-        for gene in parent2.genes:
-            if gene.session_key in child1_keys:
-                continue  # Already added
-            if gene.day in days_from_p2:
-                child1_genes.append(deepcopy(gene))
-                child1_keys.add(gene.session_key)
-
-        # Fill any missing genes from parent1
-        for gene in parent1.genes:
-            if gene.session_key not in child1_keys:
-                child1_genes.append(deepcopy(gene))
-                child1_keys.add(gene.session_key)
-
-        # Create offspring 2 (opposite day assignment)
-        child2_genes = []
-        child2_keys = set()
-
-        # First: Add all locked genes from parent1
-        for gene in parent1.genes:
-            if gene.is_locked:
-                new_gene = deepcopy(gene)
-                new_gene.restore_lock()
-                child2_genes.append(new_gene)
-                child2_keys.add(gene.session_key)
-
-        # Then: Add non-locked genes based on opposite day split
-        for gene in parent2.genes:
-            if gene.session_key in child2_keys:
+        for i, (gene1, gene2) in enumerate(zip(parent1.genes, parent2.genes)):
+            # Locked genes: always parent1's version with lock restored
+            if gene1.is_locked:
+                child1_genes[i] = self._copy_locked(gene1)
+                child2_genes[i] = self._copy_locked(gene1)
                 continue
-            if gene.day in days_from_p1:
-                child2_genes.append(deepcopy(gene))
-                child2_keys.add(gene.session_key)
 
-        for gene in parent1.genes:
-            if gene.session_key in child2_keys:
-                continue
-            if gene.day in days_from_p2:
-                child2_genes.append(deepcopy(gene))
-                child2_keys.add(gene.session_key)
+            # Child 1: P1's days, then P2's days, falling back to P1
+            if gene1.day in days_from_p1 or gene2.day not in days_from_p2:
+                child1_genes[i] = gene1.__copy__()
+            else:
+                child1_genes[i] = gene2.__copy__()
 
-        # Fill any missing genes from parent1
-        for gene in parent1.genes:
-            if gene.session_key not in child2_keys:
-                child2_genes.append(deepcopy(gene))
-                child2_keys.add(gene.session_key)
+            # Child 2: opposite assignment, falling back to P1
+            if gene2.day in days_from_p1:
+                child2_genes[i] = gene2.__copy__()
+            else:
+                child2_genes[i] = gene1.__copy__()
 
-        return Chromosome(child1_genes), Chromosome(child2_genes)
+        return self._children(parent1, child1_genes, child2_genes)
 
 
     def _uniform_crossover(
@@ -156,34 +141,44 @@ class GeneticOperators:
         IMPORTANT: Locked genes are always copied from parent1 and restored
         to their locked values. Non-locked genes are randomly inherited.
         """
-        child1_genes = []
-        child2_genes = []
-
-        for i in range(len(parent1.genes)):
-            gene1 = parent1.genes[i]
+        n = len(parent1.genes)
+        child1_genes = [None] * n
+        child2_genes = [None] * n
+        take_p1 = self.rng.random(n) < 0.5
 
+        for i, (gene1, gene2) in enumerate(zip(parent1.genes, parent2.genes)):
             # For locked genes: always use parent1's version and restore lock
             if gene1.is_locked:
-                new_gene1 = deepcopy(gene1)
-                new_gene1.restore_lock()
-                child1_genes.append(new_gene1)
-
-                new_gene2 = deepcopy(gene1)
-                new_gene2.restore_lock()
-                child2_genes.append(new_gene2)
+                child1_genes[i] = self._copy_locked(gene1)
+                child2_genes[i] = self._copy_locked(gene1)
+            elif take_p1[i]:
+                child1_genes[i] = gene1.__copy__()
+                child2_genes[i] = gene2.__copy__()
             else:
-                # For non-locked genes: random inheritance
-                if random.random() < 0.5:
-                    child1_genes.append(deepcopy(parent1.genes[i]))
-                    child2_genes.append(deepcopy(parent2.genes[i]))
-                else:
-                    child1_genes.append(deepcopy(parent2.genes[i]))
-                    child2_genes.append(deepcopy(parent1.genes[i]))
+                child1_genes[i] = gene2.__copy__()
+                child2_genes[i] = gene1.__copy__()
 
-        return Chromosome(child1_genes), Chromosome(child2_genes)
+        return self._children(parent1, child1_genes, child2_genes)
+
+
+    @staticmethod
+    def _children(parent: Chromosome, genes1: List[Gene], genes2: List[Gene]) -> Tuple[Chromosome, Chromosome]:
+        """Wrap offspring genes, sharing the parent's per-session lookups (same sessions, same order)."""
+        child1, child2 = Chromosome(genes1), Chromosome(genes2)
+        child1.inherit_session_lookups(parent)
+        child2.inherit_session_lookups(parent)
+        return child1, child2
+
+
+    @staticmethod
+    def _copy_locked(gene: Gene) -> Gene:
+        """Copy a locked gene and restore its locked values."""
+        new_gene = gene.__copy__()
+        new_gene.restore_lock()
+        return new_gene
 
 
-    def mutate(self, chromosome: Chromosome, generation: int) -> Chromosome:
+    def mutate(self, chromosome: Chromosome, generation: int, in_place: bool = False) -> Chromosome:
         """
         Apply mutation to chromosome.
         Mutation rate decreases over generations.
@@ -192,121 +187,124 @@ class GeneticOperators:
         Args:
             chromosome: Chromosome to mutate
             generation: Current generation number
+            in_place: Mutate the given chromosome's genes rather than a copy;
+                for offspring the caller already owns, saving one Gene
+                allocation per session
 
         Returns:
             Mutated chromosome
         """
         mutation_rate = self.config.get_mutation_rate(generation)
 
-        mutated = chromosome.copy()
+        mutated = chromosome if in_place else chromosome.copy()
+        genes = mutated.genes
+
+        # Draw mutation sites and types for the whole chromosome in one batch
+        sites = np.flatnonzero(self.rng.random(len(genes)) < mutation_rate)
+        kinds = self.rng.integers(0, len(self.MUTATION_TYPES), size=len(sites))
+
+        # Decide every mutation first, then apply them in two batched passes
+        time_sites, new_days, new_starts = [], [], []
+        room_sites, new_rooms = [], []
+
+        for i, kind in zip(sites, kinds):
+            gene = genes[i]
 
-        for i, gene in enumerate(mutated.genes):
             # Skip locked genes - they cannot be mutated
             if gene.is_locked:
                 continue
 
-            if random.random() < mutation_rate:
-                # Choose random mutation type
-                mutation_type = random.choice([
-                    'time_swap', 'day_swap', 'room_swap', 'time_shift'
-                ])
-
-                if mutation_type == 'time_swap':
-                    mutated.genes[i] = self._mutate_time_swap(gene)
-                elif mutation_type == 'day_swap':
-                    mutated.genes[i] = self._mutate_day_swap(gene)
-                elif mutation_type == 'room_swap':
-                    mutated.genes[i] = self._mutate_room_swap(gene)
-                elif mutation_type == 'time_shift':
-                    mutated.genes[i] = self._mutate_time_shift(gene)
+            mutation_type = self.MUTATION_TYPES[kind]
+
+            if mutation_type == 'room_swap':
+                new_room = self._mutate_room_swap(gene)
+                if new_room is not None:
+                    room_sites.append(i)
+                    new_rooms.append(new_room)
+                continue
+
+            if mutation_type == 'time_swap':
+                new_time = self._mutate_time_swap(gene)
+            elif mutation_type == 'day_swap':
+                new_time = self._mutate_day_swap(gene)
+            else:
+                new_time = self._mutate_time_shift(gene)
+
+            if new_time is not None:
+                time_sites.append(i)
+                new_days.append(new_time[0])
+                new_starts.append(new_time[1])
+
+        # The chromosome is private to this call (or owned by the caller when
+        # in_place), so genes are updated in place
+        for i, day, start in zip(time_sites, new_days, new_starts):
+            genes[i].update_time(day, start)
+
+        for i, (room_id, room_code) in zip(room_sites, new_rooms):
+            genes[i].update_room(room_id, room_code)
+
+        # Only chromosomes whose genes actually changed need rescoring
+        if time_sites or room_sites:
+            mutated.reset_evaluation()
 
         return mutated
 
 
-    def _mutate_time_swap(self, gene: Gene) -> Gene:
+    def _mutate_time_swap(self, gene: Gene) -> Optional[Tuple[str, str]]:
         """Change to different allowed start time on same day."""
-        new_gene = deepcopy(gene)
-        day_end_minutes = time_to_minutes(self.config.day_end_time)
-
-        # Pick different start time
-        available_times = []
-        for t in self.config.allowed_start_times:
-            if t != gene.start_time:
-                # Check if this start time fits within the day
-                end_time = calculate_slot_end_time(t, gene.duration_minutes)
-                if time_to_minutes(end_time) <= day_end_minutes:
-                    available_times.append(t)
+        # Pick different start time that fits within the day
+        available_times = [
+            t for t in self._starts_fitting_day(gene.duration_minutes)
+            if t != gene.start_time
+        ]
         
         if not available_times:
-            return new_gene
+            return None
 
-        new_start = random.choice(available_times)
-        new_gene.update_time(gene.day, new_start)
-
-        return new_gene
+        return gene.day, self._choice(available_times)
 
 
-    def _mutate_day_swap(self, gene: Gene) -> Gene:
+    def _mutate_day_swap(self, gene: Gene) -> Optional[Tuple[str, str]]:
         """Move session to different day, same time."""
-        new_gene = deepcopy(gene)
-
         # Pick different day
         available_days = [d for d in self.config.working_days if d != gene.day]
         if not available_days:
-            return new_gene
+            return None
 
-        new_day = random.choice(available_days)
-        new_gene.update_time(new_day, gene.start_time)
-
-        return new_gene
+        return self._choice(available_days), gene.start_time
 
 
-    def _mutate_room_swap(self, gene: Gene) -> Gene:
+    def _mutate_room_swap(self, gene: Gene) -> Optional[Tuple[int, str]]:
         """Assign different room of appropriate type."""
-        new_gene = deepcopy(gene)
-
         # Get appropriate room list
-        if gene.is_lab:
-            available_rooms = [r for r in self.lab_rooms if r != gene.room_code]
-        else:
-            available_rooms = [r for r in self.theory_rooms if r != gene.room_code]
+        available_rooms = [r for r in self.rooms_by_type[int(gene.is_lab)] if r != gene.room_code]
 
         if not available_rooms:
             available_rooms = [r for r in self.all_rooms if r != gene.room_code]
 
         if not available_rooms:
-            return new_gene
-
-        new_room_code = random.choice(available_rooms)
-        room_row = self.rooms_df[self.rooms_df['Room_Code'] == new_room_code].iloc[0]
-        new_room_id = room_row.get('Room_ID', hash(new_room_code) % 10000)
+            return None
 
-        new_gene.update_room(new_room_id, new_room_code)
+        new_room_code = self._choice(available_rooms)
+        return self.room_ids[new_room_code], new_room_code
 
-        return new_gene
 
-
-    def _mutate_time_shift(self, gene: Gene) -> Gene:
+    def _mutate_time_shift(self, gene: Gene) -> Optional[Tuple[str, str]]:
         """Shift to adjacent time slot (±1 slot) if valid."""
-        new_gene = deepcopy(gene)
-        day_end_minutes = time_to_minutes(self.config.day_end_time)
-
-        # Find current index in allowed times
-        try:
-            current_idx = self.config.allowed_start_times.index(gene.start_time)
-        except ValueError:
-            return new_gene
+        # Find current index in allowed times (dict lookup, not a list scan)
+        current_idx = self.config.start_time_index(gene.start_time)
+        if current_idx is None:
+            return None
 
         # Try shift up or down
-        shift = random.choice([-1, 1])
+        shift = -1 if self.rng.random() < 0.5 else 1
         new_idx = current_idx + shift
 
         if 0 <= new_idx < len(self.config.allowed_start_times):
             new_start = self.config.allowed_start_times[new_idx]
             
             # Check if new start time fits within the day
-            end_time = calculate_slot_end_time(new_start, gene.duration_minutes)
-            if time_to_minutes(end_time) <= day_end_minutes:
-                new_gene.update_time(gene.day, new_start)
+            if new_start in self._starts_fitting_day(gene.duration_minutes):
+                return gene.day, new_start
 
-        return new_gene
\ No newline at end of file
+        return None
@@ -10,14 +10,14 @@ Repair Strategy:
 """
 import random
 from typing import List, Set, Dict, Tuple
-from collections import defaultdict
 from dataclasses import dataclass, field
-from classsync_core.scheduler.chromosome import Chromosome, Gene
+from operator import attrgetter
+from classsync_core.scheduler.chromosome import MINUTES_PER_DAY, Chromosome, Gene
 from classsync_core.scheduler.config import GAConfig
-from classsync_core.utils import slots_overlap, calculate_slot_end_time, time_to_minutes
+from classsync_core.utils import calculate_slot_end_time, time_to_minutes
 
 
-@dataclass
+@dataclass(slots=True)
 class RepairStats:
     """Statistics for repair operation."""
     total_attempts: int = 0
@@ -44,6 +44,13 @@ class RepairMechanism:
     # Maximum total attempts across all repair passes
     MAX_TOTAL_ATTEMPTS = 500
 
+    # Gene field holding the resource for each conflict type
+    RESOURCE_GETTERS = {
+        'teacher': attrgetter('teacher_id'),
+        'room': attrgetter('room_id'),
+        'section': attrgetter('section_id'),
+    }
+
     def __init__(self, config: GAConfig, rooms_df):
         self.config = config
         self.rooms_df = rooms_df
@@ -59,6 +66,15 @@ class RepairMechanism:
 
         self.all_rooms = rooms_df['Room_Code'].tolist()
 
+        # Room pool per session type (indexed by int(is_lab)), falling back to all rooms
+        self.rooms_by_type = (self.theory_rooms or self.all_rooms, self.lab_rooms or self.all_rooms)
+
+        # Room code -> room ID lookup (avoids a DataFrame filter per assignment)
+        if 'Room_ID' in rooms_df.columns:
+            self.room_ids = dict(zip(rooms_df['Room_Code'].tolist(), rooms_df['Room_ID'].tolist()))
+        else:
+            self.room_ids = {code: hash(code) % 10000 for code in rooms_df['Room_Code']}
+
         # Pre-compute valid slots for faster lookup
         self._precompute_valid_slots()
 
@@ -116,6 +132,8 @@ class RepairMechanism:
 
     def _restore_all_locked_genes(self, chromosome: Chromosome):
         """Restore all locked genes to their fixed values."""
+        # Locked genes are never moved by mutation or repair, so restoring
+        # them leaves an evaluated chromosome's assignment unchanged
         for gene in chromosome.genes:
             if gene.is_locked:
                 gene.restore_lock()
@@ -153,7 +171,7 @@ class RepairMechanism:
             if gene.is_locked:
                 continue
 
-            if self.config.is_blocked(gene.day, gene.start_time, gene.end_time):
+            if self.config.is_blocked_minutes(gene.day, gene.start_minutes, gene.end_minutes):
                 # Try to find nearby valid slot
                 repaired = self._find_alternative_slot(gene, chromosome)
                 if not repaired:
@@ -171,6 +189,7 @@ class RepairMechanism:
                 # Find nearest allowed start time
                 nearest = self._find_nearest_start_time(gene.start_time)
                 gene.update_time(gene.day, nearest)
+                chromosome.reset_evaluation()
         return True
 
     def _repair_lab_contiguity(self, chromosome: Chromosome) -> bool:
@@ -183,8 +202,8 @@ class RepairMechanism:
             if gene.is_lab and gene.duration_minutes != 180:
                 # Force to 180 minutes
                 gene.duration_minutes = 180
-                gene.end_time = calculate_slot_end_time(gene.start_time, 180)
-                gene.duration_slots = 6
+                gene.update_time(gene.day, gene.start_time)
+                chromosome.reset_evaluation()
         return True
 
     def _repair_resource_conflicts(
@@ -297,30 +316,41 @@ class RepairMechanism:
         """
         conflicts = []
 
-        # Build schedule index
-        schedule = defaultdict(lambda: defaultdict(list))
+        # Build schedule index: one flat (resource, day) -> genes map
+        resource_of = self.RESOURCE_GETTERS.get(resource_type, self.RESOURCE_GETTERS['section'])
+        schedule = {}
 
         for gene in chromosome.genes:
-            if resource_type == 'teacher':
-                resource_id = gene.teacher_id
-            elif resource_type == 'room':
-                resource_id = gene.room_id
-            else:  # section
-                resource_id = gene.section_id
-
-            schedule[resource_id][gene.day].append(gene)
-
-        # Check each resource's schedule for overlaps
-        for resource_id, days in schedule.items():
-            for day, genes in days.items():
-                # Check all pairs
-                for i in range(len(genes)):
-                    for j in range(i + 1, len(genes)):
-                        if slots_overlap(
-                                genes[i].start_time, genes[i].end_time,
-                                genes[j].start_time, genes[j].end_time
-                        ):
-                            conflicts.append([genes[i], genes[j]])
+            key = (resource_of(gene), gene.day)
+            group = schedule.get(key)
+            if group is None:
+                schedule[key] = [gene]
+            else:
+                group.append(gene)
+
+        # Only resource-days holding two or more sessions can overlap
+        shared = [(key, genes) for key, genes in schedule.items() if len(genes) > 1]
+        if not shared:
+            return conflicts
+
+        # Visit groups resource by resource (in first-seen order), days in
+        # first-seen order within each, so conflicts come out in the same
+        # order as a per-resource, per-day walk
+        resource_rank = {}
+        for resource_id, _ in schedule:
+            resource_rank.setdefault(resource_id, len(resource_rank))
+        shared.sort(key=lambda item: resource_rank[item[0][0]])
+
+        # Check each resource's schedule for overlaps (integer minutes, no parsing)
+        for _, genes in shared:
+            # Check all pairs
+            for i in range(len(genes)):
+                first = genes[i]
+                for j in range(i + 1, len(genes)):
+                    second = genes[j]
+                    if (first.start_minutes < second.end_minutes
+                            and second.start_minutes < first.end_minutes):
+                        conflicts.append([first, second])
 
         return conflicts
 
@@ -347,10 +377,7 @@ class RepairMechanism:
         max_attempts = self.config.max_repair_attempts
 
         # Get available rooms
-        if gene.is_lab:
-            available_rooms = self.lab_rooms if self.lab_rooms else self.all_rooms
-        else:
-            available_rooms = self.theory_rooms if self.theory_rooms else self.all_rooms
+        available_rooms = self.rooms_by_type[int(gene.is_lab)]
 
         while attempts < max_attempts:
             attempts += 1
@@ -358,66 +385,30 @@ class RepairMechanism:
             # Random day and time
             new_day = random.choice(self.config.working_days)
             new_start = random.choice(self.config.allowed_start_times)
-            new_end = calculate_slot_end_time(new_start, gene.duration_minutes)
+            new_start_minutes = self.config.start_minutes(new_start)
+            # Same wrap-around as calculate_slot_end_time
+            new_end_minutes = (new_start_minutes + gene.duration_minutes) % MINUTES_PER_DAY
 
             # Check if blocked
-            if self.config.is_blocked(new_day, new_start, new_end):
+            if self.config.is_blocked_minutes(new_day, new_start_minutes, new_end_minutes):
                 continue
 
             # Try random room
             new_room_code = random.choice(available_rooms)
-            room_row = self.rooms_df[self.rooms_df['Room_Code'] == new_room_code].iloc[0]
-            new_room_id = room_row.get('Room_ID', hash(new_room_code) % 10000)
-
-            # Check if this creates conflicts
-            temp_gene = Gene(
-                session_key=gene.session_key,
-                course_id=gene.course_id,
-                course_code=gene.course_code,
-                course_name=gene.course_name,
-                section_id=gene.section_id,
-                section_code=gene.section_code,
-                teacher_id=gene.teacher_id,
-                teacher_name=gene.teacher_name,
-                duration_minutes=gene.duration_minutes,
-                is_lab=gene.is_lab,
-                session_number=gene.session_number,
-                day=new_day,
-                start_time=new_start,
-                room_id=new_room_id,
-                room_code=new_room_code
-            )
-
-            # Check for conflicts with other genes (excluding self)
+            new_room_id = self.room_ids[new_room_code]
+
+            # Check for teacher, room or section conflicts with other genes
+            # on the new day (excluding self)
             has_conflict = False
             for other_gene in chromosome.genes:
-                if other_gene.session_key == gene.session_key:
+                if other_gene.day != new_day or other_gene.session_key == gene.session_key:
                     continue
 
-                # Teacher conflict
-                if other_gene.teacher_id == temp_gene.teacher_id and other_gene.day == temp_gene.day:
-                    if slots_overlap(
-                            other_gene.start_time, other_gene.end_time,
-                            temp_gene.start_time, temp_gene.end_time
-                    ):
-                        has_conflict = True
-                        break
-
-                # Room conflict
-                if other_gene.room_id == temp_gene.room_id and other_gene.day == temp_gene.day:
-                    if slots_overlap(
-                            other_gene.start_time, other_gene.end_time,
-                            temp_gene.start_time, temp_gene.end_time
-                    ):
-                        has_conflict = True
-                        break
-
-                # Section conflict
-                if other_gene.section_id == temp_gene.section_id and other_gene.day == temp_gene.day:
-                    if slots_overlap(
-                            other_gene.start_time, other_gene.end_time,
-                            temp_gene.start_time, temp_gene.end_time
-                    ):
+                if (other_gene.teacher_id == gene.teacher_id
+                        or other_gene.room_id == new_room_id
+                        or other_gene.section_id == gene.section_id):
+                    if (other_gene.start_minutes < new_end_minutes
+                            and new_start_minutes < other_gene.end_minutes):
                         has_conflict = True
                         break
 
@@ -425,21 +416,20 @@ class RepairMechanism:
                 # Apply the new assignment
                 gene.update_time(new_day, new_start)
                 gene.update_room(new_room_id, new_room_code)
+                chromosome.reset_evaluation()
                 return True
 
         return False
 
     def _find_nearest_start_time(self, current_time: str) -> str:
         """Find nearest allowed start time."""
-        from classsync_core.utils import time_to_minutes
-
         current_minutes = time_to_minutes(current_time)
 
         min_diff = float('inf')
         nearest = self.config.allowed_start_times[0]
 
         for allowed_time in self.config.allowed_start_times:
-            allowed_minutes = time_to_minutes(allowed_time)
+            allowed_minutes = self.config.start_minutes(allowed_time)
             diff = abs(current_minutes - allowed_minutes)
 
             if diff < min_diff:
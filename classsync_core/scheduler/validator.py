@@ -137,15 +137,18 @@ class PreGAValidator:
                 if day and start and end:
                     self.room_blocked_slots[room_id].append((day, start, end))
 
-        # Session lookup: session_key -> session info
-        self.session_lookup = {}
-        for _, session in self.sessions_df.iterrows():
-            self.session_lookup[session['Session_Key']] = session.to_dict()
+        # Session lookup: session_key -> session info (plain dict rows, no Series per row)
+        self.session_lookup = dict(zip(
+            self.sessions_df['Session_Key'].tolist(),
+            self.sessions_df.to_dict('records')
+        )) if len(self.sessions_df) else {}
 
         # Room capacity lookup
-        self.room_capacities = {}
-        for _, room in self.rooms_df.iterrows():
-            self.room_capacities[room['Room_ID']] = room.get('Capacity', 50)
+        room_ids = self.rooms_df['Room_ID'].tolist() if len(self.rooms_df) else []
+        if 'Capacity' in self.rooms_df.columns:
+            self.room_capacities = dict(zip(room_ids, self.rooms_df['Capacity'].tolist()))
+        else:
+            self.room_capacities = dict.fromkeys(room_ids, 50)
 
     def validate(self) -> ValidationResult:
         """
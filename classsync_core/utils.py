@@ -3,9 +3,18 @@ Utility functions for timetable optimization.
 """
 
 from datetime import datetime, time, timedelta
+from functools import lru_cache
 from typing import List, Tuple, Set, Union
 
 
+# Weekday names in TimetableEntry.day_of_week order (0=Monday, 6=Sunday)
+WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+WEEKDAY_INDEX = {day: i for i, day in enumerate(WEEKDAYS)}
+
+
+# Time strings come from a small fixed set (slot starts/ends), so parsed
+# values are cached; time objects are immutable and safe to share
+@lru_cache(maxsize=1024)
 def parse_time(time_str: str) -> time:
     """Parse time string (HH:MM) to time object."""
     h, m = map(int, time_str.split(':'))
@@ -24,6 +33,13 @@ def minutes_to_time(minutes: int) -> time:
     return time((minutes // 60) % 24, minutes % 60)
 
 
+@lru_cache(maxsize=1440)
+def format_minutes(minutes: int) -> str:
+    """Format minutes since midnight as an HH:MM string (wrapping past midnight)."""
+    end = minutes_to_time(minutes)
+    return f"{end.hour:02d}:{end.minute:02d}"
+
+
 def slots_overlap(start1: str, end1: str, start2: str, end2: str) -> bool:
     """
     Check if two time slots overlap.
@@ -83,6 +99,7 @@ def find_consecutive_slots(
     return []
 
 
+@lru_cache(maxsize=4096)
 def calculate_slot_end_time(start_time: str, duration_minutes: int) -> str:
     """
     Calculate end time given start time and duration.
@@ -0,0 +1,13 @@
+"""
+Test configuration.
+
+classsync_core.models pulls in the API settings, which require DATABASE_URL;
+tests point it at a throwaway SQLite file.
+"""
+
+import os
+import tempfile
+
+os.environ.setdefault(
+    'DATABASE_URL', f"sqlite:///{os.path.join(tempfile.gettempdir(), 'classsync_test.db')}"
+)
@@ -0,0 +1,398 @@
+"""
+Tests for the scheduling core (population initialization, fitness, GA engine).
+"""
+
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from classsync_api.database import Base, SessionLocal, engine
+from classsync_core.exporters.json_exporter import JSONExporter
+from classsync_core.models import (
+    ConstraintConfig, Course, CourseType, Institution, Room, RoomType, Section, Teacher, TimetableEntry
+)
+from classsync_core.optimizer import TimetableOptimizer
+from classsync_core.scheduler.chromosome import Gene
+from classsync_core.scheduler.config import GAConfig
+from classsync_core.scheduler.fitness_evaluator import FitnessEvaluator
+from classsync_core.scheduler.ga_engine import GAEngine
+from classsync_core.scheduler.initializer import PopulationInitializer
+
+
+def make_sessions(n_sessions: int, n_teachers: int = 1, n_sections: int = 1,
+                  lab_every: int = 0) -> pd.DataFrame:
+    """Build a sessions frame with the columns the scheduler reads."""
+    rows = []
+    for i in range(n_sessions):
+        is_lab = bool(lab_every) and i % lab_every == 0
+        course = i // 2
+        section = i % n_sections
+        teacher = i % n_teachers
+        rows.append({
+            'Session_Key': f"C{course}-S{section}-{'L' if is_lab else 'T'}-{i}",
+            'Course_ID': course,
+            'Course_Code': f"C{course}",
+            'Course_Name': f"Course {course}",
+            'Section_ID': section,
+            'Section_Code': f"S{section}",
+            'Teacher_ID': teacher,
+            'Instructor': f"Teacher {teacher}",
+            'Duration_Minutes': 180 if is_lab else 90,
+            'Is_Lab': is_lab,
+            'Session_Number': i,
+        })
+    return pd.DataFrame(rows)
+
+
+def make_rooms(n_rooms: int = 1, n_labs: int = 0) -> pd.DataFrame:
+    """Build a rooms frame with theory rooms followed by labs."""
+    rows = [
+        {'Room_ID': i + 1, 'Room_Code': f"SB {i:03d}", 'Room_Type': 'Lecture Hall', 'Capacity': 50}
+        for i in range(n_rooms)
+    ]
+    rows += [
+        {'Room_ID': n_rooms + i + 1, 'Room_Code': f"LB {i:03d}", 'Room_Type': 'Lab', 'Capacity': 30}
+        for i in range(n_labs)
+    ]
+    return pd.DataFrame(rows)
+
+
+def test_heuristic_chromosome_places_every_session_when_instance_is_overfull():
+    # 60 sessions for one teacher and one room cannot all fit, so most of them
+    # take the random fallback placement
+    sessions = make_sessions(60)
+    initializer = PopulationInitializer(
+        GAConfig(), sessions, make_rooms(), rng=np.random.default_rng(0)
+    )
+
+    chromosome = initializer._create_heuristic_chromosome()
+
+    assert len(chromosome.genes) == len(sessions)
+    assert [gene.session_key for gene in chromosome.genes] == sessions['Session_Key'].tolist()
+    for gene in chromosome.genes:
+        assert gene.day in initializer.config.working_days
+        assert gene.room_code == 'SB 000'
+        assert gene.end_minutes - gene.start_minutes == gene.duration_minutes
+
+
+def all_days_off(teacher_id: int = 0) -> list:
+    """Hard day-off constraints covering every working day of a teacher."""
+    return [{
+        'teacher_id': teacher_id,
+        'constraint_type': 'day_off',
+        'days': list(GAConfig().working_days),
+        'is_hard': True,
+    }]
+
+
+def test_hard_cutoff_truncates_counts_but_full_evaluation_does_not():
+    config = GAConfig()
+    rooms = make_rooms()
+    initializer = PopulationInitializer(config, make_sessions(60), rooms, rng=np.random.default_rng(1))
+    chromosome = initializer._create_heuristic_chromosome()
+    evaluator = FitnessEvaluator(config, rooms, teacher_constraints=all_days_off())
+
+    evaluator.evaluate(chromosome)
+    full = dict(chromosome.hard_violations)
+    # Overlap checks run before the day-off check and already exceed the cutoff
+    evaluator.evaluate(chromosome, hard_cutoff=0)
+    cut = dict(chromosome.hard_violations)
+
+    assert full['teacher_day_offs'] == 60
+    assert cut['teacher_day_offs'] == 0
+    assert sum(cut.values()) < sum(full.values())
+    assert chromosome.fitness == 0.0 and not chromosome.is_feasible
+
+
+def test_ga_reports_full_violation_counts_for_infeasible_result():
+    config = GAConfig(parallel_fitness_evaluation=False, fitness_hard_cutoff=0)
+    sessions = make_sessions(60)
+    rooms = make_rooms()
+    constraints = all_days_off()
+    engine = GAEngine(config, sessions, rooms, teacher_constraints=constraints, random_seed=3)
+
+    result = engine.run(population_size=6, generations=3)
+
+    best = result['best_chromosome']
+    assert not result['is_feasible']
+    assert result['hard_violations']['teacher_day_offs'] == len(sessions)
+    assert best.conflict_details
+
+    reference = best.copy()
+    FitnessEvaluator(config, rooms, teacher_constraints=constraints).evaluate(reference)
+    assert result['hard_violations'] == reference.hard_violations
+
+
+def make_constraint_config(config_id: int, institution_id: int = 1) -> ConstraintConfig:
+    """Detached ConstraintConfig row, as loaded for an optimization request."""
+    return ConstraintConfig(
+        id=config_id, institution_id=institution_id, name='default',
+        timeslot_duration_minutes=90, start_time='08:00', end_time='18:30',
+        max_optimization_time_seconds=20, min_acceptable_score=85,
+        updated_at=datetime(2024, 1, 1)
+    )
+
+
+def test_optimizer_ga_config_cache_is_bounded_and_returns_copies():
+    TimetableOptimizer.invalidate_caches()
+    try:
+        first = TimetableOptimizer(make_constraint_config(1))
+        first.ga_config.population_size = 3
+        first.ga_config.working_days = ['Monday']
+
+        second = TimetableOptimizer(make_constraint_config(1))
+        assert second.ga_config is not first.ga_config
+        assert second.ga_config.population_size == GAConfig().population_size
+        assert len(second.ga_config.working_days) == 5
+
+        # In-place edits of container fields stay on the returned copy
+        second.ga_config.working_days.remove('Friday')
+        second.ga_config.allowed_start_times.append('19:00')
+        second.ga_config.blocked_windows.setdefault('Wednesday', []).append(('08:00', '09:30'))
+        cached = TimetableOptimizer._ga_config_cache[1][2]
+        assert len(cached.working_days) == 5
+        assert '19:00' not in cached.allowed_start_times
+        assert 'Wednesday' not in cached.blocked_windows
+        assert 'Wednesday' not in cached._blocked_masks
+        third = TimetableOptimizer(make_constraint_config(1))
+        assert third.ga_config.working_days == cached.working_days
+        assert third.ga_config.blocked_windows == cached.blocked_windows
+
+        for config_id in range(2, TimetableOptimizer.CACHE_SIZE + 5):
+            TimetableOptimizer(make_constraint_config(config_id, institution_id=2))
+        assert len(TimetableOptimizer._ga_config_cache) == TimetableOptimizer.CACHE_SIZE
+        assert 1 not in TimetableOptimizer._ga_config_cache
+
+        TimetableOptimizer.invalidate_caches(institution_id=2)
+        assert not TimetableOptimizer._ga_config_cache
+    finally:
+        TimetableOptimizer.invalidate_caches()
+
+
+def test_gene_copy_carries_every_field():
+    gene = Gene(
+        session_key='C1-S0-L-1', course_id=1, course_code='C1', course_name='Course 1',
+        section_id=2, section_code='S0', teacher_id=3, teacher_name='Teacher 3',
+        duration_minutes=180, is_lab=True, session_number=1, session_uid=7,
+        day='Tuesday', start_time='09:30', room_id=4, room_code='LB 000',
+        is_locked=True, lock_type='full_lock', locked_day='Tuesday',
+        locked_start_time='09:30', locked_room_id=4
+    )
+
+    clone = gene.__copy__()
+
+    assert clone is not gene
+    for name in Gene.__slots__:
+        assert getattr(clone, name) == getattr(gene, name), name
+    assert clone.end_time == '12:30'
+
+    clone.update_time('Friday', '14:00')
+    assert (gene.day, gene.start_time, gene.end_minutes) == ('Tuesday', '09:30', 12 * 60 + 30)
+
+
+def test_pool_evaluation_matches_serial_evaluation(monkeypatch):
+    # The pool is only started with at least two usable CPUs
+    monkeypatch.setattr(os, 'cpu_count', lambda: 2)
+    sessions = make_sessions(24, n_teachers=4, n_sections=3, lab_every=6)
+    rooms = make_rooms(3, n_labs=1)
+
+    results = {}
+    for parallel in (False, True):
+        # Unreachable target fitness, so every generation runs
+        config = GAConfig(parallel_fitness_evaluation=parallel, min_acceptable_fitness=float('inf'))
+        engine = GAEngine(config, sessions, rooms, random_seed=11, num_workers=2)
+        result = engine.run(population_size=10, generations=5)
+        assert engine._pool_workers == (2 if parallel else 0)
+        results[parallel] = result
+
+    serial, pooled = results[False], results[True]
+    assert pooled['best_fitness'] == serial['best_fitness']
+    assert pooled['hard_violations'] == serial['hard_violations']
+    assert pooled['statistics']['best_fitness_history'] == serial['statistics']['best_fitness_history']
+    assert pooled['statistics']['avg_fitness_history'] == serial['statistics']['avg_fitness_history']
+    assert len(serial['statistics']['best_fitness_history']) == 5
+
+
+def test_unknown_day_is_an_invalid_slot_and_leaves_day_index_alone():
+    config = GAConfig()
+    rooms = make_rooms(2)
+    initializer = PopulationInitializer(config, make_sessions(4), rooms, rng=np.random.default_rng(2))
+    chromosome = initializer._create_heuristic_chromosome()
+    evaluator = FitnessEvaluator(config, rooms)
+    day_index = dict(evaluator.day_index)
+
+    evaluator.evaluate(chromosome)
+    assert chromosome.is_feasible
+
+    # Same teacher and section at the same time, but on a day outside the week
+    for gene in chromosome.genes[:2]:
+        gene.update_time('Saturday', '08:00')
+    chromosome.reset_evaluation()
+    evaluator.evaluate(chromosome)
+
+    assert not chromosome.is_feasible
+    assert chromosome.hard_violations['invalid_time_slots'] == 2
+    assert chromosome.hard_violations['teacher_overlap'] == 0
+    assert sum(detail.startswith('Invalid day:') for detail in chromosome.conflict_details) == 2
+    assert evaluator.day_index == day_index
+
+
+def test_island_run_keeps_island_sizes_and_best_fitness(monkeypatch):
+    config = GAConfig(
+        num_islands=3, migration_interval=2, migration_size=2,
+        min_acceptable_fitness=float('inf'), max_stagnant_generations=100
+    )
+    sessions = make_sessions(24, n_teachers=4, n_sections=3, lab_every=6)
+    engine = GAEngine(config, sessions, make_rooms(3, n_labs=1), random_seed=5)
+
+    migrations = []
+    migrate = engine._migrate
+
+    def checked_migrate(islands):
+        sizes = [len(island) for island in islands]
+        bests = [max(c.fitness for c in island) for island in islands]
+        emigrant_fitness = [sorted((c.fitness for c in island), reverse=True)[:2] for island in islands]
+        migrate(islands)
+        assert [len(island) for island in islands] == sizes
+        for i, island in enumerate(islands):
+            fitness = [c.fitness for c in island]
+            assert max(fitness) >= bests[i]
+            for value in emigrant_fitness[i - 1]:
+                assert value in fitness
+        migrations.append(sizes)
+
+    monkeypatch.setattr(engine, '_migrate', checked_migrate)
+    result = engine.run_islands(population_size=14, generations=8)
+
+    assert migrations == [[5, 5, 4]] * 4
+    statistics = result['statistics']
+    assert statistics['final_population_size'] == 14
+    history = statistics['best_fitness_history']
+    assert len(history) == 8
+    assert all(later >= earlier for earlier, later in zip(history, history[1:]))
+    assert result['best_fitness'] == history[-1]
+    assert len(result['best_chromosome'].genes) == len(sessions)
+
+
+@pytest.fixture
+def db():
+    """Session on freshly created tables, dropped again afterwards."""
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(engine)
+        TimetableOptimizer.invalidate_caches()
+
+
+def seed_institution(db, commit: bool = True) -> tuple:
+    """
+    Store a small institution: 3 teachers, 2 lecture halls, 1 lab and six
+    single-section courses (course 0 is a lab), 11 sessions in all.
+
+    Returns:
+        (institution, teachers, rooms, constraint_config)
+    """
+    institution = Institution(name='University', code='U')
+    db.add(institution)
+    db.flush()
+    teachers = [Teacher(institution_id=institution.id, code=f"T{i}", name=f"Teacher {i}") for i in range(3)]
+    rooms = [
+        Room(institution_id=institution.id, code=f"SB {i:03d}", room_type=RoomType.LECTURE_HALL, capacity=50)
+        for i in range(2)
+    ]
+    rooms.append(Room(institution_id=institution.id, code='LB 000', room_type=RoomType.LAB, capacity=30))
+    db.add_all(teachers + rooms)
+    db.flush()
+    for c in range(6):
+        lab = c == 0
+        course = Course(
+            institution_id=institution.id, teacher_id=teachers[c % 3].id, code=f"C{c}",
+            name=f"Course {c}" + (' Lab' if lab else ''), credit_hours=3,
+            course_type=CourseType.LAB if lab else CourseType.LECTURE
+        )
+        db.add(course)
+        db.flush()
+        db.add(Section(institution_id=institution.id, course_id=course.id, code='S0'))
+    constraint_config = ConstraintConfig(
+        institution_id=institution.id, name='default', timeslot_duration_minutes=90,
+        start_time='08:00', end_time='18:30', max_optimization_time_seconds=20, min_acceptable_score=99
+    )
+    db.add(constraint_config)
+    if commit:
+        db.commit()
+    else:
+        db.flush()
+    return institution, teachers, rooms, constraint_config
+
+
+def test_seeded_generation_reports_an_infeasible_timetable(db):
+    institution, teachers, _, constraint_config = seed_institution(db)
+
+    # Teacher 0 (one lab and two lectures) is off every working day
+    day_offs = [{
+        'teacher_id': teachers[0].id,
+        'constraint_type': 'day_off',
+        'days': list(GAConfig().working_days),
+        'is_hard': True,
+    }]
+
+    results = [
+        TimetableOptimizer(constraint_config).generate_timetable(
+            db, institution.id, population_size=10, generations=5,
+            random_seed=7, teacher_constraints=day_offs
+        )
+        for _ in range(2)
+    ]
+
+    first, second = results
+    assert first['fitness_score'] == second['fitness_score'] == 0.0
+    assert not first['is_feasible']
+    assert first['hard_violations'] == second['hard_violations']
+    assert first['hard_violations']['teacher_day_offs'] == 3
+    assert first['sessions_scheduled'] == first['sessions_total'] == 11
+
+    violated = [c for c in first['explanation']['hard_constraints'] if c['status'] == 'violated']
+    assert violated == [{'constraint': 'teacher_day_offs', 'violations': 3, 'status': 'violated'}]
+    assert all(detail.startswith('Teacher day-off violation') for detail in first['explanation']['conflict_details'])
+
+    saved = db.query(TimetableEntry).filter(TimetableEntry.timetable_id == first['timetable_id']).count()
+    assert saved == 11
+
+
+def test_flat_json_export_keeps_public_columns(db, tmp_path):
+    institution, _, _, constraint_config = seed_institution(db)
+    result = TimetableOptimizer(constraint_config).generate_timetable(
+        db, institution.id, population_size=6, generations=2, random_seed=1
+    )
+
+    path = JSONExporter(db).export(result['timetable_id'], str(tmp_path / 'timetable.json'), format='flat')
+
+    with open(path, encoding='utf-8') as f:
+        entries = json.load(f)
+    assert len(entries) == 11
+    assert all('Day_Index' not in entry for entry in entries)
+    assert {entry['Weekday'] for entry in entries} <= set(GAConfig().working_days)
+
+
+def test_input_frames_see_flushed_but_uncommitted_rows(db):
+    institution, _, _, constraint_config = seed_institution(db, commit=False)
+    optimizer = TimetableOptimizer(constraint_config)
+
+    sessions_df, rooms_df = optimizer._load_input_data(db, institution.id)
+
+    assert len(sessions_df) == 11
+    assert sorted(rooms_df['Room_Code']) == ['LB 000', 'SB 000', 'SB 001']
+    # Rows that may still be rolled back are never cached
+    assert institution.id not in TimetableOptimizer._input_cache
+
+    db.commit()
+    _, rooms_df = optimizer._load_input_data(db, institution.id)
+    assert len(rooms_df) == 3
+    assert institution.id in TimetableOptimizer._input_cache